@@ -0,0 +1,55 @@
+"""Benchmark da conversão e soma de valores de planilha com o `Decimal` comparado à implementação anterior
+- Executar `python benchmarks/estruturas_decimal.py [quantidade]`"""
+
+# std
+import sys, random, decimal, functools
+# interno
+import bot
+from bot.estruturas import Decimal
+
+def converter_anterior (valor: str, precisao: int, separador_decimal: str) -> decimal.Decimal:
+    """Implementação anterior do `Decimal.__init__` para comparação"""
+    parte_inteiro, _, parte_decimal = valor.lower().partition(separador_decimal)
+    inteiro = "".join(p for p in parte_inteiro if p.isdigit() or p in "+-")
+    decimal_ou_exponencial = "".join(p for p in parte_decimal if p.isdigit() or p in "+-e")
+    exponent = decimal.Decimal(".".ljust(precisao + 1, "0"))
+    valor = inteiro if not decimal_ou_exponencial else f"{inteiro}.{decimal_ou_exponencial}"
+    try: return decimal.Decimal(valor).quantize(exponent, decimal.ROUND_FLOOR)
+    except Exception: return decimal.Decimal("NaN")
+
+def somar_anterior (valores: list[str]) -> str:
+    """Conversão e soma com o `Decimal` criado e quantizado a cada operação"""
+    exponent = decimal.Decimal(".00")
+    decimais = [converter_anterior(valor, 2, ",") for valor in valores]
+    total = functools.reduce(
+        lambda total, atual: (total + atual).quantize(decimal.Decimal(".".ljust(3, "0")), decimal.ROUND_FLOOR),
+        decimais
+    )
+    return str(total.quantize(exponent)).replace(".", ",")
+
+def criar_valores (quantidade: int) -> list[str]:
+    """Valores monetários de planilha, majoritariamente limpos e alguns formatados"""
+    aleatorio = random.Random(0)
+    return [
+        f"{aleatorio.randrange(-10 ** 6, 10 ** 6)},{aleatorio.randrange(100):02}"
+        if aleatorio.random() < 0.9 else
+        f"R$ {aleatorio.randrange(10 ** 6):_},{aleatorio.randrange(100):02}".replace("_", ".")
+        for _ in range(quantidade)
+    ]
+
+if __name__ == "__main__":
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    valores = criar_valores(quantidade)
+
+    cronometro = bot.tempo.Cronometro(6)
+    total_anterior = somar_anterior(valores)
+    anterior = quantidade / cronometro()
+
+    cronometro = bot.tempo.Cronometro(6)
+    total_atual = str(Decimal.somar(valores, separador_decimal=","))
+    atual = quantidade / cronometro()
+    assert total_anterior == total_atual, "Soma do Decimal diferente da implementação anterior"
+
+    print(f"Valores: {quantidade}")
+    print(f"Anterior:        {anterior:,.0f} valores/s")
+    print(f"Decimal.somar(): {atual:,.0f} valores/s ({atual / anterior:.2f}x)")
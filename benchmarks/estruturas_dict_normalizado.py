@@ -0,0 +1,59 @@
+"""Benchmark dos acessos ao `DictNormalizado` comparado à implementação anterior do `String.normalizar()`
+- Executar `python benchmarks/estruturas_dict_normalizado.py [repeticoes]`"""
+
+# std
+import re, sys, unicodedata
+# interno
+import bot
+from bot.estruturas import DictNormalizado
+
+def normalizar_anterior (texto: str) -> str:
+    """Implementação anterior do `String.normalizar()` para comparação"""
+    texto = texto.strip().lower()
+    texto = unicodedata.normalize("NFKD", texto).encode("ASCII", "ignore").decode("utf-8", "ignore")
+    texto = re.sub(r"\s+", "_", texto)
+    texto = re.sub(r"\W", "", texto)
+    return re.sub(r"_+", "_", texto)
+
+class DictNormalizadoAnterior[T] (DictNormalizado[T]):
+    """`DictNormalizado` com a normalização anterior, sem cache"""
+
+    def __getitem__ (self, chave: str) -> T:
+        return self.data[normalizar_anterior(chave)]
+
+    def __setitem__ (self, chave: str, valor: T) -> None:
+        self.data[normalizar_anterior(chave)] = valor
+
+    def __delitem__ (self, chave: str) -> None:
+        del self.data[normalizar_anterior(chave)]
+
+    def __contains__ (self, chave: object) -> bool:
+        return isinstance(chave, str) and normalizar_anterior(chave) in self.data
+
+HEADERS = {
+    "Content-Type": "application/json", "Content-Length": "128", "Cache-Control": "no-cache",
+    "Set-Cookie": "sessao=abc", "X-Request-Id": "123", "Última Atualização": "2024-01-01",
+    "Date": "Mon, 01 Jan 2024", "Server": "nginx", "Connection": "keep-alive", "ETag": "\"xpto\"",
+}
+
+def medir (classe: type[DictNormalizado[str]], repeticoes: int) -> tuple[float, dict[str, str]]:
+    """Padrão de acesso dos headers e configfile: construção, `in`, leitura e escrita"""
+    cronometro, acessos = bot.tempo.Cronometro(6), 0
+    for _ in range(repeticoes):
+        dicionario = classe(HEADERS)
+        for chave in HEADERS:
+            if chave in dicionario: dicionario[chave]
+            dicionario[chave.upper()] = dicionario[chave.lower()]
+            acessos += 4
+        acessos += len(HEADERS)
+    return acessos / cronometro(), dict(dicionario.data)
+
+if __name__ == "__main__":
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    anterior, dados_anterior = medir(DictNormalizadoAnterior, repeticoes)
+    atual, dados_atual = medir(DictNormalizado, repeticoes)
+    assert dados_anterior == dados_atual, "Chaves do DictNormalizado diferentes da implementação anterior"
+
+    print(f"Repetições: {repeticoes}")
+    print(f"Anterior: {anterior:,.0f} acessos/s")
+    print(f"Atual:    {atual:,.0f} acessos/s ({atual / anterior:.2f}x)")
@@ -0,0 +1,72 @@
+"""Benchmark do `HeapPriorityQueue` comparado ao `PriorityQueue` com `bisect.insort`
+- Verificado também que remoções em apenas uma ponta não acumulam entradas inativas nos heaps
+- Executar `python benchmarks/estruturas_priority_queue.py [quantidade]`"""
+
+# std
+import sys, random
+# interno
+import bot
+from bot.estruturas import PriorityQueue, HeapPriorityQueue, PriorityQueueBloqueante
+
+def medir (fila: PriorityQueue[tuple[int, int]] | HeapPriorityQueue[tuple[int, int]],
+           operacoes: list[tuple[str, tuple[int, int]]]) -> tuple[float, list[tuple[int, int]]]:
+    """Executar as `operacoes` na `fila` e retornar as operações/segundo e os elementos obtidos"""
+    cronometro, obtidos = bot.tempo.Cronometro(6), list[tuple[int, int]]()
+    for operacao, elemento in operacoes:
+        if operacao == "add": fila.add(elemento)
+        elif operacao == "low": obtidos.append(fila.poll_low())
+        else: obtidos.append(fila.poll_high())
+    return len(operacoes) / cronometro(), obtidos
+
+def criar_operacoes (quantidade: int) -> list[tuple[str, tuple[int, int]]]:
+    """Inserções com prioridades repetidas e remoções intercaladas nas duas pontas"""
+    aleatorio, operacoes, tamanho = random.Random(0), list[tuple[str, tuple[int, int]]](), 0
+    for i in range(quantidade):
+        if tamanho and aleatorio.random() < 0.3:
+            operacoes.append((aleatorio.choice(("low", "high")), (0, 0)))
+            tamanho -= 1
+        else:
+            operacoes.append(("add", (aleatorio.randrange(quantidade // 10 or 1), i)))
+            tamanho += 1
+    return operacoes
+
+def entradas_heaps (fila: HeapPriorityQueue) -> int:
+    """Maior quantidade de entradas, ativas e inativas, entre os heaps de mínimo e máximo da `fila`"""
+    return max(len(fila._HeapPriorityQueue__minimo), len(fila._HeapPriorityQueue__maximo)) # type: ignore
+
+def verificar_remocao_uma_ponta (quantidade: int) -> None:
+    """Regressão: a remoção tardia em apenas uma ponta deve manter os heaps proporcionais aos elementos ativos"""
+    fila = HeapPriorityQueue[int]()
+    for i in range(quantidade):
+        fila.add(i)
+        fila.poll_low()
+    assert fila.empty() and entradas_heaps(fila) <= 32, f"Entradas inativas acumuladas no poll_low: {entradas_heaps(fila)}"
+
+    for descarte, sinal in (("low", 1), ("high", -1)):
+        fila = HeapPriorityQueue[int](tamanho=10, descarte=descarte)
+        for i in range(quantidade): fila.add(i * sinal)
+        assert len(fila) == 10 and entradas_heaps(fila) <= 2 * 10 + 32, \
+            f"Entradas inativas acumuladas no descarte '{descarte}': {entradas_heaps(fila)}"
+
+    # `get` remove sempre da mesma ponta do heap interno
+    for maior_primeiro in (False, True):
+        bloqueante = PriorityQueueBloqueante[int](maior_primeiro=maior_primeiro)
+        for i in range(quantidade):
+            bloqueante.put(i)
+            bloqueante.get()
+        heap = bloqueante._PriorityQueueBloqueante__heap # type: ignore
+        assert entradas_heaps(heap) <= 32, f"Entradas inativas acumuladas no PriorityQueueBloqueante: {entradas_heaps(heap)}"
+
+if __name__ == "__main__":
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    operacoes = criar_operacoes(quantidade)
+    comparador = lambda item: item[0]
+
+    anterior, obtidos_anterior = medir(PriorityQueue(comparador=comparador), operacoes)
+    atual, obtidos_atual = medir(HeapPriorityQueue(comparador=comparador), operacoes)
+    assert obtidos_anterior == obtidos_atual, "Ordem do HeapPriorityQueue diferente do PriorityQueue"
+    verificar_remocao_uma_ponta(quantidade)
+
+    print(f"Operações: {quantidade}")
+    print(f"PriorityQueue:     {anterior:,.0f} operações/s")
+    print(f"HeapPriorityQueue: {atual:,.0f} operações/s ({atual / anterior:.2f}x)")
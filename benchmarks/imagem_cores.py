@@ -0,0 +1,55 @@
+"""Benchmark do `Imagem.cores` vetorizado comparado à implementação anterior com `collections.Counter`
+- Captura de tela sintética `1920x1080` com poucas cores dominantes e ruído
+- Executar `python benchmarks/imagem_cores.py [limite]`"""
+
+# std
+import sys, collections
+# interno
+import bot
+from bot.imagem import Imagem
+# externo
+import numpy as np
+
+def cores_anterior (imagem: Imagem, limite: int | None) -> list[tuple[bot.tipagem.rgb, int]]:
+    """Implementação anterior do `Imagem.cores` para comparação"""
+    cinza = len(imagem.pixels.shape) == 2
+    pixels = imagem.pixels.flat if cinza else imagem.pixels.reshape(-1, 3)
+    to_rgb = lambda bgr: (int(bgr), int(bgr), int(bgr)) if cinza else (int(bgr[2]), int(bgr[1]), int(bgr[0]))
+    return collections.Counter(map(to_rgb, pixels)).most_common(limite)
+
+def criar_imagem () -> Imagem:
+    """Tela com fundo, faixas de cores sólidas e 10% de pixels com ruído"""
+    aleatorio = np.random.default_rng(0)
+    pixels = np.full((1080, 1920, 3), 243, np.uint8)
+    for indice, cor in enumerate(aleatorio.integers(0, 255, (12, 3), dtype=np.uint8)):
+        pixels[indice * 80 : indice * 80 + 40, :] = cor
+    ruido = aleatorio.random((1080, 1920)) < 0.1
+    pixels[ruido] = aleatorio.integers(0, 255, (int(ruido.sum()), 3), dtype=np.uint8)
+
+    imagem = object.__new__(Imagem)
+    imagem.pixels = pixels
+    return imagem
+
+if __name__ == "__main__":
+    limite = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    imagem = criar_imagem()
+
+    cronometro = bot.tempo.Cronometro(6)
+    anterior = cores_anterior(imagem, limite)
+    segundos_anterior = cronometro()
+
+    cronometro = bot.tempo.Cronometro(6)
+    atual = imagem.cores(limite)
+    segundos_atual = cronometro()
+    assert anterior == atual, "Cores diferentes da implementação anterior"
+
+    cronometro = bot.tempo.Cronometro(6)
+    amostra = imagem.cores(limite, amostragem=100_000)
+    segundos_amostra = cronometro()
+
+    print(f"Imagem {imagem!r} | limite={limite}")
+    print(f"Anterior:                     {segundos_anterior:.3f}s")
+    print(f"cores():                      {segundos_atual:.3f}s ({segundos_anterior / segundos_atual:.2f}x)")
+    exatas = dict(imagem.cores(None))
+    erro = max(abs(frequencia - exatas[cor]) / exatas[cor] for cor, frequencia in amostra)
+    print(f"cores(amostragem=100_000):    {segundos_amostra:.3f}s ({segundos_anterior / segundos_amostra:.2f}x) erro máximo da frequência={erro:.2%}")
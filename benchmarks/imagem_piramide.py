@@ -0,0 +1,85 @@
+"""Benchmark da procura de imagem grossa-para-fina pela pirâmide comparada à resolução completa
+- Capturas de tela sintéticas `1920x1080` com botões, textos e o template em posições aleatórias
+- Comparado também a procura em múltiplas escalas com o template renderizado em outro zoom
+- Executar `python benchmarks/imagem_piramide.py [quantidade_telas] [niveis_piramide]`"""
+
+# std
+import sys
+# interno
+import bot
+from bot.estruturas import Coordenada
+from bot.imagem import Imagem
+# externo
+import cv2, numpy as np
+
+def criar_template (escala: float = 1.0) -> np.ndarray:
+    """Ícone `64x40` com borda, símbolo e texto, renderizado na `escala`"""
+    largura, altura = round(64 * escala), round(40 * escala)
+    template = np.full((altura, largura, 3), (230, 180, 60), np.uint8)
+    cv2.rectangle(template, (1, 1), (largura - 2, altura - 2), (90, 60, 20), max(1, round(2 * escala)))
+    cv2.circle(template, (round(14 * escala), altura // 2), round(8 * escala), (255, 255, 255), -1)
+    cv2.putText(template, "OK", (round(28 * escala), round(27 * escala)), cv2.FONT_HERSHEY_SIMPLEX,
+                0.6 * escala, (255, 255, 255), max(1, round(2 * escala)), cv2.LINE_AA)
+    return template
+
+def criar_tela (aleatorio: np.random.Generator, template: np.ndarray, quantidade: int) -> tuple[np.ndarray, list[Coordenada]]:
+    """Captura de tela sintética com botões, textos e o `template` inserido `quantidade` vezes"""
+    tela = np.full((1080, 1920, 3), 243, np.uint8)
+    for _ in range(250):
+        x, y = int(aleatorio.integers(0, 1800)), int(aleatorio.integers(0, 1040))
+        cor = tuple(int(c) for c in aleatorio.integers(0, 255, 3))
+        cv2.rectangle(tela, (x, y), (x + int(aleatorio.integers(30, 160)), y + int(aleatorio.integers(16, 40))), cor, -1)
+        cv2.putText(tela, f"Item {aleatorio.integers(1000)}", (x + 4, y + 14), cv2.FONT_HERSHEY_SIMPLEX, 0.4, (20, 20, 20), 1)
+
+    posicoes = list[Coordenada]()
+    altura, largura = template.shape[:2]
+    while len(posicoes) < quantidade:
+        coordenada = Coordenada(int(aleatorio.integers(0, 1920 - largura)), int(aleatorio.integers(0, 1080 - altura)), largura, altura)
+        if any(coordenada.to_box()[0] < p.to_box()[2] + 2 and p.x < coordenada.to_box()[2] + 2 and
+               coordenada.y < p.to_box()[3] + 2 and p.y < coordenada.to_box()[3] + 2 for p in posicoes): continue
+        tela[coordenada.y : coordenada.y + altura, coordenada.x : coordenada.x + largura] = template
+        posicoes.append(coordenada)
+
+    return tela, posicoes
+
+def imagem (pixels: np.ndarray) -> Imagem:
+    """Criar a `Imagem` a partir dos `pixels`"""
+    resultado = object.__new__(Imagem)
+    resultado.pixels = pixels
+    return resultado
+
+def executar (template: Imagem, telas: list[tuple[np.ndarray, list[Coordenada]]], **kwargs) -> tuple[float, float]:
+    """Executar a procura em todas as `telas` e retornar `(segundos por tela, recall)`
+    - Posição encontrada caso o centro de uma coordenada esteja dentro da posição inserida"""
+    encontrados = total = 0
+    cronometro = bot.tempo.Cronometro(6)
+    resultados = [template.procurar_imagens(0.9, referencia=imagem(tela), **kwargs) for tela, _ in telas]
+    segundos = cronometro() / len(telas)
+
+    for coordenadas, (_, posicoes) in zip(resultados, telas):
+        total += len(posicoes)
+        encontrados += sum(1 for posicao in posicoes if any(c in posicao for c in coordenadas))
+    return segundos, encontrados / total
+
+if __name__ == "__main__":
+    quantidade_telas = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    niveis = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    aleatorio = np.random.default_rng(0)
+    template = imagem(criar_template())
+
+    telas = [criar_tela(aleatorio, template.pixels, 5) for _ in range(quantidade_telas)]
+    completo, recall_completo = executar(template, telas)
+    piramide, recall_piramide = executar(template, telas, niveis_piramide=niveis)
+    print(f"Telas: {quantidade_telas} | Template {template!r}")
+    print(f"Resolução completa: {completo * 1000:.1f}ms/tela recall={recall_completo:.2%}")
+    print(f"Pirâmide nível {niveis}:   {piramide * 1000:.1f}ms/tela recall={recall_piramide:.2%} ({completo / piramide:.2f}x)")
+
+    telas = [criar_tela(aleatorio, criar_template(1.25), 5) for _ in range(quantidade_telas)]
+    escalas = (0.8, 1.0, 1.25)
+    _, recall_unica = executar(template, telas)
+    multi, recall_multi = executar(template, telas, escalas=escalas)
+    multi_piramide, recall_multi_piramide = executar(template, telas, escalas=escalas, niveis_piramide=niveis)
+    print(f"Template renderizado com zoom de 125% | Escalas {escalas}")
+    print(f"Escala única:         recall={recall_unica:.2%}")
+    print(f"Escalas:              {multi * 1000:.1f}ms/tela recall={recall_multi:.2%}")
+    print(f"Escalas com pirâmide: {multi_piramide * 1000:.1f}ms/tela recall={recall_multi_piramide:.2%} ({multi / multi_piramide:.2f}x)")
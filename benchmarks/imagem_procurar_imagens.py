@@ -0,0 +1,62 @@
+"""Benchmark do `Imagem.procurar_imagens` com supressão de não máximos vetorizada comparado à implementação anterior
+- Referência sintética `1920x1080` com o template repetido e confiança baixa para gerar muitos candidatos
+- Executar `python benchmarks/imagem_procurar_imagens.py [confianca]`"""
+
+# std
+import sys
+# interno
+import bot
+from bot.estruturas import Coordenada, PriorityQueue
+from bot.imagem import Imagem
+# externo
+import cv2, numpy as np
+
+def procurar_anterior (template: np.ndarray, referencia: np.ndarray, confianca: float) -> list[Coordenada]:
+    """Implementação anterior do `Imagem.procurar_imagens` para comparação"""
+    altura, largura, *_ = template.shape
+    resultado = cv2.matchTemplate(template, referencia, cv2.TM_CCOEFF_NORMED)
+    confianca_coordenadas = PriorityQueue[tuple[float, Coordenada]](comparador=lambda item: item[0])
+    for y, x, *_ in zip(*np.where(resultado >= confianca)):
+        coordenada = Coordenada(x, y, largura, altura)
+        if any(c in coordenada for _, c in confianca_coordenadas): continue
+        confianca_coordenadas.add((float(resultado[y, x]), coordenada))
+    return [c for _, c in confianca_coordenadas]
+
+def criar_imagens () -> tuple[Imagem, Imagem, list[Coordenada]]:
+    """Criar o template, a referência e as posições em que o template foi inserido"""
+    aleatorio = np.random.default_rng(0)
+    referencia = aleatorio.integers(0, 40, (1080, 1920, 3), dtype=np.uint8)
+    template = aleatorio.integers(0, 255, (24, 48, 3), dtype=np.uint8)
+    cv2.rectangle(template, (4, 4), (43, 19), (255, 255, 255), 2)
+
+    posicoes = list[Coordenada]()
+    for y in range(40, 1040, 120):
+        for x in range(40, 1880, 160):
+            referencia[y : y + 24, x : x + 48] = template
+            posicoes.append(Coordenada(x, y, 48, 24))
+
+    # suavizar para cada ocorrência gerar um pico largo com muitos candidatos acima da confiança
+    referencia = cv2.GaussianBlur(referencia, (9, 9), 0)
+    template = cv2.GaussianBlur(template, (9, 9), 0)
+
+    imagem_template, imagem_referencia = object.__new__(Imagem), object.__new__(Imagem)
+    imagem_template.pixels, imagem_referencia.pixels = template, referencia
+    return imagem_template, imagem_referencia, posicoes
+
+if __name__ == "__main__":
+    confianca = float(sys.argv[1]) if len(sys.argv) > 1 else 0.3
+    template, referencia, posicoes = criar_imagens()
+
+    cronometro = bot.tempo.Cronometro(6)
+    anteriores = procurar_anterior(template.pixels, referencia.pixels, confianca)
+    anterior = cronometro()
+
+    cronometro = bot.tempo.Cronometro(6)
+    atuais = template.procurar_imagens(confianca, referencia=referencia)
+    atual = cronometro()
+
+    encontrados = lambda coordenadas: sum(1 for posicao in posicoes if posicao in coordenadas)
+    candidatos = int((cv2.matchTemplate(template.pixels, referencia.pixels, cv2.TM_CCOEFF_NORMED) >= confianca).sum())
+    print(f"Confiança: {confianca} | Template inserido {len(posicoes)} vez(es) | {candidatos} candidato(s)")
+    print(f"Anterior:           {anterior:.3f}s {len(anteriores)} coordenada(s) {encontrados(anteriores)} exata(s)")
+    print(f"procurar_imagens(): {atual:.3f}s {len(atuais)} coordenada(s) {encontrados(atuais)} exata(s) ({anterior / atual:.2f}x)")
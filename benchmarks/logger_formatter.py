@@ -0,0 +1,64 @@
+"""Benchmark de registros/segundo do `JsonFormatter` comparado à implementação anterior com `Json.stringify()`
+- Executar `python benchmarks/logger_formatter.py`"""
+
+# std
+import sys, time, logging
+from datetime import datetime as Datetime
+# interno
+import bot
+from bot.tempo import TIMEZONE_BRT
+from bot.logger.setup import JsonFormatter, MainLogger
+
+class JsonFormatterAnterior (JsonFormatter):
+    """Implementação anterior do `format` para comparação"""
+
+    def format (self, record: logging.LogRecord) -> str:
+        payload = {
+            "id": self.identificador,
+            "timestamp": Datetime.fromtimestamp(record.created, TIMEZONE_BRT)\
+                                 .strftime(MainLogger.FORMATO_DATA_LOG),
+            "name": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        if trace := getattr(record, "trace", None):
+            payload["trace"] = trace
+        if extra := getattr(record, "extra", None):
+            payload["extra"] = extra
+        if self.adicionar_file:
+            payload["file"] = {
+                "path": (record.pathname.removeprefix(self.diretorio_execucao)
+                                        .lstrip("\\")
+                                        .replace("\\", "/")),
+                "function": record.funcName,
+                "line": record.lineno,
+            }
+        return bot.formatos.Json(payload).stringify(indentar=False)
+
+def criar_registros (quantidade: int) -> list[logging.LogRecord]:
+    registros = []
+    for i in range(quantidade):
+        registro = logging.LogRecord("BOT", logging.INFO, __file__, 10 + i % 5, f"Processando item {i} ção", None, None, "main")
+        registro.created = time.time() + i / 1000
+        registro.trace = { "id": "abcd1234", "status": "PROCESSING", "seconds": i * 0.001 } # type: ignore
+        registro.extra = { "item": i, "data": Datetime.now(), "valores": (1, 2, 3) } # type: ignore
+        registros.append(registro)
+    return registros
+
+def medir (formatter: logging.Formatter, registros: list[logging.LogRecord]) -> tuple[float, list[str]]:
+    cronometro = bot.tempo.Cronometro(6)
+    saida = [formatter.format(registro) for registro in registros]
+    return len(registros) / cronometro(), saida
+
+if __name__ == "__main__":
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    registros = criar_registros(quantidade)
+    diretorio = bot.sistema.Caminho.diretorio_execucao().string
+
+    anterior, saida_anterior = medir(JsonFormatterAnterior("abcd1234", diretorio), registros)
+    atual, saida_atual = medir(JsonFormatter("abcd1234", diretorio), registros)
+    assert saida_anterior == saida_atual, "Saída do JsonFormatter diferente da implementação anterior"
+
+    print(f"Registros: {quantidade}")
+    print(f"Anterior: {anterior:,.0f} registros/s")
+    print(f"Atual:    {atual:,.0f} registros/s ({atual / anterior:.2f}x)")
@@ -0,0 +1,78 @@
+"""Benchmark do agrupamento vetorizado de linhas e células do `LeitorOCR` comparado à implementação anterior
+- Coordenadas sintéticas de textos de um relatório com `linhas x colunas` células e variação no `y` e altura
+- Não necessário o `EasyOCR`, apenas o agrupamento das coordenadas detectadas é comparado
+- Executar `python benchmarks/ocr_agrupar_tabela.py [linhas] [colunas]`"""
+
+# std
+import sys
+# interno
+import bot
+from bot.estruturas import Coordenada
+from bot.imagem import Coordenadas, LeitorOCR
+# externo
+import numpy as np
+
+def agrupar_linhas_anterior (coordenadas: list[Coordenada], margem_y: int = 5) -> list[list[Coordenada]]:
+    """Implementação anterior do `LeitorOCR.detectar_linhas` para comparação"""
+    linhas = list[list[Coordenada]]()
+    for coordenada in sorted(coordenadas, key=lambda c: c.y):
+        if not linhas or linhas[-1][0].y + margem_y <= coordenada.y:
+            linhas.append([coordenada])
+        else: linhas[-1].append(coordenada)
+    for linha in linhas:
+        linha.sort(key=lambda c: c.x)
+    return linhas
+
+def agrupar_tabela_anterior (coordenadas: list[Coordenada], largura: int) -> tuple[list[Coordenada], list[list[Coordenada]]]:
+    """Implementação anterior das coordenadas dos headers e células do `LeitorOCR.ler_tabela` para comparação"""
+    headers, *linhas = agrupar_linhas_anterior(coordenadas)
+    for i, coordenada in enumerate(headers):
+        acrescimo_largura = headers[i + 1].x if i < len(headers) - 1 else largura
+        coordenada.largura += acrescimo_largura - coordenada.x - coordenada.largura - 2
+
+    grade = list[list[Coordenada]]()
+    for linha in linhas:
+        menor_y = min(coordenada.y for coordenada in linha)
+        maior_altura = max(coordenada.altura for coordenada in linha)
+        grade.append([Coordenada(header.x, menor_y, header.largura, maior_altura) for header in headers])
+    return headers, grade
+
+def criar_coordenadas (linhas: int, colunas: int) -> list[Coordenada]:
+    """Coordenadas dos textos `left-align` com variação de `-2..2` no `y` e altura de `11..14` pixels"""
+    aleatorio = np.random.default_rng(0)
+    coordenadas = [
+        Coordenada(
+            10 + coluna * 120,
+            30 + linha * 28 + int(aleatorio.integers(-2, 3)),
+            int(aleatorio.integers(30, 100)),
+            int(aleatorio.integers(11, 15)),
+        )
+        for linha in range(linhas + 1)
+        for coluna in range(colunas)
+    ]
+    aleatorio.shuffle(coordenadas) # type: ignore
+    return coordenadas
+
+if __name__ == "__main__":
+    linhas = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    colunas = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    coordenadas = criar_coordenadas(linhas, colunas)
+    largura = colunas * 120 + 20
+
+    cronometro = bot.tempo.Cronometro(6)
+    headers_anterior, grade_anterior = agrupar_tabela_anterior([Coordenada(*c) for c in coordenadas], largura)
+    segundos_anterior = cronometro()
+
+    # detecção do `LeitorOCR` já retorna as `Coordenadas`
+    array = Coordenadas(coordenadas)
+    cronometro = bot.tempo.Cronometro(6)
+    headers, grade = LeitorOCR.agrupar_tabela(array, largura)
+    segundos_atual = cronometro()
+
+    print(f"Coordenadas: {len(coordenadas)} | Tabela {linhas}x{colunas}")
+    print(f"Anterior:         {segundos_anterior * 1000:.1f}ms linhas={len(grade_anterior)}")
+    print(f"agrupar_tabela(): {segundos_atual * 1000:.1f}ms linhas={len(grade)} ({segundos_anterior / segundos_atual:.2f}x)")
+    # altura atual das células é a da união dos textos da linha, contendo a anterior
+    posicoes = lambda grade: [[(c.x, c.y, c.largura) for c in linha] for linha in grade]
+    contem = all(c.altura >= a.altura for linha, anterior in zip(grade, grade_anterior) for c, a in zip(linha, anterior))
+    print(f"Headers iguais: {list(headers) == headers_anterior} | Posições das células iguais: {posicoes(grade) == posicoes(grade_anterior)} | Alturas contendo a anterior: {contem}")
@@ -0,0 +1,79 @@
+"""Benchmark do `LeitorOCR.ler_tabela` com o reconhecimento em lote comparado à implementação anterior
+- Tabela sintética renderizada com `linhas x colunas` células de texto
+- Anterior realizava um `readtext` para cada região de cada uma das 4 variantes de cada célula
+- Necessário a dependência `bot[ocr]`
+- Executar `python benchmarks/ocr_ler_tabela.py [linhas] [colunas]`"""
+
+# std
+import sys
+# interno
+import bot
+from bot.estruturas import Coordenada
+from bot.imagem import Imagem, LeitorOCR
+# externo
+import cv2, numpy as np
+
+def ler_texto_imagem_anterior (leitor: LeitorOCR, imagem: Imagem) -> str:
+    """Implementação anterior do `LeitorOCR.ler_texto_imagem` para comparação"""
+    maior_confianca, dados_maior_confianca = 0.0, []
+    regioes = tuple(map(imagem.recortar, leitor.detectar_imagem(imagem)))
+    for modificador in (lambda i: i, Imagem.inverter, Imagem.cinza, Imagem.binarizar):
+        dados = [item for regiao in map(modificador, regioes) for item in leitor.ler_imagem(regiao)]
+        confianca_atual = sum(confianca for _, _, confianca in dados)
+        if confianca_atual > maior_confianca:
+            dados_maior_confianca, maior_confianca = dados, confianca_atual
+    return " ".join(texto for texto, _, _ in dados_maior_confianca)
+
+def ler_tabela_anterior (leitor: LeitorOCR, imagem: Imagem, margem_y: int = 5) -> list[list[str]]:
+    """Leitura das células da tabela com uma chamada do `ler_texto_imagem` anterior por célula"""
+    headers, *linhas = leitor.detectar_linhas(imagem, margem_y)
+    return [
+        [ler_texto_imagem_anterior(leitor, imagem.recortar(Coordenada(header.x, min(c.y for c in linha), header.largura, max(c.altura for c in linha))))
+         for header in headers]
+        for linha in linhas
+    ]
+
+def criar_tabela (linhas: int, colunas: int) -> Imagem:
+    """Tabela com header e `linhas x colunas` células de texto `left-align`"""
+    pixels = np.full((40 + linhas * 32, colunas * 140 + 20, 3), 255, np.uint8)
+    for coluna in range(colunas):
+        x = 10 + coluna * 140
+        cv2.putText(pixels, f"Coluna {coluna}", (x, 26), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 0, 0), 1, cv2.LINE_AA)
+        for linha in range(linhas):
+            cv2.putText(pixels, f"{linha * colunas + coluna:05}", (x, 62 + linha * 32), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (40, 40, 40), 1, cv2.LINE_AA)
+
+    imagem = object.__new__(Imagem)
+    imagem.pixels = pixels
+    return imagem
+
+if __name__ == "__main__":
+    linhas = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    colunas = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    imagem, leitor = criar_tabela(linhas, colunas), LeitorOCR()
+
+    cronometro = bot.tempo.Cronometro(6)
+    anterior = ler_tabela_anterior(leitor, imagem)
+    segundos_anterior = cronometro()
+
+    leitor.tamanho_cache = 0
+    cronometro = bot.tempo.Cronometro(6)
+    atual = leitor.ler_tabela(imagem)
+    segundos_atual = cronometro()
+
+    celulas = [imagem.recortar(coordenada) for linha in atual for _, coordenada in linha.values()]
+    cronometro = bot.tempo.Cronometro(6)
+    leitor.ler_textos_imagens(celulas, confianca_suficiente=0.9)
+    segundos_suficiente = cronometro()
+
+    leitor.tamanho_cache = LeitorOCR.tamanho_cache
+    leitor.ler_tabela(imagem)
+    cronometro = bot.tempo.Cronometro(6)
+    leitor.ler_tabela(imagem)
+    segundos_cache = cronometro()
+
+    iguais = sum(a == b for linha_a, linha_b in zip(anterior, atual) for a, (b, _) in zip(linha_a, linha_b.values()))
+    print(f"Tabela {linhas}x{colunas} | Imagem {imagem!r}")
+    print(f"Anterior:                        {segundos_anterior:.3f}s")
+    print(f"ler_tabela():                    {segundos_atual:.3f}s ({segundos_anterior / segundos_atual:.2f}x) células iguais à anterior={iguais / (linhas * colunas):.2%}")
+    print(f"Células confianca_suficiente=0.9: {segundos_suficiente:.3f}s")
+    print(f"ler_tabela() com cache:          {segundos_cache:.3f}s ({segundos_anterior / segundos_cache:.2f}x)")
@@ -0,0 +1,108 @@
+"""Checagem e benchmark do `ServidorOCR` com um reconhecedor stub no lugar do `EasyOCR`
+- Stub do `easyocr.Reader` detectando os componentes escuros e reconhecendo o tamanho de cada caixa
+- Checado o `LeitorOCR.obter()` compartilhado entre threads, a leitura pelo `LeitorOCR.conectar()` igual à local,
+  a recusa de conexões com chave inválida e de métodos não permitidos
+- Não necessário o `EasyOCR`
+- Executar `python benchmarks/ocr_servidor.py [leituras]`"""
+
+# std
+import sys, types, secrets, threading
+from multiprocessing import connection
+# interno
+import bot
+from bot.imagem import Imagem, LeitorOCR, ServidorOCR
+# externo
+import cv2, numpy as np
+
+class ReaderStub:
+    """Substituto do `easyocr.Reader` com os métodos utilizados pelo `LeitorOCR`"""
+
+    instancias = 0
+
+    def __init__ (self, linguagem: list[str], gpu: bool = False) -> None:
+        ReaderStub.instancias += 1
+
+    def detect (self, pixels: np.ndarray, **_) -> tuple[list[list[list[int]]], list[list]]:
+        cinza = pixels if pixels.ndim == 2 else cv2.cvtColor(pixels, cv2.COLOR_BGR2GRAY)
+        _, _, estatisticas, _ = cv2.connectedComponentsWithStats((cinza < 128).astype(np.uint8))
+        return [[[int(x), int(x + w), int(y), int(y + h)] for x, y, w, h, area in estatisticas[1:] if area > 3]], [[]]
+
+    def recognize (self, pixels: np.ndarray, horizontal_list: list[list[int]], **_) -> list[tuple]:
+        return [
+            ([[x1, y1], [x2, y1], [x2, y2], [x1, y2]], f"{x2 - x1}x{y2 - y1}", 0.9 if pixels[y1:y2, x1:x2].mean() > 127 else 0.4)
+            for x1, x2, y1, y2 in horizontal_list
+        ]
+
+    def readtext (self, pixels: np.ndarray, **kwargs) -> list[tuple]:
+        (caixas, *_), _ = self.detect(pixels)
+        return self.recognize(pixels, caixas)
+
+def criar_imagem (linhas: int, colunas: int) -> Imagem:
+    """Imagem com `linhas x colunas` retângulos escuros de larguras diferentes"""
+    pixels = np.full((20 + linhas * 40, 20 + colunas * 120, 3), 255, np.uint8)
+    for linha in range(linhas):
+        for coluna in range(colunas):
+            x, y = 20 + coluna * 120, 20 + linha * 40
+            cv2.rectangle(pixels, (x, y), (x + 30 + linha * 5 + coluna, y + 12), (0, 0, 0), -1)
+
+    imagem = object.__new__(Imagem)
+    imagem.pixels = pixels
+    return imagem
+
+def verificar_obter () -> LeitorOCR:
+    """Instância do `obter()` compartilhada e o `reader` criado uma única vez entre threads"""
+    leitores = list[LeitorOCR]()
+    threads = [threading.Thread(target=lambda: leitores.append(LeitorOCR.obter())) for _ in range(4)]
+    for thread in threads: thread.start()
+    for thread in threads: thread.join()
+    assert len({id(leitor) for leitor in leitores}) == 1 and ReaderStub.instancias == 1, \
+        f"LeitorOCR.obter() criou {ReaderStub.instancias} reader(s)"
+    return leitores[0]
+
+def verificar_chaves (servidor: ServidorOCR, chave: bytes, imagem: Imagem) -> None:
+    """Conexões com a chave inválida e métodos fora do `METODOS_READER` recusados pelo servidor"""
+    errada = secrets.token_bytes(len(chave))
+    assert ServidorOCR.em_execucao(servidor.endereco, chave), "Servidor OCR não aceitou a chave correta"
+    assert not ServidorOCR.em_execucao(servidor.endereco, errada), "Servidor OCR aceitou uma chave inválida"
+
+    try:
+        LeitorOCR.conectar(servidor.endereco, errada).detectar_imagem(imagem)
+        raise AssertionError("Leitor conectado com uma chave inválida")
+    except connection.AuthenticationError: pass
+
+    with connection.Client(servidor.endereco, authkey=chave) as cliente:
+        cliente.send(("__init__", (), {}))
+        status, resultado = cliente.recv()
+    assert status == "erro" and "PermissionError" in resultado, f"Método não permitido executado pelo servidor OCR: {resultado}"
+
+if __name__ == "__main__":
+    leituras = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    sys.modules["easyocr"] = types.SimpleNamespace(Reader=ReaderStub)
+    imagem = criar_imagem(10, 5)
+
+    local = verificar_obter()
+    chave = secrets.token_bytes(32)
+    servidor = ServidorOCR(endereco=("127.0.0.1", 0), chave=chave, leitor=local)
+    threading.Thread(target=servidor.executar, daemon=True).start()
+    assert servidor.pronto.wait(10), "Servidor OCR não iniciado"
+
+    remoto = LeitorOCR.conectar(servidor.endereco, chave)
+    assert remoto.ler_texto_imagem(imagem) == local.ler_texto_imagem(imagem), "Leitura remota diferente da local"
+    assert remoto.ler_tabela(imagem) == local.ler_tabela(imagem), "Tabela remota diferente da local"
+    verificar_chaves(servidor, chave, imagem)
+
+    # Sem o cache para medir as chamadas ao `reader`
+    local.tamanho_cache = remoto.tamanho_cache = 0
+    cronometro = bot.tempo.Cronometro(6)
+    for _ in range(leituras): local.ler_texto_imagem(imagem)
+    segundos_local = cronometro()
+
+    cronometro = bot.tempo.Cronometro(6)
+    for _ in range(leituras): remoto.ler_texto_imagem(imagem)
+    segundos_remoto = cronometro()
+
+    servidor.encerrar()
+    print(f"Leituras: {leituras} | Imagem {imagem!r}")
+    print(f"LeitorOCR.obter():    {segundos_local * 1000 / leituras:.2f}ms por leitura")
+    print(f"LeitorOCR.conectar(): {segundos_remoto * 1000 / leituras:.2f}ms por leitura ({segundos_remoto / segundos_local:.2f}x)")
+    print("Instância compartilhada, leitura remota igual à local e chave inválida recusada: True")
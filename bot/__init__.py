@@ -16,6 +16,7 @@ from bot import (
     database,
     email,
     erro,
+    execucao,
     formatos,
     ftp,
     http,
@@ -3,7 +3,7 @@ import re, configparser, typing
 # interno
 import bot
 from bot.sistema import Caminho
-from bot.estruturas import DictNormalizado
+from bot.estruturas import DictNormalizadoCongelado
 
 class Interpolacao (configparser.ExtendedInterpolation):
     # Aceita interpolação ${...}
@@ -72,8 +72,9 @@ class ConfigFile:
 
     INICIALIZADO: bool = False
     DIRETORIO_EXECUCAO = Caminho.diretorio_execucao()
-    DADOS = DictNormalizado[DictNormalizado[str]]()
-    """`{ secao: { opcao: valor } }`"""
+    DADOS = DictNormalizadoCongelado[DictNormalizadoCongelado[str]]()
+    """`{ secao: { opcao: valor } }`
+    - Imutável após o `inicializar_configfile()`"""
 
     def __repr__ (self) -> str:
         return f"<bot.ConfigFile com '{len(self.DADOS)}' seções>"
@@ -95,12 +96,14 @@ class ConfigFile:
             parser.read(caminho.string, encoding="utf-8")
 
         # lower seções e opções
-        for secao in parser:
-            if secao.lower() == "default": continue
-            self.DADOS[secao] = DictNormalizado({
+        self.DADOS = DictNormalizadoCongelado({
+            secao: DictNormalizadoCongelado({
                 opcao: parser[secao][opcao]
                 for opcao in parser[secao]
             })
+            for secao in parser
+            if secao.lower() != "default"
+        })
 
         return self
 
@@ -23,7 +23,8 @@ def retry[R] (
     erros = erros or (Exception,)
 
     def retry (func: typing.Callable[P, R]) -> typing.Callable[P, R]:
-        nome_funcao = func.__name__
+        # `functools.partial` e objetos chamáveis não possuem `__name__`
+        nome_funcao = getattr(func, "__name__", repr(func))
 
         @functools.wraps(func)
         def wrapper (*args: P.args, **kwargs: P.kwargs) -> R:
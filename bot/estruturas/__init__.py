@@ -2,5 +2,6 @@
 
 from bot.estruturas.setup import *
 from bot.estruturas.filas import *
-from bot.estruturas.string import String
+from bot.estruturas.filas_concorrentes import *
+from bot.estruturas.string import String, IndiceTexto
 from bot.estruturas.decimal import Decimal
\ No newline at end of file
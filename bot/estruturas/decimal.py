@@ -1,6 +1,32 @@
 # std
 from __future__ import annotations
-import typing, functools, decimal, operator
+import re, typing, functools, decimal, operator
+
+NAN = decimal.Decimal("NaN")
+
+@functools.cache
+def expoente (precisao: int) -> decimal.Decimal:
+    """Expoente do `quantize` para a `precisao`, mantido em cache"""
+    return decimal.Decimal(".".ljust(precisao + 1, "0"))
+
+@functools.cache
+def pattern_valor_limpo (separador_decimal: str) -> re.Pattern[str]:
+    """Pattern de um valor que não necessita de sanitização para o `separador_decimal`"""
+    return re.compile(rf"[+-]?[0-9]+(?:{re.escape(separador_decimal)}[0-9]+)?")
+
+def converter (valor: str, precisao: int, separador_decimal: str) -> decimal.Decimal:
+    """Converter o `valor` para `decimal.Decimal` com a `precisao` ou `NaN` caso inválido
+    - Valores já limpos, ex: `-1234.56`, não passam pela sanitização caractere a caractere"""
+    if pattern_valor_limpo(separador_decimal).fullmatch(valor):
+        if separador_decimal != ".": valor = valor.replace(separador_decimal, ".")
+    else:
+        parte_inteiro, _, parte_decimal = valor.lower().partition(separador_decimal)
+        inteiro = "".join(p for p in parte_inteiro if p.isdigit() or p in "+-")
+        decimal_ou_exponencial = "".join(p for p in parte_decimal if p.isdigit() or p in "+-e")
+        valor = inteiro if not decimal_ou_exponencial else f"{inteiro}.{decimal_ou_exponencial}"
+
+    try: return decimal.Decimal(valor).quantize(expoente(precisao), decimal.ROUND_FLOOR)
+    except Exception: return NAN
 
 class Decimal:
     """Classe para realizar comparações e operações matemáticas com precisão em números com ponto flutuante
@@ -28,6 +54,9 @@ class Decimal:
     # Funções
     abs(decimal)
     round(decimal)
+    Decimal.sum(decimais)
+    Decimal.somar(["1,50", "2,25"], separador_decimal=",")
+    Decimal.converter_coluna(["1.50", "xpto"])
 
     # Métodos
     decimal.nan()
@@ -55,14 +84,14 @@ class Decimal:
         assert precisao >= 1, "A precisão decimal deve ser >= 1"
         self.precisao = precisao
 
-        parte_inteiro, _, parte_decimal = valor.lower().partition(separador_decimal)
-        inteiro = "".join(p for p in parte_inteiro if p.isdigit() or p in "+-")
-        decimal_ou_exponencial = "".join(p for p in parte_decimal if p.isdigit() or p in "+-e")
+        self.d = converter(valor, precisao, separador_decimal)
 
-        exponent = decimal.Decimal(".".ljust(precisao + 1, "0"))
-        valor = inteiro if not decimal_ou_exponencial else f"{inteiro}.{decimal_ou_exponencial}"
-        try: self.d = decimal.Decimal(valor).quantize(exponent, decimal.ROUND_FLOOR)
-        except Exception: self.d = decimal.Decimal("NaN")
+    @classmethod
+    def __criar (cls, d: decimal.Decimal, precisao: int, separador_decimal: str) -> Decimal:
+        """Criar sem a conversão do `__init__`"""
+        obj = object.__new__(cls)
+        obj.d, obj.precisao, obj.separador_decimal = d, precisao, separador_decimal
+        return obj
 
     def __repr__ (self) -> str:
         return f"{type(self).__name__}(valor={str(self)!r}, precisao={self.precisao}, separador_decimal={self.separador_decimal!r})>"
@@ -87,18 +116,22 @@ class Decimal:
             valor = valor.replace(".", self.separador_decimal, 1)
         return Decimal(valor, self.precisao, self.separador_decimal)
 
-    def __comparar (self, other: object, operator: typing.Callable) -> bool:
+    def __operando (self, other: object) -> decimal.Decimal | None:
+        """Obter o `decimal.Decimal` do `other` na precisão e separador do `self`
+        - `None` caso o tipo não seja suportado"""
         match other:
             case Decimal():
-                return operator(self.d, other.d)
+                return other.d
             case str() | int():
-                corrigido = Decimal(str(other), self.precisao, self.separador_decimal)
-                return operator(self.d, corrigido.d)
+                return converter(str(other), self.precisao, self.separador_decimal)
             case float():
-                corrigido = Decimal(str(other).replace(".", self.separador_decimal), self.precisao, self.separador_decimal)
-                return operator(self.d, corrigido.d)
+                return converter(str(other).replace(".", self.separador_decimal), self.precisao, self.separador_decimal)
             case _:
-                return NotImplemented
+                return None
+
+    def __comparar (self, other: object, operator: typing.Callable) -> bool:
+        d = self.__operando(other)
+        return NotImplemented if d is None else operator(self.d, d)
     def __eq__ (self, other: object) -> bool: return self.__comparar(other, operator.eq)
     def __ne__ (self, other: object) -> bool: return self.__comparar(other, operator.ne)
     def __lt__ (self, other: object) -> bool: return self.__comparar(other, operator.lt)
@@ -107,25 +140,10 @@ class Decimal:
     def __ge__ (self, other: object) -> bool: return self.__comparar(other, operator.ge)
 
     def __aplicar (self, other: object, operator: typing.Callable) -> Decimal:
-        obj = object.__new__(Decimal)
-        match other:
-            case Decimal():
-                obj.d = operator(self.d, other.d)
-            case str() | int():
-                corrigido = Decimal(str(other), self.precisao, self.separador_decimal)
-                obj.d = operator(self.d, corrigido.d)
-            case float():
-                corrigido = Decimal(str(other).replace(".", self.separador_decimal), self.precisao, self.separador_decimal)
-                obj.d = operator(self.d, corrigido.d)
-            case _:
-                return NotImplemented
-
-        exponent = decimal.Decimal(".".ljust(self.precisao + 1, "0"))
-        obj.d = obj.d.quantize(exponent, decimal.ROUND_FLOOR)
-        obj.precisao = self.precisao
-        obj.separador_decimal = self.separador_decimal
-
-        return obj
+        d = self.__operando(other)
+        if d is None: return NotImplemented
+        resultado = operator(self.d, d).quantize(expoente(self.precisao), decimal.ROUND_FLOOR)
+        return Decimal.__criar(resultado, self.precisao, self.separador_decimal)
     def __add__  (self, other: object) -> Decimal: return self.__aplicar(other, operator.add)
     def __iadd__ (self, other: object) -> Decimal: return self.__aplicar(other, operator.iadd)
     def __sub__  (self, other: object) -> Decimal: return self.__aplicar(other, operator.sub)
@@ -156,8 +174,57 @@ class Decimal:
 
     @staticmethod
     def sum (decimais: typing.Iterable[Decimal]) -> Decimal:
-        """Realizar o `sum()` de todos os `decimais`"""
-        return functools.reduce(
-            lambda total, atual: total + atual,
-            decimais
-        )
+        """Realizar o `sum()` de todos os `decimais`
+        - Resultado na precisão e separador do primeiro decimal"""
+        iterador = iter(decimais)
+        try: total = next(iterador)
+        except StopIteration: raise TypeError("reduce() of empty iterable with no initial value")
+
+        d, exponent = total.d, expoente(total.precisao)
+        for atual in iterador:
+            d = (d + atual.d).quantize(exponent, decimal.ROUND_FLOOR)
+        return total if d is total.d else Decimal.__criar(d, total.precisao, total.separador_decimal)
+
+    @staticmethod
+    def __conversor (precisao: int, separador_decimal: str) -> typing.Callable[[str | int | float | Decimal], decimal.Decimal]:
+        """Criar a função de conversão dos valores de uma coluna
+        - `str` e `int` iguais ao `Decimal(str(valor), precisao, separador_decimal)`
+        - `float` iguais aos operadores e `Decimal` ajustado para a `precisao`"""
+        assert precisao >= 1, "A precisão decimal deve ser >= 1"
+        padrao, exponent = Decimal.__criar(NAN, precisao, separador_decimal), expoente(precisao)
+
+        def converter_valor (valor: str | int | float | Decimal) -> decimal.Decimal:
+            if isinstance(valor, Decimal):
+                return valor.d.quantize(exponent, decimal.ROUND_FLOOR)
+            d = padrao.__operando(valor)
+            if d is None: raise TypeError(f"Tipo '{type(valor).__name__}' inválido para o Decimal")
+            return d
+
+        return converter_valor
+
+    @staticmethod
+    def converter_coluna (valores: typing.Iterable[str | int | float | Decimal],
+                          precisao: int = 2,
+                          separador_decimal = ".") -> list[Decimal]:
+        """Converter os `valores` de uma coluna para `Decimal` com a mesma `precisao` e `separador_decimal`
+        - Mesmo resultado do `Decimal(str(valor), precisao, separador_decimal)`, incluindo o `NaN`
+        - `float` convertido da mesma forma que nos operadores"""
+        converter_valor = Decimal.__conversor(precisao, separador_decimal)
+        return [
+            Decimal.__criar(converter_valor(valor), precisao, separador_decimal)
+            for valor in valores
+        ]
+
+    @staticmethod
+    def somar (valores: typing.Iterable[str | int | float | Decimal],
+               precisao: int = 2,
+               separador_decimal = ".") -> Decimal:
+        """Converter e somar os `valores` de uma coluna em uma única passagem
+        - Mesmo resultado do `Decimal.sum(Decimal.converter_coluna(valores, ...))`
+        - `Decimal("0")` caso `valores` esteja vazio
+        - Resultado `NaN` caso algum valor seja inválido"""
+        converter_valor, exponent = Decimal.__conversor(precisao, separador_decimal), expoente(precisao)
+        total = decimal.Decimal(0).quantize(exponent)
+        for valor in valores:
+            total = (total + converter_valor(valor)).quantize(exponent, decimal.ROUND_FLOOR)
+        return Decimal.__criar(total, precisao, separador_decimal)
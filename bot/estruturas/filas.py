@@ -1,5 +1,5 @@
 # std
-import bisect, typing
+import heapq, bisect, typing, itertools
 from collections import deque
 
 class Deque[T] (deque[T]):
@@ -126,7 +126,8 @@ class Queue [T]:
         return self.__dq.popleft()
 
 class PriorityQueue [T]:
-    """Queue com prioridade na ordem natural"""
+    """Queue com prioridade na ordem natural
+    - Inserção `O(n)`. Utilizar o `HeapPriorityQueue` para grandes quantidades de elementos"""
 
     __dq: Deque[T]
     tamanho: int | None
@@ -204,9 +205,158 @@ class PriorityQueue [T]:
         - `IndexError` caso `self.empty()`"""
         return self.__dq.pop()
 
+class _EntradaMaxima:
+    """Entrada do heap de máximo com a comparação invertida da `entrada` do heap de mínimo"""
+
+    __slots__ = ("entrada",)
+
+    def __init__ (self, entrada: tuple) -> None:
+        self.entrada = entrada
+
+    def __lt__ (self, outra: "_EntradaMaxima") -> bool:
+        return outra.entrada < self.entrada
+
+class HeapPriorityQueue [T]:
+    """Queue com prioridade na ordem natural utilizando um par de heaps de mínimo e máximo
+    - Mesma interface e ordenação do `PriorityQueue`
+    - `add`, `poll_low` e `poll_high` em `O(log n)`. `peek_low` e `peek_high` em `O(1)` amortizado
+    - Elementos com a mesma prioridade são estáveis na ordem de inserção
+        - `poll_low` obtém o mais antigo e `poll_high` o mais recente, igual ao `PriorityQueue`
+    - `__iter__` e `__getitem__` ordenam os elementos em `O(n log n)`"""
+
+    tamanho: int | None
+    """Restrição de tamanho máximo dos elementos"""
+    comparador: typing.Callable[[T], typing.Any]
+    """Função para definir a prioridade
+    - `Default` o item inteiro é utilizado"""
+    descarte: typing.Literal["low", "high"] | None
+    """Comportamento ao adicionar com o `tamanho` máximo atingido
+    - `None` o elemento não é adicionado
+    - `low` o elemento de menor prioridade é removido caso o novo possua prioridade maior
+    - `high` o elemento de maior prioridade é removido caso o novo possua prioridade menor"""
+
+    def __init__ (self, elementos: typing.Iterable[T] | None = None,
+                        tamanho: int | None = None,
+                        comparador: typing.Callable[[T], typing.Any] | None = None,
+                        descarte: typing.Literal["low", "high"] | None = None) -> None:
+        """Inicializar a `HeapPriorityQueue` com `tamanho` máximo opcional e adicionar `elementos` opcionalmente"""
+        assert descarte in (None, "low", "high"), f"Descarte '{descarte}' inválido"
+        self.tamanho = None if not tamanho or tamanho < 0 else tamanho
+        self.comparador = comparador if comparador else lambda item: item
+        self.descarte = descarte
+        self.__sequencia = itertools.count()
+        # Entradas `(prioridade, sequencia, elemento)` compartilhadas pelos heaps
+        # Removidas de forma tardia do heap oposto conforme o `__ativos`
+        self.__minimo = list[tuple[typing.Any, int, T]]()
+        self.__maximo = list[_EntradaMaxima]()
+        self.__ativos = set[int]()
+        for elemento in elementos or []:
+            self.add(elemento)
+
+    def __len__ (self) -> int:
+        """Quantidade de elementos"""
+        return len(self.__ativos)
+
+    def __repr__ (self) -> str:
+        """Representação da classe"""
+        return f"<HeapPriorityQueue[T] com {len(self)} elemento(s)>"
+
+    def __str__ (self) -> str:
+        return str([*self])
+
+    def __iter__ (self) -> typing.Generator[T, None, None]:
+        """Iteração sobre os elementos da HeapPriorityQueue na ordem de prioridade"""
+        for *_, elemento in sorted(e for e in self.__minimo if e[1] in self.__ativos):
+            yield elemento
+
+    def __getitem__ (self, index: int) -> T:
+        """Obter elemento no `index` da ordem de prioridade"""
+        return [*self][index]
+
+    def __bool__ (self) -> bool:
+        """Representação `bool` da classe"""
+        return not self.empty()
+
+    def empty (self) -> bool:
+        """Indicador se a HeapPriorityQueue está vazia"""
+        return len(self) == 0
+
+    def full (self) -> bool:
+        """Indicador se a HeapPriorityQueue chegou no tamanho máximo"""
+        return len(self) == self.tamanho
+
+    def __limpar_minimo (self) -> tuple[typing.Any, int, T]:
+        """Remover as entradas inativas do topo e retornar a primeira ativa"""
+        while self.__minimo[0][1] not in self.__ativos:
+            heapq.heappop(self.__minimo)
+        return self.__minimo[0]
+
+    def __limpar_maximo (self) -> tuple[typing.Any, int, T]:
+        """Remover as entradas inativas do topo e retornar a primeira ativa"""
+        while self.__maximo[0].entrada[1] not in self.__ativos:
+            heapq.heappop(self.__maximo)
+        return self.__maximo[0].entrada
+
+    def __compactar (self) -> None:
+        """Reconstruir os heaps caso as entradas inativas sejam a maioria em algum deles
+        - A remoção tardia limpa apenas o topo do heap utilizado, o oposto acumula as entradas removidas"""
+        if max(len(self.__minimo), len(self.__maximo)) <= 2 * len(self.__ativos) + 32: return
+        self.__minimo = [e for e in self.__minimo if e[1] in self.__ativos]
+        self.__maximo = [_EntradaMaxima(e) for e in self.__minimo]
+        heapq.heapify(self.__minimo)
+        heapq.heapify(self.__maximo)
+
+    def add (self, elemento: T) -> bool:
+        """Adicionar `elemento` na HeapPriorityQueue
+        - Retorna indicador de sucesso devido a restrição do `tamanho` e `descarte`"""
+        prioridade = self.comparador(elemento)
+        if self.full():
+            if self.descarte == "low" and self.__limpar_minimo()[0] < prioridade: self.poll_low()
+            elif self.descarte == "high" and prioridade < self.__limpar_maximo()[0]: self.poll_high()
+            else: return False
+
+        entrada = (prioridade, next(self.__sequencia), elemento)
+        self.__ativos.add(entrada[1])
+        heapq.heappush(self.__minimo, entrada)
+        heapq.heappush(self.__maximo, _EntradaMaxima(entrada))
+        return True
+
+    def peek_low (self) -> T:
+        """Obter o elemento com menor prioridade sem remover da HeapPriorityQueue
+        - `IndexError` caso `self.empty()`"""
+        if self.empty(): raise IndexError("HeapPriorityQueue vazia")
+        return self.__limpar_minimo()[2]
+
+    def poll_low (self) -> T:
+        """Obter o elemento com menor prioridade e remover da HeapPriorityQueue
+        - `IndexError` caso `self.empty()`"""
+        if self.empty(): raise IndexError("HeapPriorityQueue vazia")
+        _, sequencia, elemento = self.__limpar_minimo()
+        heapq.heappop(self.__minimo)
+        self.__ativos.remove(sequencia)
+        self.__compactar()
+        return elemento
+
+    def peek_high (self) -> T:
+        """Obter o elemento com maior prioridade sem remover da HeapPriorityQueue
+        - `IndexError` caso `self.empty()`"""
+        if self.empty(): raise IndexError("HeapPriorityQueue vazia")
+        return self.__limpar_maximo()[2]
+
+    def poll_high (self) -> T:
+        """Obter o elemento com maior prioridade e remover da HeapPriorityQueue
+        - `IndexError` caso `self.empty()`"""
+        if self.empty(): raise IndexError("HeapPriorityQueue vazia")
+        _, sequencia, elemento = self.__limpar_maximo()
+        heapq.heappop(self.__maximo)
+        self.__ativos.remove(sequencia)
+        self.__compactar()
+        return elemento
+
 __all__ = [
     "Stack",
     "Queue",
     "Deque",
-    "PriorityQueue"
+    "PriorityQueue",
+    "HeapPriorityQueue"
 ]
\ No newline at end of file
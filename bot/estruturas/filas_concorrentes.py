@@ -0,0 +1,345 @@
+# std
+from __future__ import annotations
+import abc, json, time, uuid, typing, threading, dataclasses
+# interno
+import bot
+from bot.estruturas.filas import Deque, HeapPriorityQueue
+
+class FilaBloqueante [T] (abc.ABC):
+    """Base das filas thread-safe com bloqueio
+    - `put` bloqueia enquanto a fila estiver no `tamanho` máximo
+    - `get` bloqueia enquanto a fila estiver vazia
+    - `task_done` e `join` para aguardar o processamento de todos os elementos obtidos
+    - Subclasses implementam o armazenamento pelo `_quantidade`, `_inserir` e `_remover`, chamados com o lock adquirido"""
+
+    tamanho: int | None
+    """Restrição de tamanho máximo dos elementos"""
+
+    def __init__ (self, tamanho: int | None = None) -> None:
+        self.tamanho = None if not tamanho or tamanho < 0 else tamanho
+        self.__lock = threading.Lock()
+        self.__nao_vazia = threading.Condition(self.__lock)
+        self.__nao_cheia = threading.Condition(self.__lock)
+        self.__concluida = threading.Condition(self.__lock)
+        self.__pendentes = 0
+
+    def __repr__ (self) -> str:
+        """Representação da classe"""
+        return f"<{type(self).__name__}[T] com {len(self)} elemento(s)>"
+
+    def __len__ (self) -> int:
+        """Quantidade de elementos"""
+        with self.__lock:
+            return self._quantidade()
+
+    def __bool__ (self) -> bool:
+        """Representação `bool` da classe"""
+        return not self.empty()
+
+    @abc.abstractmethod
+    def _quantidade (self) -> int:
+        """Quantidade de elementos armazenados"""
+
+    @abc.abstractmethod
+    def _inserir (self, elemento: T) -> None:
+        """Armazenar o `elemento`"""
+
+    @abc.abstractmethod
+    def _remover (self) -> T:
+        """Remover e retornar o próximo elemento"""
+
+    def empty (self) -> bool:
+        """Indicador se a fila está vazia"""
+        return len(self) == 0
+
+    def full (self) -> bool:
+        """Indicador se a fila chegou no tamanho máximo"""
+        return len(self) == self.tamanho
+
+    def put (self, elemento: T,
+                   bloquear: bool = True,
+                   timeout: float | None = None) -> bool:
+        """Adicionar `elemento` na fila
+        - `bloquear` aguardar, por até `timeout` segundos, caso a fila esteja no `tamanho` máximo
+        - Retorna indicador de sucesso devido a restrição do `tamanho`"""
+        with self.__nao_cheia:
+            if self.tamanho and not self.__nao_cheia.wait_for(
+                lambda: self._quantidade() < self.tamanho, # type: ignore
+                timeout if bloquear else 0
+            ): return False
+
+            self._inserir(elemento)
+            self.__pendentes += 1
+            self.__nao_vazia.notify()
+            return True
+
+    def get (self, bloquear: bool = True,
+                   timeout: float | None = None) -> T:
+        """Obter e remover o próximo elemento da fila
+        - `bloquear` aguardar, por até `timeout` segundos, caso a fila esteja vazia
+        - `TimeoutError` caso nenhum elemento esteja disponível"""
+        with self.__nao_vazia:
+            if not self.__nao_vazia.wait_for(self._quantidade, timeout if bloquear else 0):
+                raise TimeoutError(f"Nenhum elemento disponível na fila {type(self).__name__}")
+
+            elemento = self._remover()
+            self.__nao_cheia.notify()
+            return elemento
+
+    def task_done (self) -> None:
+        """Sinalizar que o processamento de um elemento obtido pelo `get` foi concluído
+        - `ValueError` caso chamado mais vezes que a quantidade de elementos adicionados"""
+        with self.__concluida:
+            if self.__pendentes <= 0:
+                raise ValueError("task_done() chamado mais vezes que a quantidade de elementos")
+            self.__pendentes -= 1
+            if not self.__pendentes: self.__concluida.notify_all()
+
+    def join (self, timeout: float | None = None) -> bool:
+        """Aguardar, por até `timeout` segundos, todos os elementos adicionados serem sinalizados pelo `task_done`
+        - Retorna indicador se todos foram concluídos"""
+        with self.__concluida:
+            return self.__concluida.wait_for(lambda: not self.__pendentes, timeout)
+
+class QueueBloqueante [T] (FilaBloqueante[T]):
+    """First In First Out thread-safe com bloqueio"""
+
+    def __init__ (self, elementos: typing.Iterable[T] | None = None,
+                        tamanho: int | None = None) -> None:
+        """Inicializar a `QueueBloqueante` com `tamanho` máximo opcional e adicionar `elementos` opcionalmente"""
+        super().__init__(tamanho)
+        self.__dq = Deque[T]()
+        for elemento in elementos or []:
+            self.put(elemento, bloquear=False)
+
+    def _quantidade (self) -> int: return len(self.__dq)
+    def _inserir (self, elemento: T) -> None: self.__dq.append(elemento)
+    def _remover (self) -> T: return self.__dq.popleft()
+
+class StackBloqueante [T] (FilaBloqueante[T]):
+    """Last In First Out thread-safe com bloqueio"""
+
+    def __init__ (self, elementos: typing.Iterable[T] | None = None,
+                        tamanho: int | None = None) -> None:
+        """Inicializar o `StackBloqueante` com `tamanho` máximo opcional e adicionar `elementos` opcionalmente"""
+        super().__init__(tamanho)
+        self.__dq = Deque[T]()
+        for elemento in elementos or []:
+            self.put(elemento, bloquear=False)
+
+    def _quantidade (self) -> int: return len(self.__dq)
+    def _inserir (self, elemento: T) -> None: self.__dq.append(elemento)
+    def _remover (self) -> T: return self.__dq.pop()
+
+class PriorityQueueBloqueante [T] (FilaBloqueante[T]):
+    """Queue com prioridade thread-safe com bloqueio
+    - `get` obtém o elemento de menor prioridade ou de maior caso `maior_primeiro`
+    - Elementos com a mesma prioridade são obtidos na ordem de inserção pelo `get` de menor prioridade
+    - `get` remove sempre da mesma ponta do `HeapPriorityQueue`, que compacta o heap oposto para não acumular entradas"""
+
+    def __init__ (self, elementos: typing.Iterable[T] | None = None,
+                        tamanho: int | None = None,
+                        comparador: typing.Callable[[T], typing.Any] | None = None,
+                        maior_primeiro: bool = False) -> None:
+        """Inicializar a `PriorityQueueBloqueante` com `tamanho` máximo opcional e adicionar `elementos` opcionalmente"""
+        super().__init__(tamanho)
+        self.__heap = HeapPriorityQueue[T](comparador=comparador)
+        self.maior_primeiro = maior_primeiro
+        for elemento in elementos or []:
+            self.put(elemento, bloquear=False)
+
+    def _quantidade (self) -> int: return len(self.__heap)
+    def _inserir (self, elemento: T) -> None: self.__heap.add(elemento)
+    def _remover (self) -> T: return self.__heap.poll_high() if self.maior_primeiro else self.__heap.poll_low()
+
+@dataclasses.dataclass
+class MensagemFila [T]:
+    """Mensagem obtida do `QueuePersistente.get()`
+    - Deve ser confirmada com o `ack` ou devolvida com o `nack`"""
+
+    id: int
+    """Identificador da mensagem na fila"""
+    conteudo: T
+    """Conteúdo adicionado pelo `put`"""
+    tentativas: int
+    """Quantidade de vezes que a mensagem foi obtida, incluindo a atual"""
+    recibo: str
+    """Identificador da obtenção atual
+    - Inválido caso a visibilidade expire e a mensagem seja obtida novamente"""
+
+class QueuePersistente [T]:
+    """Queue durável em um arquivo `sqlite` via `bot.database.Sqlite`
+    - Compartilhável entre threads e processos da mesma máquina
+    - `conteudo` das mensagens serializado em `json`
+    - Mensagens obtidas ficam invisíveis por `segundos_visibilidade` até o `ack` ou `nack`
+        - Recuperação de falhas: mensagens de workers encerrados sem `ack` voltam a ficar visíveis ao expirar
+    - Mensagens obtidas `tentativas_maximas` vezes sem `ack` são movidas para as `falhas()`
+    - Maior `prioridade` obtida primeiro e, na mesma prioridade, a ordem de inserção
+
+    ```
+    fila = QueuePersistente[dict](Caminho("fila.sqlite"))
+    fila.put({ "item": 1 })
+    mensagem = fila.get(timeout=10)
+    try: processar(mensagem.conteudo); fila.ack(mensagem)
+    except Exception: fila.nack(mensagem, segundos_atraso=30)
+    ```"""
+
+    def __init__ (self, caminho: bot.sistema.Caminho | str = ":memory:",
+                        nome: str = "fila",
+                        segundos_visibilidade: float = 300.0,
+                        tentativas_maximas: int | None = None,
+                        intervalo_consulta: float = 0.1) -> None:
+        assert nome.isidentifier(), f"Nome da fila '{nome}' inválido"
+        self.nome = nome
+        self.segundos_visibilidade = segundos_visibilidade
+        self.tentativas_maximas = tentativas_maximas or None
+        self.intervalo_consulta = max(0.001, intervalo_consulta)
+        self.__lock = threading.Lock()
+        self.database = bot.database.Sqlite(caminho, timeout=30.0, check_same_thread=False)
+        self.database.execute("PRAGMA journal_mode = WAL")
+        self.database.execute(f"""CREATE TABLE IF NOT EXISTS {nome} (
+            id          INTEGER PRIMARY KEY AUTOINCREMENT,
+            conteudo    TEXT NOT NULL,
+            prioridade  INTEGER NOT NULL DEFAULT 0,
+            status      TEXT NOT NULL DEFAULT 'pendente',
+            tentativas  INTEGER NOT NULL DEFAULT 0,
+            visivel_em  REAL NOT NULL,
+            recibo      TEXT
+        )""")
+        self.database.execute(f"CREATE INDEX IF NOT EXISTS idx_{nome}_proxima ON {nome} (status, prioridade DESC, id)")
+        self.database.commit()
+
+    def __repr__ (self) -> str:
+        return f"<QueuePersistente '{self.nome}' com {len(self)} mensagem(ns) pendente(s)>"
+
+    def __len__ (self) -> int:
+        """Quantidade de mensagens pendentes, incluindo as invisíveis aguardando `ack`"""
+        with self.__lock:
+            return int(self.database.execute(f"SELECT COUNT(*) FROM {self.nome} WHERE status = 'pendente'").primeira_linha["COUNT(*)"]) # type: ignore
+
+    def __bool__ (self) -> bool:
+        """Representação `bool` da classe"""
+        return not self.empty()
+
+    def empty (self) -> bool:
+        """Indicador se não possui mensagens pendentes"""
+        return len(self) == 0
+
+    def put (self, conteudo: T, prioridade: int = 0, segundos_atraso: float = 0) -> int:
+        """Adicionar uma mensagem com o `conteudo` serializável em `json`
+        - `segundos_atraso` para a mensagem ficar visível apenas após o tempo informado
+        - Retornado o `id` da mensagem"""
+        serializado = json.dumps(conteudo, ensure_ascii=False, default=bot.formatos.Json.serializar_objeto)
+        with self.__lock:
+            cursor = self.database.conexao.execute(
+                f"INSERT INTO {self.nome} (conteudo, prioridade, visivel_em) VALUES (?, ?, ?)",
+                (serializado, prioridade, time.time() + segundos_atraso)
+            )
+            self.database.commit()
+            return typing.cast(int, cursor.lastrowid)
+
+    def __obter (self) -> MensagemFila[T] | None:
+        """Reservar a próxima mensagem visível em uma única instrução atômica entre processos"""
+        agora, recibo = time.time(), uuid.uuid4().hex
+        with self.__lock:
+            if self.tentativas_maximas: self.database.execute(
+                f"""UPDATE {self.nome} SET status = 'falha', recibo = NULL
+                    WHERE status = 'pendente' AND visivel_em <= ? AND tentativas >= ?""",
+                agora, self.tentativas_maximas
+            )
+            linha = self.database.execute(
+                f"""UPDATE {self.nome}
+                    SET tentativas = tentativas + 1, visivel_em = ?, recibo = ?
+                    WHERE id = (
+                        SELECT id FROM {self.nome}
+                        WHERE status = 'pendente' AND visivel_em <= ?
+                        ORDER BY prioridade DESC, id
+                        LIMIT 1
+                    )
+                    RETURNING id, conteudo, tentativas""",
+                agora + self.segundos_visibilidade, recibo, agora
+            ).primeira_linha
+            self.database.commit()
+
+        if not linha: return None
+        return MensagemFila(int(linha["id"]), json.loads(str(linha["conteudo"])), int(linha["tentativas"]), recibo) # type: ignore
+
+    def get (self, bloquear: bool = True,
+                   timeout: float | None = None) -> MensagemFila[T]:
+        """Obter a próxima mensagem visível e torná-la invisível por `segundos_visibilidade`
+        - `bloquear` aguardar, por até `timeout` segundos, consultando a cada `intervalo_consulta`
+        - `TimeoutError` caso nenhuma mensagem esteja disponível"""
+        limite = None if timeout is None else time.monotonic() + timeout
+        while (mensagem := self.__obter()) is None:
+            if not bloquear or (limite is not None and time.monotonic() >= limite):
+                raise TimeoutError(f"Nenhuma mensagem disponível na fila {self!r}")
+            time.sleep(self.intervalo_consulta)
+        return mensagem
+
+    def ack (self, mensagem: MensagemFila[T]) -> bool:
+        """Confirmar o processamento e remover a `mensagem` da fila
+        - Retorna `False` caso o `recibo` seja inválido por expiração da visibilidade"""
+        with self.__lock:
+            removido = self.database.execute(
+                f"DELETE FROM {self.nome} WHERE id = ? AND recibo = ? AND status = 'pendente'",
+                mensagem.id, mensagem.recibo
+            )
+            self.database.commit()
+        return bool(removido.linhas_afetadas)
+
+    def nack (self, mensagem: MensagemFila[T], segundos_atraso: float = 0) -> bool:
+        """Devolver a `mensagem` para a fila, visível após `segundos_atraso`
+        - Movida para as `falhas()` caso atingido as `tentativas_maximas`
+        - Retorna `False` caso o `recibo` seja inválido por expiração da visibilidade"""
+        falha = bool(self.tentativas_maximas) and mensagem.tentativas >= self.tentativas_maximas # type: ignore
+        with self.__lock:
+            atualizado = self.database.execute(
+                f"""UPDATE {self.nome} SET status = ?, visivel_em = ?, recibo = NULL
+                    WHERE id = ? AND recibo = ? AND status = 'pendente'""",
+                "falha" if falha else "pendente", time.time() + segundos_atraso, mensagem.id, mensagem.recibo
+            )
+            self.database.commit()
+        return bool(atualizado.linhas_afetadas)
+
+    def estender (self, mensagem: MensagemFila[T], segundos: float | None = None) -> bool:
+        """Estender a invisibilidade da `mensagem` por `segundos` a partir de agora para processamentos longos
+        - `None` para utilizar o `segundos_visibilidade`
+        - Retorna `False` caso o `recibo` seja inválido por expiração da visibilidade"""
+        segundos = self.segundos_visibilidade if segundos is None else segundos
+        with self.__lock:
+            atualizado = self.database.execute(
+                f"UPDATE {self.nome} SET visivel_em = ? WHERE id = ? AND recibo = ? AND status = 'pendente'",
+                time.time() + segundos, mensagem.id, mensagem.recibo
+            )
+            self.database.commit()
+        return bool(atualizado.linhas_afetadas)
+
+    def falhas (self) -> list[MensagemFila[T]]:
+        """Mensagens que atingiram as `tentativas_maximas`"""
+        with self.__lock:
+            linhas = self.database.execute(
+                f"SELECT id, conteudo, tentativas FROM {self.nome} WHERE status = 'falha' ORDER BY id"
+            ).to_dict()
+        return [
+            MensagemFila(int(linha["id"]), json.loads(str(linha["conteudo"])), int(linha["tentativas"]), "") # type: ignore
+            for linha in linhas
+        ]
+
+    def reprocessar_falhas (self) -> int:
+        """Retornar as mensagens das `falhas()` para a fila com as tentativas zeradas
+        - Retornado a quantidade de mensagens"""
+        with self.__lock:
+            atualizado = self.database.execute(
+                f"UPDATE {self.nome} SET status = 'pendente', tentativas = 0, visivel_em = ? WHERE status = 'falha'",
+                time.time()
+            )
+            self.database.commit()
+        return atualizado.linhas_afetadas or 0
+
+__all__ = [
+    "MensagemFila",
+    "StackBloqueante",
+    "QueueBloqueante",
+    "QueuePersistente",
+    "PriorityQueueBloqueante",
+]
@@ -4,7 +4,7 @@ import typing, collections
 # interno
 from bot.formatos import Json
 from bot.sistema import Caminho
-from bot.estruturas.string import String
+from bot.estruturas.string import String, normalizar_texto
 # externo
 import win32api, win32con
 
@@ -15,7 +15,10 @@ class Coordenada:
     - `x` Posição horizontal do canto superior esquerdo
     - `y` Posição vertical do canto superior esquerdo
     - `largura` Largura da área, a partir do `x`
-    - `altura` Altura da área, a partir do `y`"""
+    - `altura` Altura da área, a partir do `y`
+    - Utilizar `bot.imagem.Coordenadas` para operações em lote"""
+
+    __slots__ = ("x", "y", "largura", "altura")
 
     x: int
     y: int
@@ -46,8 +49,16 @@ class Coordenada:
     def __repr__ (self) -> str:
         return f"<Coordenada(x={self.x}, y={self.y}, largura={self.largura}, altura={self.altura})>"
 
+    @property
+    def __dict__ (self) -> dict[str, int]: # type: ignore
+        """Representação em `dict` utilizada na serialização"""
+        return { "x": self.x, "y": self.y, "largura": self.largura, "altura": self.altura }
+
     def __eq__ (self, value: object) -> bool:
-        return self.__dict__ == value.__dict__  if isinstance(value, Coordenada) else False
+        return (
+            self.x == value.x and self.y == value.y and self.largura == value.largura and self.altura == value.altura
+            if isinstance(value, Coordenada) else False
+        )
 
     def __len__ (self) -> int:
         return 4
@@ -77,7 +88,7 @@ class Coordenada:
         ))
 
     def __hash__ (self) -> int:
-        return hash(tuple(self))
+        return hash((self.x, self.y, self.largura, self.altura))
 
     def __iadd__ (self, value: object) -> Coordenada:
         """Adicionar o `X, Y` da coordenada de `value`
@@ -238,27 +249,95 @@ class DictNormalizado[T] (collections.UserDict[str, T]):
         return self.data
 
     def __getitem__ (self, chave: str) -> T:
-        return super().__getitem__(str(String(chave).normalizar()))
+        return super().__getitem__(normalizar_texto(chave))
 
     def __setitem__ (self, chave: str, valor: T) -> None:
-        super().__setitem__(str(String(chave).normalizar()), valor)
+        super().__setitem__(normalizar_texto(chave), valor)
 
     def __delitem__ (self, chave: str) -> None:
-        super().__delitem__(str(String(chave).normalizar()))
+        super().__delitem__(normalizar_texto(chave))
 
     def __contains__ (self, chave: object) -> bool:
         return (
             False if not isinstance(chave, str)
-            else super().__contains__(str(String(chave).normalizar()))
+            else super().__contains__(normalizar_texto(chave))
         )
 
     def stringify (self, indentar: bool = False) -> str:
         """Transformar para um objeto json"""
         return Json(self.data).stringify(indentar)
 
+class DictNormalizadoCongelado[T] (DictNormalizado[T]):
+    """Versão imutável do `DictNormalizado` para dados criados uma única vez e consultados várias
+    - Chaves normalizadas apenas na criação
+    - Tabela lateral `chave original -> chave normalizada` para consultas repetidas em `O(1)`
+        - Limitada em `TAMANHO_TABELA_CHAVES` chaves consultadas
+    - Alterações resultam em `TypeError`. Utilizar o `copy()` para obter um `DictNormalizado` alterável"""
+
+    TAMANHO_TABELA_CHAVES = 1024
+
+    def __init__ (self, d: typing.Mapping[str, T] | None = None) -> None:
+        collections.UserDict.__init__(self)
+        self.__chaves = dict[str, str]()
+        for chave, valor in (d or {}).items():
+            self.data[self.__normalizar(chave)] = valor
+
+    def __repr__ (self) -> str:
+        return f"<DictNormalizadoCongelado[T] com {len(self)} chave(s)>"
+
+    def __normalizar (self, chave: str) -> str:
+        """Obter a chave normalizada pela tabela lateral ou normalizar e adicionar na tabela"""
+        try: return self.__chaves[chave]
+        except KeyError: pass
+        normalizada = normalizar_texto(chave)
+        if len(self.__chaves) < self.TAMANHO_TABELA_CHAVES:
+            self.__chaves[chave] = normalizada
+        return normalizada
+
+    def __getitem__ (self, chave: str) -> T:
+        return self.data[self.__normalizar(chave)]
+
+    def __contains__ (self, chave: object) -> bool:
+        return isinstance(chave, str) and self.__normalizar(chave) in self.data
+
+    def get (self, chave: str, default: typing.Any = None) -> typing.Any:
+        return self.data.get(self.__normalizar(chave), default)
+
+    def __setitem__ (self, chave: str, valor: T) -> None:
+        raise TypeError(f"{self!r} não permite alterações")
+
+    def __delitem__ (self, chave: str) -> None:
+        raise TypeError(f"{self!r} não permite alterações")
+
+    # Métodos que alteram o `data` sem passar pelo `__setitem__` ou `__delitem__`
+    # Sobrescritos também os do `MutableMapping` para não depender da implementação do `UserDict`
+
+    def __ior__ (self, outro: typing.Any) -> typing.Self:
+        raise TypeError(f"{self!r} não permite alterações")
+
+    def update (self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        raise TypeError(f"{self!r} não permite alterações")
+
+    def setdefault (self, chave: str, default: typing.Any = None) -> typing.Any:
+        raise TypeError(f"{self!r} não permite alterações")
+
+    def pop (self, chave: str, *default: typing.Any) -> typing.Any:
+        raise TypeError(f"{self!r} não permite alterações")
+
+    def popitem (self) -> tuple[str, T]:
+        raise TypeError(f"{self!r} não permite alterações")
+
+    def clear (self) -> None:
+        raise TypeError(f"{self!r} não permite alterações")
+
+    def copy (self) -> DictNormalizado[T]:
+        """Cópia alterável no formato `DictNormalizado`"""
+        return DictNormalizado(self.data)
+
 __all__ = [
     "Caminho",
     "Resultado",
     "Coordenada",
     "DictNormalizado",
+    "DictNormalizadoCongelado",
 ]
\ No newline at end of file
@@ -1,6 +1,42 @@
 # std
 from __future__ import annotations
-import re, typing, difflib, unicodedata
+import re, heapq, typing, difflib, functools, unicodedata, collections
+
+TAMANHO_CACHE_NORMALIZACAO = 2 ** 16
+"""Quantidade máxima de textos mantidos no cache do `normalizar_texto()`"""
+
+TABELA_NORMALIZACAO = str.maketrans({
+    caractere: "_" if re.fullmatch(r"\s", caractere) else None
+    for caractere in map(chr, range(128))
+    if re.fullmatch(r"\W", caractere)
+})
+"""Tabela do `str.translate` para os caracteres `ASCII`
+- Espaços para `_` e remoção dos caracteres `!=` `a-zA-Z0-9_`"""
+
+TABELA_CARACTERES_PARECIDOS = str.maketrans("l1!0dq", "iiiooo")
+"""Tabela do `str.translate` dos caracteres parecidos em `OCR` do `String.encontrar_texto()`"""
+
+@functools.lru_cache(maxsize=TAMANHO_CACHE_NORMALIZACAO)
+def normalizar_texto (texto: str) -> str:
+    """Implementação do `String.normalizar()` com cache LRU limitado em `TAMANHO_CACHE_NORMALIZACAO`
+    - Texto `ASCII` não necessita da remoção de acentuação
+    - Espaços e caracteres removidos em uma única passagem pela `TABELA_NORMALIZACAO`"""
+    texto = str(texto).strip().lower()
+    if not texto.isascii():
+        texto = unicodedata.normalize("NFKD", texto).encode("ASCII", "ignore").decode()
+    texto = texto.translate(TABELA_NORMALIZACAO)
+    return String.PATTERN_UNDERLINES.sub("_", texto) if "__" in texto else texto
+
+def calcular_similaridade (a: str, b: str, minima: float | None = None) -> float:
+    """Similaridade do `String.encontrar_texto()` entre textos normalizados
+    - Algorítimo `gestalt pattern matching` punindo `0.1` por caractere de diferença no tamanho
+    - `minima` retornar antecipadamente o limite superior, já abaixo da `minima`, sem calcular a similaridade completa"""
+    punicao_tamanho = abs((len(a) - len(b)) * 0.1)
+    matcher = difflib.SequenceMatcher(None, a, b)
+    if minima is not None:
+        for limite in (matcher.real_quick_ratio, matcher.quick_ratio):
+            if (similaridade := limite() - punicao_tamanho) < minima: return similaridade
+    return matcher.ratio() - punicao_tamanho
 
 class String (str):
     """Extensão da classe nativa `str` com utilitários adicionais,
@@ -65,14 +101,9 @@ class String (str):
         return String(ascii.decode("utf-8", "ignore"))
 
     def normalizar (self) -> String:
-        """Strip, lower, replace espaços por underline, remoção de acentuação e remoção de caracteres `!=` `a-zA-Z0-9_`"""
-        return (
-            String(self.strip().lower())
-            .remover_acentuacao()
-            .re_replace(self.PATTERN_ESPACOS, "_")
-            .re_replace(self.PATTERN_NOTWORD, "")
-            .re_replace(self.PATTERN_UNDERLINES, "_")
-        )
+        """Strip, lower, replace espaços por underline, remoção de acentuação e remoção de caracteres `!=` `a-zA-Z0-9_`
+        - Resultado mantido em cache pelo `normalizar_texto()`"""
+        return String(normalizar_texto(self))
 
     def __contains__ (self, key: str) -> bool:
         """Checar se `str in String()` em sua versão normalizada"""
@@ -95,7 +126,8 @@ class String (str):
             3. normalizado com replace de caracteres parecidos
             4. similaridade entre textos usando `difflib.SequenceMatcher` com o valor `similaridade_minima`
                 - `similaridade_minima` entre 0.0 e 1.0
-                - `similaridade_minima=0` para desativar"""
+                - `similaridade_minima=0` para desativar
+        - Utilizar o `IndiceTexto` para buscas repetidas ou com muitas opções"""
         opcoes = list(opcoes)
         key_to_text = key or (lambda opcao: opcao)
         textos = list[str](key_to_text(opcao) for opcao in opcoes)
@@ -122,10 +154,121 @@ class String (str):
         # algorítimo `gestalt pattern matching`
         # punir uma quantidade se tiver diferença no tamanho
         if not similaridade_minima: return
-        def calcular_similaridade (a: str, b: str) -> float:
-            punicao_tamanho = abs((len(a) - len(b)) * 0.1)
-            return difflib.SequenceMatcher(None, a, b).ratio() - punicao_tamanho
-
         similaridades = [calcular_similaridade(texto_normalizado, t) for t in textos_normalizados]
         maior = max(similaridades) if similaridades else 0
         return opcoes[similaridades.index(maior)] if maior >= similaridade_minima else None
+
+def trigramas (texto: str) -> set[str]:
+    """Trigramas do `texto` com delimitadores de início e fim"""
+    texto = f" {texto} "
+    return { texto[i : i + 3] for i in range(len(texto) - 2) }
+
+class IndiceTexto [T]:
+    """Índice reutilizável para o `String.encontrar_texto()` em grandes quantidades de opções
+    - Formas normalizadas e com replace de caracteres parecidos pré-calculadas na criação
+    - Mesma ordem dos métodos de procura do `String.encontrar_texto()`
+    - Similaridade calculada apenas nos `candidatos` com tamanho compatível e mais trigramas em comum
+        - `candidatos=0` para calcular em todas as opções com tamanho compatível, mesmo resultado do `String.encontrar_texto()`
+
+    ```
+    indice = IndiceTexto(produtos, key=lambda produto: produto.nome)
+    produto = indice.encontrar(texto_ocr)
+    for produto, similaridade in indice.buscar(texto_ocr, k=5): ...
+    ```"""
+
+    def __init__ (self, opcoes: typing.Iterable[T],
+                        key: typing.Callable[[T], str] | None = None,
+                        candidatos: int = 200) -> None:
+        self.opcoes = list(opcoes)
+        self.candidatos = max(0, candidatos)
+        key_to_text = key or (lambda opcao: typing.cast(str, opcao))
+
+        self.textos = [str(key_to_text(opcao)) for opcao in self.opcoes]
+        self.normalizados = [normalizar_texto(texto) for texto in self.textos]
+        self.__exatos = dict[str, int]()
+        self.__normalizados = dict[str, int]()
+        self.__parecidos = dict[str, int]()
+        self.__tamanhos = collections.defaultdict[int, list[int]](list)
+        self.__trigramas = collections.defaultdict[str, list[int]](list)
+
+        for indice, (texto, normalizado) in enumerate(zip(self.textos, self.normalizados)):
+            self.__exatos.setdefault(texto, indice)
+            self.__normalizados.setdefault(normalizado, indice)
+            self.__parecidos.setdefault(self.__parecido(normalizado), indice)
+            self.__tamanhos[len(normalizado)].append(indice)
+            for trigrama in trigramas(normalizado):
+                self.__trigramas[trigrama].append(indice)
+
+    def __repr__ (self) -> str:
+        return f"<IndiceTexto com {len(self)} opção(ões)>"
+
+    def __len__ (self) -> int:
+        return len(self.opcoes)
+
+    @staticmethod
+    def __parecido (normalizado: str) -> str:
+        return normalizado.translate(TABELA_CARACTERES_PARECIDOS).replace("rn", "m")
+
+    def __exato (self, texto: str) -> int | None:
+        """Métodos de procura 1, 2 e 3"""
+        normalizado = normalizar_texto(texto)
+        for chave, indices in ((texto, self.__exatos),
+                               (normalizado, self.__normalizados),
+                               (self.__parecido(normalizado), self.__parecidos)):
+            if (indice := indices.get(chave)) is not None:
+                return indice
+
+    def __similares (self, texto: str, similaridade_minima: float) -> list[tuple[float, int]]:
+        """Método de procura 4 ordenado pela maior similaridade e, em empate, pela ordem das opções"""
+        normalizado = normalizar_texto(texto)
+        # A punição pelo tamanho impede a similaridade mínima acima dessa diferença
+        diferenca = int((1.0 - similaridade_minima) / 0.1 + 1e-9)
+        compativeis = [
+            indice
+            for tamanho in range(max(0, len(normalizado) - diferenca), len(normalizado) + diferenca + 1)
+            for indice in self.__tamanhos.get(tamanho, [])
+        ]
+
+        if self.candidatos and len(compativeis) > self.candidatos:
+            permitidos, contagem = set(compativeis), collections.Counter[int]()
+            for trigrama in trigramas(normalizado):
+                contagem.update(i for i in self.__trigramas.get(trigrama, []) if i in permitidos)
+            compativeis = [indice for indice, _ in heapq.nsmallest(
+                self.candidatos, contagem.items(), key=lambda item: (-item[1], item[0])
+            )]
+
+        similares = list[tuple[float, int]]()
+        for indice in compativeis:
+            similaridade = calcular_similaridade(normalizado, self.normalizados[indice], similaridade_minima)
+            if similaridade >= similaridade_minima:
+                similares.append((similaridade, indice))
+
+        similares.sort(key=lambda item: (-item[0], item[1]))
+        return similares
+
+    def buscar (self, texto: str,
+                      similaridade_minima: float = 0.75,
+                      k: int = 5) -> list[tuple[T, float]]:
+        """Obter as `k` melhores opções para o `texto` com a similaridade
+        - Opção encontrada pelos métodos de procura 1, 2 ou 3 retornada primeiro com similaridade `1.0`
+        - Demais ordenadas pela similaridade do método 4 igual ou acima da `similaridade_minima`"""
+        resultado = list[tuple[T, float]]()
+        exato = self.__exato(texto)
+        if exato is not None:
+            resultado.append((self.opcoes[exato], 1.0))
+        if similaridade_minima and len(resultado) < k:
+            resultado.extend(
+                (self.opcoes[indice], round(similaridade, 6))
+                for similaridade, indice in self.__similares(texto, similaridade_minima)
+                if indice != exato
+            )
+        return resultado[:k]
+
+    def encontrar (self, texto: str, similaridade_minima: float = 0.75) -> T | None:
+        """Encontrar a melhor opção para o `texto` com a mesma semântica do `String.encontrar_texto()`
+        - `None` caso nenhuma opção gerou um resultado satisfatório"""
+        exato = self.__exato(texto)
+        if exato is not None: return self.opcoes[exato]
+        if not similaridade_minima: return None
+        similares = self.__similares(texto, similaridade_minima)
+        return self.opcoes[similares[0][1]] if similares else None
@@ -0,0 +1,3 @@
+"""Pacote para processar itens de forma concorrente com as primitivas do `bot`"""
+
+from bot.execucao.setup import *
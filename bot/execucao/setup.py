@@ -0,0 +1,256 @@
+# std
+from __future__ import annotations
+import time, queue, typing, threading, dataclasses, multiprocessing
+from concurrent.futures import Future, Executor, ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+# interno
+import bot
+from bot.estruturas import Resultado
+from bot.logger.metricas import Histograma
+from bot.logger.setup import MainLogger, TracerLogger
+
+LOCAL = threading.local()
+
+def tracer_atual () -> TracerLogger | None:
+    """Obter o `TracerLogger` do item sendo processado na thread atual
+    - Disponível apenas no `ExecutorItens` com `processos=False`"""
+    return getattr(LOCAL, "tracer", None)
+
+def lancar (erro: Exception) -> typing.NoReturn:
+    raise erro
+
+def inicializar_worker (inicios: queue.SimpleQueue[tuple[int, float]] | multiprocessing.Queue | None) -> None: # type: ignore
+    """Inicializar a thread ou processo do pool com a fila dos inícios de execução dos itens
+    - `None` caso não seja necessário informar os inícios"""
+    LOCAL.inicios = inicios
+
+def executar_item[I, R] (funcao: typing.Callable[[I], R],
+                         indice: int,
+                         item: I,
+                         tentativas: int,
+                         segundos_retry: float,
+                         tracer: TracerLogger | None = None) -> tuple[R | None, Exception | None, float]:
+    """Executar a `funcao` com o `item` aplicando o `bot.erro.retry`
+    - Executado na thread ou processo do pool
+    - Informado o `(indice, time.time())` do início na fila do `inicializar_worker()` para o `timeout`
+    - `retry` aplicado no próprio worker pois a função decorada não é serializável para o `ProcessPoolExecutor`
+    - Retornado `(valor, erro, segundos)`"""
+    if (inicios := getattr(LOCAL, "inicios", None)) is not None:
+        inicios.put((indice, time.time()))
+    LOCAL.tracer = tracer
+    cronometro = bot.tempo.Cronometro(6)
+    try:
+        if tentativas > 1: funcao = bot.erro.retry(tentativas=tentativas, segundos=segundos_retry)(funcao)
+        return funcao(item), None, cronometro()
+    except Exception as erro:
+        return None, erro, cronometro()
+    finally:
+        LOCAL.tracer = None
+
+@dataclasses.dataclass
+class ResultadoItem[I, R]:
+    """Resultado do processamento de um item pelo `ExecutorItens`"""
+
+    indice: int
+    """Posição do item no iterável"""
+    item: I
+    """Item processado"""
+    resultado: Resultado[R]
+    """Retorno ou `Exception` da função"""
+    segundos: float
+    """Duração do processamento incluindo as tentativas"""
+
+@dataclasses.dataclass
+class RelatorioExecucao[I, R]:
+    """Relatório do `ExecutorItens.executar()`"""
+
+    resultados: list[ResultadoItem[I, R]]
+    """Resultados na ordem dos itens"""
+    segundos: float
+    """Duração total da execução"""
+    latencias: Histograma
+    """Histograma das durações de cada item"""
+
+    def __repr__ (self) -> str:
+        return f"<RelatorioExecucao sucessos={self.sucessos} falhas={self.falhas} segundos={self.segundos}>"
+
+    @property
+    def sucessos (self) -> int:
+        """Quantidade de itens com sucesso"""
+        return sum(1 for r in self.resultados if r.resultado)
+
+    @property
+    def falhas (self) -> int:
+        """Quantidade de itens com erro, incluindo os `timeouts`"""
+        return len(self.resultados) - self.sucessos
+
+    @property
+    def timeouts (self) -> int:
+        """Quantidade de itens que ultrapassaram o `timeout`"""
+        return sum(1 for r in self.resultados if not r.resultado and isinstance(r.resultado.erro(), TimeoutError))
+
+    @property
+    def itens_por_segundo (self) -> float:
+        """Vazão da execução"""
+        return round(len(self.resultados) / self.segundos, 3) if self.segundos else 0.0
+
+    def resumo (self) -> dict[str, float]:
+        """Resumo com `itens, sucessos, falhas, timeouts, segundos, itens_por_segundo, p50, p95, p99`"""
+        latencias = self.latencias.resumo()
+        return {
+            "itens": len(self.resultados),
+            "sucessos": self.sucessos,
+            "falhas": self.falhas,
+            "timeouts": self.timeouts,
+            "segundos": self.segundos,
+            "itens_por_segundo": self.itens_por_segundo,
+            "p50": latencias["p50"],
+            "p95": latencias["p95"],
+            "p99": latencias["p99"],
+        }
+
+class ExecutorItens[I, R]:
+    """Processar itens de forma concorrente em um pool de threads ou processos
+    - `funcao` chamada com cada item e seu retorno capturado em um `Resultado`
+    - `workers` quantidade de threads ou processos do pool
+    - `tentativas` e `segundos_retry` aplicados pelo `bot.erro.retry` em cada item
+    - `timeout` segundos máximos de processamento de um item, contados a partir do início da execução informado pelo worker
+        - Itens aguardando na fila do pool não consomem o `timeout`
+        - O item é considerado com `TimeoutError`, porém a thread ou processo continua até o retorno da `funcao`
+        - Enquanto isso o worker permanece ocupado, reduzindo a concorrência efetiva do pool
+    - `maximo_em_andamento` itens enviados ao pool simultaneamente. `Default:` o dobro dos `workers`
+        - O iterável de itens é consumido sob demanda
+    - `processos` para utilizar o `ProcessPoolExecutor`. A `funcao` e os itens devem ser serializáveis
+    - Um `TracerLogger` por item com as propriedades `indice` e `item`, encerrado conforme o resultado
+        - Disponível pelo `bot.execucao.tracer_atual()` dentro da `funcao` com `processos=False`
+    - Resumo com vazão, percentis de latência e falhas loggado ao final
+
+    ```
+    executor = ExecutorItens(processar, workers=4, tentativas=3, timeout=60)
+    relatorio = executor.executar(itens)
+    for resultado in relatorio.resultados:
+        if not resultado.resultado: ...
+    ```"""
+
+    def __init__ (self, funcao: typing.Callable[[I], R],
+                        workers: int = 4,
+                        tentativas: int = 1,
+                        segundos_retry: float = 0.0,
+                        timeout: float | None = None,
+                        maximo_em_andamento: int | None = None,
+                        processos: bool = False,
+                        logger: MainLogger | None = None) -> None:
+        assert workers >= 1, "O ExecutorItens espera workers >= 1"
+        assert tentativas >= 1 and segundos_retry >= 0.0, "O ExecutorItens espera tentativas >= 1 e segundos_retry >= 0.0"
+        self.funcao = funcao
+        self.workers = workers
+        self.tentativas = tentativas
+        self.segundos_retry = segundos_retry
+        self.timeout = timeout or None
+        self.maximo_em_andamento = max(1, maximo_em_andamento or workers * 2)
+        self.processos = processos
+        self.logger = logger or bot.logger
+
+    def __repr__ (self) -> str:
+        return f"<ExecutorItens funcao='{getattr(self.funcao, "__name__", self.funcao)}' workers={self.workers} processos={self.processos}>"
+
+    def __criar_pool (self, inicios: queue.SimpleQueue[tuple[int, float]] | multiprocessing.Queue | None) -> Executor: # type: ignore
+        if self.processos: return ProcessPoolExecutor(self.workers, initializer=inicializar_worker, initargs=(inicios,))
+        return ThreadPoolExecutor(self.workers, "bot-execucao", initializer=inicializar_worker, initargs=(inicios,))
+
+    def executar (self, itens: typing.Iterable[I]) -> RelatorioExecucao[I, R]:
+        """Processar os `itens` e aguardar a finalização de todos
+        - Retornado o relatório com os resultados na ordem dos itens"""
+        nome = getattr(self.funcao, "__name__", str(self.funcao))
+        self.logger.informar(f"Iniciando a execução dos itens pela função({nome})", workers=self.workers)
+
+        cronometro, latencias = bot.tempo.Cronometro(), Histograma()
+        resultados = dict[int, ResultadoItem[I, R]]()
+        pendentes = dict[Future, tuple[int, I, TracerLogger]]()
+        # indice -> `time.time()` do início da execução informado pelo worker
+        # `future.running()` não é utilizado pois no `ProcessPoolExecutor` é verdadeiro já na fila interna do pool
+        inicios = dict[int, float]()
+        fila_inicios = None if not self.timeout else multiprocessing.Queue() if self.processos else queue.SimpleQueue[tuple[int, float]]()
+
+        def finalizar (indice: int, item: I, tracer: TracerLogger,
+                       valor: R | None, erro: Exception | None, segundos: float) -> None:
+            latencias.registrar(segundos)
+            if erro is None:
+                resultados[indice] = ResultadoItem(indice, item, Resultado(lambda: typing.cast(R, valor)), segundos)
+                tracer.encerrar("SUCCESS", "Item processado com sucesso", segundos=segundos)
+            else:
+                resultados[indice] = ResultadoItem(indice, item, Resultado(lancar, erro), segundos)
+                tracer.encerrar("ERROR", "Item processado com erro", excecao=erro, segundos=segundos)
+
+        def coletar (bloquear: bool) -> None:
+            intervalo = (0.05 if self.timeout else None) if bloquear else 0
+            concluidos, _ = wait(pendentes, intervalo, FIRST_COMPLETED)
+            for future in concluidos:
+                indice, item, tracer = pendentes.pop(future)
+                inicios.pop(indice, None)
+                try: valor, erro, segundos = future.result()
+                except Exception as e: valor, erro, segundos = None, e, 0.0
+                finalizar(indice, item, tracer, valor, erro, segundos)
+
+            if fila_inicios is None: return
+            while True:
+                try: indice, inicio = fila_inicios.get_nowait()
+                except queue.Empty: break
+                inicios[indice] = inicio
+
+            agora = time.time()
+            for future, (indice, item, tracer) in list(pendentes.items()):
+                inicio = inicios.get(indice)
+                if inicio is None or agora - inicio < self.timeout: continue
+                future.cancel()
+                del pendentes[future], inicios[indice]
+                erro = TimeoutError(f"Item ultrapassou o timeout de {self.timeout} segundo(s), o worker permanece ocupado até o retorno da função")
+                finalizar(indice, item, tracer, None, erro, agora - inicio)
+
+        pool = self.__criar_pool(fila_inicios)
+        try:
+            for indice, item in enumerate(itens):
+                while len(pendentes) >= self.maximo_em_andamento:
+                    coletar(True)
+                tracer = self.logger.obter_tracer(indice=indice, item=str(item))
+                future = pool.submit(
+                    executar_item, self.funcao, indice, item, self.tentativas, self.segundos_retry,
+                    None if self.processos else tracer
+                )
+                pendentes[future] = (indice, item, tracer)
+            while pendentes:
+                coletar(True)
+        # Não aguardar os itens que ultrapassaram o timeout
+        finally: pool.shutdown(wait=not self.timeout, cancel_futures=True)
+
+        relatorio = RelatorioExecucao(
+            [resultados[indice] for indice in sorted(resultados)],
+            cronometro(),
+            latencias
+        )
+        self.logger.informar(f"Finalizado a execução dos itens pela função({nome})", **relatorio.resumo())
+        return relatorio
+
+def executar_itens[I, R] (funcao: typing.Callable[[I], R],
+                          itens: typing.Iterable[I],
+                          workers: int = 4,
+                          tentativas: int = 1,
+                          segundos_retry: float = 0.0,
+                          timeout: float | None = None,
+                          processos: bool = False) -> RelatorioExecucao[I, R]:
+    """Atalho para o `ExecutorItens(funcao, ...).executar(itens)`"""
+    return ExecutorItens(
+        funcao,
+        workers = workers,
+        tentativas = tentativas,
+        segundos_retry = segundos_retry,
+        timeout = timeout,
+        processos = processos
+    ).executar(itens)
+
+__all__ = [
+    "ResultadoItem",
+    "ExecutorItens",
+    "tracer_atual",
+    "executar_itens",
+    "RelatorioExecucao",
+]
@@ -182,23 +182,26 @@ class Json:
             case _:
                 raise ValueError(f"Tentado Unmarshal do JSON para tipo inesperado '{cls}'")
 
+    @staticmethod
+    def serializar_objeto (obj: Any) -> Any:
+        """Transformar `obj` não suportado pelo `json` em um valor serializável
+        - Utilizado como `default` do encoder"""
+        if type(obj) in (int, float, str, bool, type(None)): return obj
+        if isinstance(obj, datetime.datetime): return obj.isoformat(sep="T", timespec="seconds")
+        if isinstance(obj, datetime.time): return obj.isoformat(timespec="seconds")
+        if isinstance(obj, datetime.date): return obj.isoformat()
+        if isinstance(obj, Decimal): return float(obj)
+        if hasattr(obj, "__dict__"): return obj.__dict__
+        if hasattr(obj, "__iter__"): return [Json.serializar_objeto(item) for item in obj]
+        if hasattr(obj, "__str__"): return obj.__str__()
+        raise TypeError(f"Tipo inesperado para ser transformado em json: '{type(obj)}'")
+
     def stringify (self, indentar: bool = False) -> str:
         """Transformar o item para o formato string"""
-        def tratamentos (obj: Any) -> Any:
-            if type(obj) in (int, float, str, bool, type(None)): return obj
-            if isinstance(obj, datetime.datetime): return obj.isoformat(sep="T", timespec="seconds")
-            if isinstance(obj, datetime.time): return obj.isoformat(timespec="seconds")
-            if isinstance(obj, datetime.date): return obj.isoformat()
-            if isinstance(obj, Decimal): return float(obj)
-            if hasattr(obj, "__dict__"): return obj.__dict__
-            if hasattr(obj, "__iter__"): return [tratamentos(item) for item in obj]
-            if hasattr(obj, "__str__"): return obj.__str__()
-            raise TypeError(f"Tipo inesperado para ser transformado em json: '{type(obj)}'")
-
         return jsonlib.dumps(
             self.__item,
             ensure_ascii = False,
-            default = tratamentos,
+            default = Json.serializar_objeto,
             indent = 4 if indentar else None
         )
 
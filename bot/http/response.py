@@ -2,7 +2,7 @@
 import typing
 # externo
 import httpx
-from bot.estruturas import DictNormalizado
+from bot.estruturas import DictNormalizadoCongelado
 from bot.formatos import Json, ElementoXML
 
 class ResponseHttp (httpx.Response):
@@ -30,10 +30,14 @@ class ResponseHttp (httpx.Response):
         }
 
     @property
-    def headers (self) -> DictNormalizado[str]:
+    def headers (self) -> DictNormalizadoCongelado[str]: # type: ignore
         """Headers com chaves normalizadas
-        - Caso existam múltiplos headers de mesmo nome, os valores serão concatenados por `,`"""
-        return DictNormalizado(self.headers_dict)
+        - Caso existam múltiplos headers de mesmo nome, os valores serão concatenados por `,`
+        - Criado uma única vez por response"""
+        try: return self.__headers
+        except AttributeError: pass
+        self.__headers = DictNormalizadoCongelado(self.headers_dict)
+        return self.__headers
 
     def esperar_sucesso (self, mensagem: str | None = None) -> typing.Self:
         """Fazer o `assert` se o `response.status_code` de retorno é `2xx`
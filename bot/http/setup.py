@@ -17,13 +17,13 @@ class Url:
     schema: str
     host: str
     path: str
-    query: bot.estruturas.DictNormalizado[list[str]]
+    query: bot.estruturas.DictNormalizadoCongelado[list[str]]
     url: str
 
     def __init__ (self, url: str) -> None:
         self.url, parse = url, urlparse(url)
         self.schema, self.host = parse.scheme, parse.hostname or ""
-        self.path, self.query = parse.path, bot.estruturas.DictNormalizado(parse_qs(parse.query))
+        self.path, self.query = parse.path, bot.estruturas.DictNormalizadoCongelado(parse_qs(parse.query))
 
     def __repr__ (self) -> str:
         return f"<Url '{self.url}'>"
@@ -1,6 +1,9 @@
 """Pacote agregador para ações envolvendo imagens
 ## Dependência `bot[imagem]` necessária para utilizar `Imagem`
-## Dependência `bot[ocr]` necessária para utilizar `LeitorOCR` e `Imagem`"""
+## Dependência `bot[ocr]` necessária para utilizar `LeitorOCR`, `ServidorOCR` e `Imagem`"""
 
 from bot.imagem.setup import *
-from bot.imagem.ocr import *
\ No newline at end of file
+from bot.imagem.coordenadas import *
+from bot.imagem.pipeline import *
+from bot.imagem.ocr import *
+from bot.imagem.servidor_ocr import *
\ No newline at end of file
@@ -0,0 +1,20 @@
+import bot
+from bot.imagem.servidor_ocr import ServidorOCR, ENDERECO_SERVIDOR_OCR
+
+print(
+    "",
+    "# ------------------------------------------------------------------- #",
+    "# Executando módulo 'bot.imagem'                                      #",
+    "# Servidor OCR compartilhando os modelos do `LeitorOCR` na máquina    #",
+    "# Argumentos: [linguagens] [--gpu] [--porta 47861]                    #",
+    "# CTRL + C no terminal para encerrar                                  #",
+    "# ------------------------------------------------------------------- #",
+    "",
+    sep = "\n"
+)
+
+ServidorOCR(
+    *bot.argumentos.posicionais(),
+    gpu = bot.argumentos.nomeado_existe("gpu"),
+    endereco = (ENDERECO_SERVIDOR_OCR[0], bot.argumentos.nomeado_ou("porta", ENDERECO_SERVIDOR_OCR[1])),
+).executar()
@@ -0,0 +1,220 @@
+# std
+from __future__ import annotations
+import typing
+# interno
+from bot.estruturas import Coordenada
+# externo opcionais [imagem]
+try: import numpy as np
+except ImportError: raise ImportError(
+    "Dependência opcional 'bot[imagem]' necessária. "
+    "Instale como 'bot[imagem]' para utilizar o módulo 'bot.imagem'"
+)
+
+CAMPOS_COORDENADAS = ("x", "y", "largura", "altura")
+"""Colunas do array das `Coordenadas`"""
+
+class Coordenadas:
+    """Coleção de `Coordenada` armazenada em um array numpy `Nx4` de `(x, y, largura, altura)`
+    - Operações de contém, interseção, IoU, deslocamento e ordenação vetorizadas
+    - Indexação por `int` retorna uma `Coordenada`, por `slice`, máscara ou índices retorna `Coordenadas`
+
+    ```
+    coordenadas = Coordenadas([Coordenada(...), (x, y, largura, altura), ...])
+    Coordenadas.from_boxes(np.array([[x1, y1, x2, y2], ...]))
+
+    coordenadas.contem(coordenada)          # Máscara das coordenadas que contém o centro da `coordenada`
+    coordenadas.centros_em(regiao)          # Máscara das coordenadas com o centro dentro da `regiao`
+    coordenadas.intersecao(outras)          # Matriz `NxM` das áreas de interseção
+    coordenadas.iou(outras)                 # Matriz `NxM` da interseção sobre a união
+    coordenadas.deslocar(regiao)            # Novas coordenadas deslocadas pelo `x, y` da `regiao`
+    coordenadas.ordenar("y", "x")           # Novas coordenadas ordenadas pelos campos
+    coordenadas.linhas()                    # Agrupar em linhas pelo centro vertical
+    coordenadas.unir(rotulos)               # Menor coordenada que contém cada grupo de mesmo rótulo
+    coordenadas[coordenadas.areas() > 10]   # Filtrar por máscara
+    list(coordenadas)                       # Converter para `list[Coordenada]`
+    ```"""
+
+    array: np.ndarray
+    """Array `Nx4` `int64` de `(x, y, largura, altura)`"""
+
+    def __init__ (self, coordenadas: typing.Iterable[Coordenada | tuple[int, int, int, int]] | np.ndarray | None = None) -> None:
+        if isinstance(coordenadas, Coordenadas): coordenadas = coordenadas.array
+        array = np.array(
+            coordenadas if isinstance(coordenadas, np.ndarray) else [tuple(c) for c in coordenadas or ()],
+            dtype = np.int64
+        )
+        self.array = array.reshape(-1, 4)
+
+    @classmethod
+    def from_array (cls, array: np.ndarray) -> Coordenadas:
+        """Criar as coordenadas a partir de um `array` `Nx4` de `(x, y, largura, altura)` sem cópia quando possível"""
+        coordenadas = object.__new__(cls)
+        coordenadas.array = np.asarray(array, dtype=np.int64).reshape(-1, 4)
+        return coordenadas
+
+    @classmethod
+    def from_boxes (cls, boxes: np.ndarray | typing.Iterable[tuple[int, int, int, int]]) -> Coordenadas:
+        """Criar as coordenadas a partir de `boxes` `Nx4`
+        - `(x-esquerda, y-cima, x-direita, y-baixo)`"""
+        boxes = np.asarray(boxes, dtype=np.int64).reshape(-1, 4)
+        array = boxes.copy()
+        array[:, 2:] -= boxes[:, :2]
+        return cls.from_array(array)
+
+    def __repr__ (self) -> str:
+        return f"<Coordenadas com {len(self)} coordenada(s)>"
+
+    def __len__ (self) -> int:
+        return self.array.shape[0]
+
+    def __bool__ (self) -> bool:
+        return len(self) > 0
+
+    def __eq__ (self, value: object) -> bool:
+        return np.array_equal(self.array, value.array) if isinstance(value, Coordenadas) else False
+
+    def __iter__ (self) -> typing.Generator[Coordenada, None, None]:
+        for x, y, largura, altura in self.array.tolist():
+            yield Coordenada(x, y, largura, altura)
+
+    @typing.overload
+    def __getitem__ (self, indice: int) -> Coordenada: ...
+    @typing.overload
+    def __getitem__ (self, indice: slice | np.ndarray | list[int]) -> Coordenadas: ...
+    def __getitem__ (self, indice: int | slice | np.ndarray | list[int]) -> Coordenada | Coordenadas:
+        if isinstance(indice, (int, np.integer)):
+            return Coordenada(*self.array[indice].tolist())
+        return Coordenadas.from_array(self.array[indice])
+
+    def __iadd__ (self, value: object) -> Coordenadas:
+        """Adicionar o `X, Y` da coordenada de `value` em todas as coordenadas
+        - Útil para transformar regiões de imagens para a tela"""
+        if not isinstance(value, Coordenada):
+            return NotImplemented
+        self.array[:, :2] += (value.x, value.y)
+        return self
+
+    @property
+    def x (self) -> np.ndarray:
+        return self.array[:, 0]
+
+    @property
+    def y (self) -> np.ndarray:
+        return self.array[:, 1]
+
+    @property
+    def largura (self) -> np.ndarray:
+        return self.array[:, 2]
+
+    @property
+    def altura (self) -> np.ndarray:
+        return self.array[:, 3]
+
+    def to_boxes (self) -> np.ndarray:
+        """Transformar as coordenadas para um array `Nx4` de `boxes`
+        - `(x-esquerda, y-cima, x-direita, y-baixo)`"""
+        boxes = self.array.copy()
+        boxes[:, 2:] += self.array[:, :2]
+        return boxes
+
+    def areas (self) -> np.ndarray:
+        """Área de cada coordenada"""
+        return self.largura * self.altura
+
+    def centros (self) -> np.ndarray:
+        """Array `Nx2` da posição `(X, Y)` central de cada coordenada
+        - Mesmo arredondamento do `Coordenada.transformar()`"""
+        return (self.array[:, :2] + self.array[:, 2:] * 0.5).astype(np.int64)
+
+    def contem (self, item: Coordenada | tuple[int, int] | Coordenadas) -> np.ndarray:
+        """Testar se o ponto central do `item` está dentro de cada coordenada
+        - Vetorização do `item in coordenada`
+        - `Coordenada | (x, y)` máscara de tamanho `N`
+        - `Coordenadas` matriz `NxM`"""
+        match item:
+            case Coordenadas(): pontos = item.centros()
+            case Coordenada(): pontos = np.array([item.transformar()], dtype=np.int64)
+            case _: pontos = np.array([item], dtype=np.int64)
+
+        x, y = pontos[:, 0][None, :], pontos[:, 1][None, :]
+        x1, y1 = self.x[:, None], self.y[:, None]
+        mascara = (x >= x1) & (x <= x1 + self.largura[:, None]) & (y >= y1) & (y <= y1 + self.altura[:, None])
+        return mascara if isinstance(item, Coordenadas) else mascara[:, 0]
+
+    def centros_em (self, regiao: Coordenada) -> np.ndarray:
+        """Máscara das coordenadas com o ponto central dentro da `regiao`
+        - Vetorização do `coordenada in regiao`"""
+        return Coordenadas.from_array(np.array([tuple(regiao)])).contem(self)[0]
+
+    def intersecao (self, outras: Coordenadas | Coordenada) -> np.ndarray:
+        """Matriz `NxM` com a área de interseção entre cada par de coordenadas"""
+        if isinstance(outras, Coordenada): outras = Coordenadas([outras])
+        a, b = self.to_boxes(), outras.to_boxes()
+        largura = np.minimum(a[:, None, 2], b[None, :, 2]) - np.maximum(a[:, None, 0], b[None, :, 0])
+        altura = np.minimum(a[:, None, 3], b[None, :, 3]) - np.maximum(a[:, None, 1], b[None, :, 1])
+        return np.clip(largura, 0, None) * np.clip(altura, 0, None)
+
+    def iou (self, outras: Coordenadas | Coordenada) -> np.ndarray:
+        """Matriz `NxM` da interseção sobre a união entre cada par de coordenadas
+        - `0.0` quando a união possuir área `0`"""
+        if isinstance(outras, Coordenada): outras = Coordenadas([outras])
+        intersecao = self.intersecao(outras)
+        uniao = self.areas()[:, None] + outras.areas()[None, :] - intersecao
+        return np.where(uniao > 0, intersecao / np.maximum(uniao, 1), 0.0)
+
+    def deslocar (self, regiao: Coordenada | tuple[int, int]) -> Coordenadas:
+        """Criar novas coordenadas deslocadas pelo `x, y` da `regiao`"""
+        x, y, *_ = regiao
+        array = self.array.copy()
+        array[:, :2] += (x, y)
+        return Coordenadas.from_array(array)
+
+    def ordenar (self, *campos: typing.Literal["x", "y", "largura", "altura"], reverso: bool = False) -> Coordenadas:
+        """Criar novas coordenadas ordenadas de forma estável pelos `campos`
+        - Prioridade na ordem informada. Default `("y", "x")`
+        - `reverso` inverte a ordem final"""
+        campos = campos or ("y", "x")
+        assert all(campo in CAMPOS_COORDENADAS for campo in campos), f"Campos de ordenação '{campos}' inválidos"
+        # lexsort utiliza a última chave como principal
+        indices = np.lexsort([self.array[:, CAMPOS_COORDENADAS.index(campo)] for campo in reversed(campos)])
+        return self[indices[::-1] if reverso else indices]
+
+    def rotular_linhas (self, tolerancia: float | None = None) -> np.ndarray:
+        """Rotular cada coordenada com o índice da sua linha, agrupando pelo centro vertical
+        - `tolerancia` distância vertical máxima entre centros consecutivos da mesma linha
+        - Default metade da mediana das alturas, aproximando a altura dos caracteres
+        - Linhas numeradas de cima para baixo a partir de `0`"""
+        rotulos = np.zeros(len(self), np.int64)
+        if not len(self): return rotulos
+
+        tolerancia = float(np.median(self.altura)) / 2 if tolerancia is None else tolerancia
+        centros = self.y * 2 + self.altura # dobro do centro para evitar o arredondamento
+        ordem = np.argsort(centros, kind="stable")
+        rotulos[ordem[1:]] = np.cumsum(np.diff(centros[ordem]) > tolerancia * 2)
+        return rotulos
+
+    def linhas (self, tolerancia: float | None = None) -> list[Coordenadas]:
+        """Agrupar as coordenadas em linhas pelo centro vertical
+        - `tolerancia` conforme o `rotular_linhas()`
+        - Linhas ordenadas de cima para baixo e as coordenadas de cada linha pelo `x`"""
+        if not len(self): return []
+        rotulos = self.rotular_linhas(tolerancia)
+        ordem = np.lexsort((self.x, rotulos))
+        return [self[indices] for indices in np.split(ordem, np.flatnonzero(np.diff(rotulos[ordem])) + 1)]
+
+    def unir (self, rotulos: np.ndarray) -> Coordenadas:
+        """Unir as coordenadas de mesmo rótulo na menor coordenada que contém todas
+        - `rotulos` índices `0..K-1` de cada coordenada, como o do `rotular_linhas()`
+        - Retornado `K` coordenadas na ordem dos rótulos"""
+        rotulos = np.asarray(rotulos, dtype=np.int64)
+        assert rotulos.shape == (len(self),), "Necessário um rótulo para cada coordenada"
+        boxes = self.to_boxes()
+        uniao = np.empty((int(rotulos.max()) + 1 if len(rotulos) else 0, 4), np.int64)
+        uniao[:, :2], uniao[:, 2:] = np.iinfo(np.int64).max, np.iinfo(np.int64).min
+        for coluna, funcao in enumerate((np.minimum, np.minimum, np.maximum, np.maximum)):
+            funcao.at(uniao[:, coluna], rotulos, boxes[:, coluna])
+        return Coordenadas.from_boxes(uniao)
+
+__all__ = [
+    "Coordenadas",
+]
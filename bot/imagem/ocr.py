@@ -1,9 +1,9 @@
 # std
 from __future__ import annotations
-import typing, functools, warnings
+import typing, hashlib, functools, itertools, threading, warnings, collections
 # interno
 from bot.estruturas import String
-from bot.imagem import Coordenada, Imagem, capturar_tela
+from bot.imagem import Coordenada, Coordenadas, Imagem, PipelineImagem, capturar_tela
 # externo opcional [ocr]
 try: import numpy as np # type: ignore
 except ImportError: pass
@@ -22,7 +22,10 @@ class LeitorOCR:
     # Default utilizado a linguagem `en`, que é o mais otimizado, e sem `gpu`
     leitor = LeitorOCR()
     # O EasyOCR é custoso na inicialização
-    # Utilizar sistema de cache ou constante para evitar ficar inicializando múltiplas vezes
+    # Obter a instância compartilhada no processo, criada e aquecida apenas na primeira vez
+    leitor = LeitorOCR.obter("en")
+    # Utilizar os modelos carregados pelo `ServidorOCR` em execução na máquina
+    leitor = LeitorOCR.conectar()
     ```
 
     ### Parâmetros
@@ -33,6 +36,8 @@ class LeitorOCR:
     leitor.slope_ths    # Filtrar caixas de texto menor que o valor mínimo em pixels
     leitor.width_ths    # Distância horizontal máxima para mesclar caixas
     leitor.allowlist    # Caracteres permitidos a serem retornados pelos métodos de leitura
+    leitor.batch_size   # Quantidade de regiões reconhecidas por lote no reconhecimento em lote
+    leitor.tamanho_cache # Quantidade máxima de textos memorizados pelo hash da imagem
     ```
 
     ### Detecção de Coordenadas de textos
@@ -41,6 +46,7 @@ class LeitorOCR:
     leitor.detectar_tela(Coordenada)    # Detectar coordenadas de texto em parte da tela
     leitor.detectar_imagem(imagem)      # Detectar coordenadas de texto na `imagem`
     leitor.detectar_linhas(imagem)      # Detectar coordenadas de texto na `imagem` e agrupar pela linha
+    leitor.detectar_tabela(imagem)      # Detectar os headers e a grade de células de uma tabela na `imagem`
     ```
 
     ### Extração de textos
@@ -49,6 +55,7 @@ class LeitorOCR:
     leitor.ler_tela(Coordenada)     # Extrair informações de parte da tela
     leitor.ler_imagem(imagem)       # Extrair informações da `imagem`
     leitor.ler_texto_imagem(imagem) # Ler e retornar os textos extraídos da `imagem` concatenados
+    leitor.ler_textos_imagens([...])# Ler os textos de várias imagens com o reconhecimento em lote
     leitor.ler_linhas(imagem)       # Extrair dados da `imagem` concatenando as linhas em uma `str`
 
     # Extrair as colunas e linhas da `imagem` de uma tabela
@@ -80,6 +87,15 @@ class LeitorOCR:
     allowlist: str | None = None
     """Caracteres permitidos a serem retornados pelos métodos de leitura
     - Default utilizado pelo modelo da linguagem"""
+    batch_size: int = 16
+    """Quantidade de regiões reconhecidas por lote do modelo no reconhecimento em lote"""
+    tamanho_cache: int = 512
+    """Quantidade máxima de textos memorizados pelo hash dos pixels da imagem
+    - `0` para desativar o cache"""
+
+    __instancias = dict[tuple[tuple[str, ...], bool], "LeitorOCR"]()
+    """Instâncias compartilhadas do `obter()` pela `(linguagem, gpu)`"""
+    __lock_instancias = threading.Lock()
 
     def __init__ (self, *linguagem: str, gpu: bool = False) -> None:
         try:
@@ -94,12 +110,52 @@ class LeitorOCR:
             list(linguagem) or ["en"],
             gpu = gpu
         )
+        self.cache = collections.OrderedDict[tuple, tuple[str, ...]]()
+        self.lock = threading.RLock()
+
+    def __repr__ (self) -> str:
+        return f"<LeitorOCR {type(self.reader).__name__}>"
+
+    @classmethod
+    def obter (cls, *linguagem: str, gpu: bool = False) -> LeitorOCR:
+        """Obter a instância do `LeitorOCR` compartilhada no processo para a `linguagem` e `gpu`
+        - Criada e aquecida apenas na primeira chamada, evitando carregar os modelos múltiplas vezes
+        - Chamadas concorrentes aguardam a criação da primeira
+        - Instância segura entre threads, o `cache` e as chamadas ao `reader` são protegidos pelo `lock`"""
+        chave = (tuple(linguagem) or ("en",), gpu)
+        with cls.__lock_instancias:
+            if (leitor := cls.__instancias.get(chave)) is None:
+                leitor = cls.__instancias[chave] = cls(*chave[0], gpu=gpu).aquecer()
+        return leitor
+
+    @classmethod
+    def conectar (cls, endereco: tuple[str, int] | str | None = None,
+                       chave: bytes | None = None) -> LeitorOCR:
+        """Criar um `LeitorOCR` que realiza a detecção e reconhecimento no `ServidorOCR` do `endereco`
+        - Modelos não são carregados no processo atual
+        - Parâmetros, cache e demais métodos são do próprio leitor
+        - `endereco` default do `ServidorOCR` e `chave` default `chave_servidor_ocr()` do usuário"""
+        from bot.imagem.servidor_ocr import ReaderRemoto, ENDERECO_SERVIDOR_OCR
+        leitor = super().__new__(cls)
+        leitor.reader = ReaderRemoto(endereco or ENDERECO_SERVIDOR_OCR, chave)
+        leitor.cache = collections.OrderedDict()
+        leitor.lock = threading.RLock()
+        return leitor
+
+    def aquecer (self) -> typing.Self:
+        """Realizar uma detecção e reconhecimento em uma imagem pequena para inicializar o modelo
+        - A primeira inferência é mais lenta pela inicialização do `torch`"""
+        imagem = object.__new__(Imagem)
+        imagem.pixels = np.full((32, 128, 3), 255, np.uint8)
+        imagem.pixels[8:24, 8:120] = 0
+        self.detectar_imagem(imagem)
+        self.__reconhecer([imagem], [PipelineImagem().cinza()])
+        return self
 
     def ler_imagem (self, imagem: Imagem) -> list[tuple[str, Coordenada, float]]:
         """Extrair dados de `(texto, coordenada, confiança)` da `imagem`"""
-        return [
-            (texto, Coordenada.from_box((box[0][0], box[0][1], box[1][0], box[2][1])), confianca) # type: ignore
-            for box, texto, confianca in self.reader.readtext(
+        with self.lock:
+            extracoes = self.reader.readtext(
                 imagem.pixels,
                 decoder   = self.decoder,
                 mag_ratio = self.mag_ratio,
@@ -108,6 +164,9 @@ class LeitorOCR:
                 width_ths = self.width_ths,
                 allowlist = self.allowlist,
             )
+        return [
+            (texto, Coordenada.from_box((box[0][0], box[0][1], box[1][0], box[2][1])), confianca) # type: ignore
+            for box, texto, confianca in extracoes
         ]
 
     def ler_tela (self, regiao: Coordenada | None = None) -> list[tuple[str, Coordenada, float]]:
@@ -123,61 +182,163 @@ class LeitorOCR:
 
         return extracoes
 
-    def ler_texto_imagem (self, imagem: Imagem, concatenador: str = " ") -> str:
+    def ler_texto_imagem (self, imagem: Imagem,
+                                concatenador: str = " ",
+                                confianca_suficiente: float | None = None) -> str:
         """Ler e retornar os textos extraídos da `imagem` concatenados
-        - É comparado a confiança da `imagem, .inverter(), .cinza(), .binarizar()` e retornado a melhor"""
-        maior_confianca = 0.0
-        dados_maior_confianca = list[tuple[str, Coordenada, float]]()
-        regioes = tuple(map(imagem.recortar, self.detectar_imagem(imagem)))
-
-        for modificador in (lambda i: i,                    # imagem normal
-                            lambda i: Imagem.inverter(i),   # imagem invertida
-                            lambda i: Imagem.cinza(i),      # imagem cinza
-                            lambda i: Imagem.binarizar(i)): # imabem binarizada
-
-            dados = [item for regiao in map(modificador, regioes)
-                          for item in self.ler_imagem(regiao)]
-            confianca_atual = sum(confianca for _, _, confianca in dados)
-            if confianca_atual > maior_confianca:
-                dados_maior_confianca, maior_confianca = dados, confianca_atual
+        - É comparado a confiança da `imagem.cinza(), .inverter(), .binarizar()` e retornado a melhor
+        - `confianca_suficiente` interromper na primeira variante com a confiança média maior ou igual
+        - Resultado memorizado pelo hash dos pixels da `imagem`"""
+        return self.ler_textos_imagens([imagem], concatenador, confianca_suficiente)[0]
+
+    def ler_textos_imagens (self, imagens: typing.Iterable[Imagem],
+                                  concatenador: str = " ",
+                                  confianca_suficiente: float | None = None) -> list[str]:
+        """Ler e retornar os textos extraídos de cada imagem das `imagens` concatenados
+        - Detectado as regiões de texto de cada imagem e reconhecido todas as regiões e variantes em lote
+        - Variantes `cinza, invertida, binarizada` comparadas pela soma das confianças de cada imagem
+        - `confianca_suficiente` reconhecer uma variante por vez, interrompendo as imagens com a confiança média maior ou igual
+        - Resultados memorizados pelo hash dos pixels, imagens repetidas são lidas uma única vez
+        - Retornado na mesma ordem que `imagens`"""
+        imagens = list(imagens)
+        textos = list[tuple[str, ...] | None]()
+        pendentes = dict[tuple, list[int]]()
+
+        chaves = [self.__chave_cache(imagem, confianca_suficiente) for imagem in imagens]
+        with self.lock:
+            for indice, chave in enumerate(chaves):
+                textos.append(self.cache.get(chave))
+                if textos[-1] is not None: self.cache.move_to_end(chave)
+                else: pendentes.setdefault(chave, []).append(indice)
+
+        regioes = [
+            [imagens[indices[0]].recortar(coordenada) for coordenada in self.detectar_imagem(imagens[indices[0]])]
+            for indices in pendentes.values()
+        ]
+        melhores = [list[tuple[str, float]]() for _ in pendentes]
+        maiores_confiancas = [0.0] * len(pendentes)
+
+        # Variante cinza antes da invertida e binarizada pois costuma ser a mais precisa
+        # A imagem colorida é reconhecida pelo `EasyOCR` em cinza, sendo a mesma variante
+        variantes = (PipelineImagem().cinza(), PipelineImagem().cinza().inverter(), PipelineImagem().binarizar())
+        etapas = [variantes] if confianca_suficiente is None else [(variante,) for variante in variantes]
+        restantes = [indice for indice, regioes_imagem in enumerate(regioes) if regioes_imagem]
+
+        for etapa in etapas:
+            if not restantes: break
+            reconhecidos = self.__reconhecer([regiao for indice in restantes for regiao in regioes[indice]], etapa)
+
+            for dados_variante in reconhecidos:
+                inicio = 0
+                for indice in restantes:
+                    dados = dados_variante[inicio : inicio + len(regioes[indice])]
+                    inicio += len(regioes[indice])
+                    confianca = sum(confianca for _, confianca in dados)
+                    if confianca > maiores_confiancas[indice]:
+                        melhores[indice], maiores_confiancas[indice] = dados, confianca
+
+            if confianca_suficiente is not None:
+                restantes = [
+                    indice
+                    for indice in restantes
+                    if maiores_confiancas[indice] / len(regioes[indice]) < confianca_suficiente
+                ]
+
+        with self.lock:
+            for (chave, indices), dados in zip(pendentes.items(), melhores):
+                lidos = tuple(texto for texto, _ in dados if texto)
+                for indice in indices: textos[indice] = lidos
+                if self.tamanho_cache <= 0: continue
+                self.cache[chave] = lidos
+                while len(self.cache) > self.tamanho_cache:
+                    self.cache.popitem(last=False)
+
+        return [concatenador.join(lidos or ()) for lidos in textos]
+
+    def __chave_cache (self, imagem: Imagem, confianca_suficiente: float | None) -> tuple:
+        """Chave do cache de textos pelo hash dos pixels da `imagem` e parâmetros que alteram a leitura"""
+        pixels = np.ascontiguousarray(imagem.pixels)
+        return (
+            hashlib.blake2b(pixels.data, digest_size=16).digest(), pixels.shape,
+            self.decoder, self.mag_ratio, self.min_size, self.slope_ths, self.width_ths, self.allowlist,
+            confianca_suficiente
+        )
 
-        return concatenador.join(texto for texto, _, _ in dados_maior_confianca)
+    def __reconhecer (self, regioes: list[Imagem],
+                            pipelines: typing.Iterable[PipelineImagem]) -> list[list[tuple[str, float]]]:
+        """Reconhecer o texto das `regioes` transformadas por cada um dos `pipelines` em uma única chamada ao `reader.recognize`
+        - Regiões empilhadas verticalmente em um canvas cinza com uma caixa para cada
+        - Retornado `(texto, confiança)` de cada região para cada pipeline"""
+        pipelines = list(pipelines)
+        validas = [regiao.pixels.shape[0] > 0 and regiao.pixels.shape[1] > 0 for regiao in regioes]
+        alturas = [regiao.pixels.shape[0] if valida else 0 for regiao, valida in zip(regioes, validas)]
+        if not any(validas): return [[("", 0.0)] * len(regioes) for _ in pipelines]
+
+        # Posição `y` de cada região no canvas, identificando o resultado do `recognize`
+        altura_variante = sum(alturas)
+        largura = max(regiao.pixels.shape[1] for regiao, valida in zip(regioes, validas) if valida)
+        canvas = np.zeros((altura_variante * len(pipelines), largura), np.uint8)
+        caixas, posicoes = list[list[int]](), list[list[int]]()
+
+        y = 0
+        for pipeline in pipelines:
+            posicoes.append([])
+            for regiao, valida in zip(regioes, validas):
+                posicoes[-1].append(y)
+                if not valida: continue
+                pixels = pipeline.executar(regiao).pixels
+                altura, largura_regiao = pixels.shape[:2]
+                canvas[y : y + altura, :largura_regiao] = pixels
+                caixas.append([0, largura_regiao, y, y + altura])
+                y += altura
+
+        with self.lock:
+            reconhecidos = self.reader.recognize(
+                canvas,
+                horizontal_list = caixas,
+                free_list       = [],
+                decoder         = self.decoder,
+                batch_size      = self.batch_size,
+                allowlist       = self.allowlist,
+                detail          = 1,
+                paragraph       = False,
+            )
+        resultado = {
+            int(box[0][1]): (texto, float(confianca))
+            for box, texto, confianca in reconhecidos
+        }
+        return [
+            [resultado.get(y, ("", 0.0)) if valida else ("", 0.0) for y, valida in zip(posicoes_pipeline, validas)]
+            for posicoes_pipeline in posicoes
+        ]
 
     def ler_tabela (self, imagem: Imagem,
                           nomes_colunas: typing.Iterable[str] | None = None,
-                          margem_y_linhas: int = 5,
+                          margem_y_linhas: int | None = None,
                           similaridade_minima: float = 0.75) -> list[dict[str, tuple[str, Coordenada]]]:
         """Extrair as colunas e linhas da `imagem` de uma tabela
         ### Limitação: Funciona apenas para tabelas com os nomes das colunas `left-align`
         - `nomes_colunas` limitar, renomear e buscar pelas colunas desejadas
-        - `margem_y_linhas` para agrupar linhas com a margem de erro `Y`
+        - `margem_y_linhas` para agrupar linhas com a margem de erro `Y`. Default metade da mediana da altura dos textos
         - `similaridade_minima` utilizado ao buscar por textos não exatos
         - Diminiur `leitor.width_ths` caso os nomes das colunas estiverem sendo mesclados
+        - Textos das células reconhecidos em lote pelo `ler_textos_imagens()`
         - Retornado as linhas sendo `{ nome_coluna: (texto_coluna, Coordenada do texto na `imagem`) }`"""
-        tabela = list[dict[str, tuple[str, Coordenada]]]()
-        linhas = self.detectar_linhas(imagem, margem_y_linhas)
-
-        if not linhas: return tabela
-        coordenada_headers, *coordenada_linhas = linhas
-        if not coordenada_linhas: return tabela
-
-        # Corrigir a largura dos headers para ir até antes do começo do próximo header
-        # Funciona apenas caso os headers sejam `left-align`
-        largura_imagem = imagem.pixels.shape[1]
-        for i, coordenada in enumerate(coordenada_headers):
-            acrescimo_largura = coordenada_headers[i + 1].x if i < len(coordenada_headers) - 1 else largura_imagem
-            coordenada.largura += acrescimo_largura - coordenada.x - coordenada.largura - 2
-
-        # Extrair os nomes no header
-        headers = {
-            nome: coordenada
-            for coordenada in coordenada_headers
-            if (nome := self.ler_texto_imagem(imagem.recortar(coordenada)))
-        }
-
-        # Corrigir nome dos headers
-        if nomes_colunas := [String(coluna) for coluna in nomes_colunas or []]:
+        coordenada_headers, grade = self.detectar_tabela(imagem, margem_y_linhas)
+        if not grade: return []
+        nomes_colunas = [String(coluna) for coluna in nomes_colunas or []]
+
+        # Ler os headers e, caso não seja necessário corrigir as colunas, todas as células no mesmo lote
+        celulas = [] if nomes_colunas else list(itertools.product(range(len(grade)), range(len(coordenada_headers))))
+        textos = self.ler_textos_imagens(
+            imagem.recortar(coordenada)
+            for coordenada in itertools.chain(coordenada_headers, (grade[linha][coluna] for linha, coluna in celulas))
+        )
+        headers = {nome: coluna for coluna, nome in enumerate(textos[:len(coordenada_headers)]) if nome}
+        lidos = dict(zip(celulas, textos[len(coordenada_headers):]))
 
+        # Corrigir nome dos headers e ler apenas as células das colunas desejadas
+        if nomes_colunas:
             headers_corrigido, nomes_headers = {}, list(headers)
             for nome_coluna in nomes_colunas:
                 nome = nome_coluna.encontrar_texto(nomes_headers, similaridade_minima=similaridade_minima)
@@ -186,65 +347,52 @@ class LeitorOCR:
                 headers_corrigido[str(nome_coluna)] = headers[nome]
 
             headers = headers_corrigido
+            celulas = [(linha, coluna) for linha in range(len(grade)) for coluna in headers.values()]
+            lidos = dict(zip(celulas, self.ler_textos_imagens(
+                imagem.recortar(grade[linha][coluna])
+                for linha, coluna in celulas
+            )))
 
-        # Extrair de cada linha os dados de acordo com os `headers`
-        for coordenadas in coordenada_linhas:
-            menor_y = min(coordenada.y for coordenada in coordenadas)
-            maior_altura = max(coordenada.altura for coordenada in coordenadas)
-            tabela.append({
-                nome_header: (
-                    self.ler_texto_imagem(imagem.recortar(coordenada)),
-                    coordenada
-                )
-                for nome_header, coordenada_header in headers.items()
-                if (coordenada := Coordenada(
-                    x = coordenada_header.x,
-                    y = menor_y,
-                    largura = coordenada_header.largura,
-                    altura = maior_altura,
-                ))
-            })
-
-        return tabela
-
-    def ler_linhas (self, imagem: Imagem, margem_y: int = 5) -> list[tuple[str, Coordenada]]:
-        """Extrair dados da `imagem` concatenando as linhas em uma `str`
-        - `margem_y` para agrupar linhas com a margem de erro `Y`
-        - Retornado uma lista das linhas sendo `(texto, Coordenada)`"""
         return [
-            (
-                self.ler_texto_imagem(
-                    imagem.recortar(coordenada := Coordenada(
-                        x = linha[0].x,
-                        y = min(coordenada.y for coordenada in linha),
-                        largura = (linha[-1].x + linha[-1].largura - linha[0].x) if len(linha) > 1 else linha[0].largura,
-                        altura = max(coordenada.altura for coordenada in linha)
-                    ))
-                ),
-                coordenada
-            )
-            for linha in self.detectar_linhas(imagem, margem_y)
+            {
+                nome_header: (lidos[(linha, coluna)], grade[linha][coluna])
+                for nome_header, coluna in headers.items()
+                if grade[linha][coluna]
+            }
+            for linha in range(len(grade))
         ]
 
+    def ler_linhas (self, imagem: Imagem, margem_y: int | None = None) -> list[tuple[str, Coordenada]]:
+        """Extrair dados da `imagem` concatenando as linhas em uma `str`
+        - `margem_y` para agrupar linhas com a margem de erro `Y`. Default metade da mediana da altura dos textos
+        - Retornado uma lista das linhas sendo `(texto, Coordenada)`"""
+        coordenadas = self.__detectar(imagem)
+        linhas = list(coordenadas.unir(coordenadas.rotular_linhas(margem_y)))
+        textos = self.ler_textos_imagens(map(imagem.recortar, linhas))
+        return list(zip(textos, linhas))
+
     def detectar_imagem (self, imagem: Imagem) -> list[Coordenada]:
         """Detectar coordenadas de texto na `imagem`"""
-        boxes, _ = self.reader.detect(
-            imagem.pixels,
-            mag_ratio = self.mag_ratio,
-            min_size  = self.min_size,
-            slope_ths = self.slope_ths,
-            width_ths = self.width_ths
-        )
-        boxes: list[tuple[np.int32, ...]] = np.concatenate(boxes) # type: ignore
-        return [
-            Coordenada.from_box((
-                max(0, x1), # corrigir possível negativo
-                max(0, y1), # corrigir possível negativo
-                x2,
-                y2
-            )) # type: ignore
-            for x1, x2, y1, y2 in boxes
-        ]
+        return list(self.__detectar(imagem))
+
+    def __detectar (self, imagem: Imagem) -> Coordenadas:
+        """Detectar as `Coordenadas` de texto na `imagem`"""
+        with self.lock:
+            boxes, _ = self.reader.detect(
+                imagem.pixels,
+                mag_ratio = self.mag_ratio,
+                min_size  = self.min_size,
+                slope_ths = self.slope_ths,
+                width_ths = self.width_ths
+            )
+        # boxes no formato `(x1, x2, y1, y2)`
+        x1, x2, y1, y2 = np.asarray(np.concatenate(boxes), dtype=np.int64).reshape(-1, 4).T
+        return Coordenadas.from_boxes(np.stack((
+            np.maximum(x1, 0), # corrigir possível negativo
+            np.maximum(y1, 0), # corrigir possível negativo
+            x2,
+            y2
+        ), axis=1))
 
     def detectar_tela (self, regiao: Coordenada | None = None) -> list[Coordenada]:
         """Detectar coordenadas de texto na tela
@@ -259,26 +407,42 @@ class LeitorOCR:
     
         return coordenadas
 
-    def detectar_linhas (self, imagem: Imagem, margem_y: int = 5) -> list[list[Coordenada]]:
+    def detectar_linhas (self, imagem: Imagem, margem_y: int | None = None) -> list[list[Coordenada]]:
         """Detectar coordenadas de texto na `imagem` e agrupar pela linha
-        - `margem_y` para agrupar linhas com a margem de erro `Y`"""
-        linhas = list[list[Coordenada]]()
-        coordenadas = self.detectar_imagem(imagem)
-        coordenadas.sort(key=lambda c: c.y)
+        - `margem_y` distância vertical máxima entre os centros de textos da mesma linha
+        - Default metade da mediana da altura dos textos"""
+        return [list(linha) for linha in self.__detectar(imagem).linhas(margem_y)]
 
-        # Agregar linhas pelo Y
-        for coordenada in coordenadas:
-            # Nova linha
-            if not linhas or linhas[-1][0].y + margem_y <= coordenada.y:
-                linhas.append([coordenada])
-            # Mesma linha
-            else: linhas[-1].append(coordenada)
+    def detectar_tabela (self, imagem: Imagem, margem_y: int | None = None) -> tuple[Coordenadas, list[Coordenadas]]:
+        """Detectar as coordenadas dos headers e a grade de células de uma tabela na `imagem`
+        - Conforme o `agrupar_tabela()` com os textos detectados na `imagem`"""
+        return self.agrupar_tabela(self.__detectar(imagem), imagem.pixels.shape[1], margem_y)
 
-        # Ordenar linhas pelo X
-        for linha in linhas:
-            linha.sort(key=lambda c: c.x)
-
-        return linhas
+    @staticmethod
+    def agrupar_tabela (coordenadas: Coordenadas,
+                        largura: int,
+                        margem_y: int | None = None) -> tuple[Coordenadas, list[Coordenadas]]:
+        """Agrupar as `coordenadas` de textos de uma tabela em headers e na grade de células
+        ### Limitação: Funciona apenas para tabelas com os nomes das colunas `left-align`
+        - Primeira linha considerada os headers, com a largura até antes do começo do próximo header ou da `largura` da imagem
+        - `margem_y` conforme o `Coordenadas.rotular_linhas()`
+        - Células com o `x, largura` do header e o `y, altura` da união dos textos da linha
+        - Retornado `(headers, grade)` sendo a grade as `Coordenadas` das colunas de cada linha, `grade[linha][coluna]`"""
+        if not len(coordenadas): return Coordenadas(), []
+        rotulos = coordenadas.rotular_linhas(margem_y)
+        headers = coordenadas[rotulos == 0].ordenar("x")
+        linhas = coordenadas.unir(rotulos)[1:]
+
+        x = headers.x
+        larguras = np.append(x[1:], largura) - x - 2
+        grade = np.empty((len(linhas), len(headers), 4), np.int64)
+        grade[..., 0], grade[..., 1] = x, linhas.y[:, None]
+        grade[..., 2], grade[..., 3] = larguras, linhas.altura[:, None]
+
+        return (
+            Coordenadas.from_array(np.stack((x, headers.y, larguras, headers.altura), axis=1)),
+            [Coordenadas.from_array(linha) for linha in grade]
+        )
 
     @staticmethod
     def encontrar_textos (textos: typing.Iterable[str],
@@ -0,0 +1,151 @@
+# std
+from __future__ import annotations
+import typing
+# interno
+from bot.estruturas import Coordenada
+from bot.imagem.setup import Imagem
+# externo opcionais [imagem]
+try: import cv2, numpy as np
+except ImportError: raise ImportError(
+    "Dependência opcional 'bot[imagem]' necessária. "
+    "Instale como 'bot[imagem]' para utilizar o módulo 'bot.imagem'"
+)
+
+type Etapa = tuple[typing.Literal["recortar", "cinza", "binarizar", "inverter", "redimensionar"], typing.Any]
+
+class PipelineImagem:
+    """Transformações preguiçosas de uma `Imagem` realizadas apenas no `executar()`
+    - Etapas combinadas antes da execução
+        - `recortar` consecutivos são unidos e realizados sem cópia
+        - `cinza` em imagem cinza, `binarizar` repetido e `inverter` duplo são removidos
+    - Buffers de saída alocados uma única vez e reaproveitados entre as execuções
+        - A imagem retornada é válida até a próxima execução do pipeline. Utilizar o `copiar()` caso necessário manter
+    - Útil para o pré-processamento de várias regiões em loops, como no OCR
+
+    ```
+    # Executar para a própria imagem
+    imagem.pipeline().recortar(regiao).cinza().binarizar().executar()
+    # Reaproveitar o pipeline para outras imagens
+    pipeline = PipelineImagem().cinza().inverter()
+    for regiao in regioes:
+        processada = pipeline.executar(regiao)
+    ```"""
+
+    imagem: Imagem | None
+    """Imagem padrão do `executar()`"""
+    etapas: list[Etapa]
+    """Etapas na ordem em que foram adicionadas"""
+
+    def __init__ (self, imagem: Imagem | None = None) -> None:
+        self.imagem = imagem
+        self.etapas = []
+        self.__buffers = [np.empty(0, np.uint8), np.empty(0, np.uint8)]
+
+    def __repr__ (self) -> str:
+        return f"<PipelineImagem {" -> ".join(nome for nome, _ in self.etapas) or "vazio"}>"
+
+    def recortar (self, regiao: Coordenada) -> typing.Self:
+        """Adicionar a etapa de recortar a `regiao`"""
+        self.etapas.append(("recortar", regiao))
+        return self
+
+    def cinza (self) -> typing.Self:
+        """Adicionar a etapa de transformar para cinza"""
+        self.etapas.append(("cinza", None))
+        return self
+
+    def binarizar (self) -> typing.Self:
+        """Adicionar a etapa de binarizar"""
+        self.etapas.append(("binarizar", None))
+        return self
+
+    def inverter (self) -> typing.Self:
+        """Adicionar a etapa de inverter as cores"""
+        self.etapas.append(("inverter", None))
+        return self
+
+    def redimensionar (self, escala: float = 2.0) -> typing.Self:
+        """Adicionar a etapa de redimensionar para a % `escala`"""
+        self.etapas.append(("redimensionar", escala))
+        return self
+
+    def combinar (self) -> list[Etapa]:
+        """Obter as etapas combinadas que serão executadas"""
+        etapas = list[Etapa]()
+        for nome, argumento in self.etapas:
+            anterior = etapas[-1] if etapas else (None, None)
+            match nome:
+                case "recortar" if anterior[0] == "recortar":
+                    x, y, largura, altura = anterior[1]
+                    etapas[-1] = ("recortar", Coordenada(
+                        x + argumento.x,
+                        y + argumento.y,
+                        max(0, min(argumento.largura, largura - argumento.x)),
+                        max(0, min(argumento.altura, altura - argumento.y)),
+                    ))
+                case "cinza" if anterior[0] in ("cinza", "binarizar"):
+                    continue
+                case "binarizar" if anterior[0] == "binarizar":
+                    continue
+                case "inverter" if anterior[0] == "inverter":
+                    etapas.pop()
+                case _:
+                    etapas.append((nome, argumento))
+        return etapas
+
+    def __buffer (self, indice: int, shape: tuple[int, ...]) -> np.ndarray:
+        """Obter o buffer `indice` contíguo no `shape`, realocando apenas caso a capacidade seja insuficiente"""
+        tamanho = int(np.prod(shape))
+        if self.__buffers[indice].size < tamanho:
+            self.__buffers[indice] = np.empty(tamanho, np.uint8)
+        return self.__buffers[indice][:tamanho].reshape(shape)
+
+    def executar (self, imagem: Imagem | None = None) -> Imagem:
+        """Executar as etapas na `imagem` ou na imagem do pipeline
+        - Sem alocação caso existam apenas etapas de `recortar`
+        - Pixels da imagem retornada reaproveitados na próxima execução"""
+        imagem = imagem or self.imagem
+        assert imagem is not None, "Imagem não informada para executar o pipeline"
+
+        # `atual` indica o buffer dos `pixels`. `None` caso seja a imagem original
+        pixels = imagem.pixels
+        atual = next((
+            indice
+            for indice, buffer in enumerate(self.__buffers)
+            if buffer.size and np.may_share_memory(pixels, buffer)
+        ), None)
+        proximo = lambda: 1 if atual == 0 else 0
+        alteravel = lambda: atual is not None and pixels.flags.c_contiguous
+
+        for nome, argumento in self.combinar():
+            match nome:
+                case "recortar":
+                    x, y, x_direita, y_baixo = argumento.to_box()
+                    pixels = pixels[y : y_baixo, x : x_direita]
+
+                case "cinza" | "binarizar":
+                    if pixels.ndim == 3:
+                        destino = self.__buffer(atual := proximo(), pixels.shape[:2])
+                        pixels = cv2.cvtColor(pixels, cv2.COLOR_BGR2GRAY, dst=destino)
+                    if nome == "binarizar":
+                        if not alteravel(): destino = self.__buffer(atual := proximo(), pixels.shape)
+                        else: destino = pixels
+                        _, pixels = cv2.threshold(pixels, 0, 255, cv2.THRESH_OTSU, dst=destino)
+
+                case "inverter":
+                    if not alteravel(): destino = self.__buffer(atual := proximo(), pixels.shape)
+                    else: destino = pixels
+                    pixels = cv2.bitwise_not(pixels, dst=destino)
+
+                case "redimensionar":
+                    altura, largura, *_ = map(lambda x: int(x * argumento), pixels.shape)
+                    destino = self.__buffer(atual := proximo(), (altura, largura, *pixels.shape[2:]))
+                    pixels = cv2.resize(pixels, dsize=(largura, altura), dst=destino, interpolation=cv2.INTER_LINEAR)
+
+        resultado = object.__new__(Imagem)
+        resultado.pixels = pixels
+        return resultado
+
+__all__ = [
+    "PipelineImagem",
+]
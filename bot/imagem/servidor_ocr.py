@@ -0,0 +1,224 @@
+# std
+from __future__ import annotations
+import os, sys, time, typing, secrets, threading, subprocess
+from multiprocessing import connection
+# interno
+import bot
+from bot.imagem.ocr import LeitorOCR
+
+ENDERECO_SERVIDOR_OCR = ("127.0.0.1", 47_861)
+"""Endereço default do `ServidorOCR` no `localhost`"""
+TAMANHO_CHAVE_SERVIDOR_OCR = 32
+"""Quantidade de bytes da chave de autenticação gerada para o `ServidorOCR`"""
+METODOS_READER = frozenset(("detect", "recognize", "readtext"))
+"""Métodos do `reader` do `EasyOCR` permitidos de serem executados pelo `ServidorOCR`"""
+
+def caminho_chave_servidor_ocr () -> str:
+    """Caminho do arquivo da chave de autenticação do `ServidorOCR` do usuário atual
+    - Windows: `%LOCALAPPDATA%/bot/servidor_ocr.chave`, acessível apenas pelo usuário por padrão
+    - Demais: `~/.bot/servidor_ocr.chave`"""
+    if diretorio := os.environ.get("LOCALAPPDATA"):
+        return os.path.join(diretorio, "bot", "servidor_ocr.chave")
+    return os.path.join(os.path.expanduser("~"), ".bot", "servidor_ocr.chave")
+
+def chave_servidor_ocr (caminho: str | None = None) -> bytes:
+    """Obter a chave de autenticação das conexões com o `ServidorOCR` do usuário atual
+    - Gerada pelo `secrets.token_bytes` na primeira chamada e armazenada no `caminho` com permissão apenas do usuário
+    - Mesma chave lida pelo servidor e pelos clientes do usuário, sem chave fixa conhecida por outros processos
+    - `caminho` default `caminho_chave_servidor_ocr()`"""
+    caminho = caminho or caminho_chave_servidor_ocr()
+    os.makedirs(os.path.dirname(caminho), mode=0o700, exist_ok=True)
+
+    try:
+        descritor = os.open(caminho, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o600)
+        with os.fdopen(descritor, "wb") as arquivo:
+            arquivo.write(secrets.token_bytes(TAMANHO_CHAVE_SERVIDOR_OCR))
+    # criado anteriormente ou por outro processo
+    except FileExistsError: pass
+
+    if os.name == "posix":
+        estado = os.stat(caminho)
+        # validação de segurança, não utilizar `assert` pois é removido pelo `python -O`
+        if estado.st_uid != os.getuid() or estado.st_mode & 0o077: raise PermissionError(
+            f"Arquivo da chave do servidor OCR '{caminho}' deve pertencer e ser acessível apenas pelo usuário atual"
+        )
+
+    # aguardar a escrita caso criado por outro processo
+    for _ in range(50):
+        with open(caminho, "rb") as arquivo: chave = arquivo.read()
+        if len(chave) >= TAMANHO_CHAVE_SERVIDOR_OCR: return chave
+        time.sleep(0.1)
+    raise Exception(f"Arquivo da chave do servidor OCR '{caminho}' inválido")
+
+class ReaderRemoto:
+    """Substituto do `reader` do `EasyOCR` que encaminha as chamadas ao `ServidorOCR`
+    - Utilizado pelo `LeitorOCR.conectar()`
+    - Conexão mantida entre as chamadas e reconectada caso perdida
+    - Autenticação mútua pela `chave`, default `chave_servidor_ocr()`"""
+
+    def __init__ (self, endereco: tuple[str, int] | str = ENDERECO_SERVIDOR_OCR,
+                        chave: bytes | None = None) -> None:
+        self.endereco, self.chave = endereco, chave or chave_servidor_ocr()
+        self.__conexao: connection.Connection | None = None
+        self.__lock = threading.Lock()
+
+    def __repr__ (self) -> str:
+        return f"<ReaderRemoto {self.endereco!r}>"
+
+    def __chamar (self, metodo: str, *args, **kwargs) -> typing.Any:
+        with self.__lock:
+            for tentativa in range(2):
+                try:
+                    if self.__conexao is None:
+                        self.__conexao = connection.Client(self.endereco, authkey=self.chave)
+                    self.__conexao.send((metodo, args, kwargs))
+                    status, resultado = self.__conexao.recv()
+                    break
+                # conexão perdida com o servidor
+                except (EOFError, OSError):
+                    self.__conexao = None
+                    if tentativa: raise
+
+        if status == "erro": raise Exception(f"Erro no servidor OCR {self.endereco!r}: {resultado}")
+        return resultado
+
+    def detect (self, *args, **kwargs) -> typing.Any:
+        return self.__chamar("detect", *args, **kwargs)
+
+    def recognize (self, *args, **kwargs) -> typing.Any:
+        return self.__chamar("recognize", *args, **kwargs)
+
+    def readtext (self, *args, **kwargs) -> typing.Any:
+        return self.__chamar("readtext", *args, **kwargs)
+
+    def fechar (self) -> None:
+        """Fechar a conexão com o servidor"""
+        with self.__lock:
+            if self.__conexao is not None: self.__conexao.close()
+            self.__conexao = None
+
+class ServidorOCR:
+    """Servidor local que compartilha os modelos de um `LeitorOCR` entre processos da mesma máquina
+    - Modelos do `EasyOCR` carregados uma única vez por máquina
+    - Comunicação por `multiprocessing.connection` autenticada pela `chave`, default `chave_servidor_ocr()` do usuário
+    - Cada conexão atendida em uma thread e as chamadas ao modelo executadas uma por vez pelo `leitor.lock`
+    - Clientes criados pelo `LeitorOCR.conectar()`, com os mesmos métodos do `LeitorOCR`
+
+    ```
+    # Executar em um processo dedicado
+    # python -m bot.imagem [linguagens] [--gpu] [--porta 47861]
+    ServidorOCR("en").executar()
+
+    # Iniciar o servidor em um novo processo, caso ainda não esteja em execução
+    ServidorOCR.iniciar_processo("en")
+
+    # Utilizar nos bots
+    leitor = LeitorOCR.conectar()
+    leitor.ler_tela()
+    ```"""
+
+    leitor: LeitorOCR
+    """Leitor com os modelos carregados utilizado nas chamadas"""
+    endereco: tuple[str, int] | str
+    """Endereço das conexões. Atualizado com o endereço real ao iniciar"""
+    chave: bytes
+    """Chave de autenticação das conexões"""
+    pronto: threading.Event
+    """Indicador do servidor aceitando conexões"""
+
+    def __init__ (self, *linguagem: str,
+                        gpu: bool = False,
+                        endereco: tuple[str, int] | str = ENDERECO_SERVIDOR_OCR,
+                        chave: bytes | None = None,
+                        leitor: LeitorOCR | None = None) -> None:
+        self.leitor = leitor or LeitorOCR.obter(*linguagem, gpu=gpu)
+        self.endereco, self.chave = endereco, chave or chave_servidor_ocr()
+        self.pronto = threading.Event()
+        self.__encerrado = False
+
+    def __repr__ (self) -> str:
+        return f"<ServidorOCR {self.endereco!r}>"
+
+    def executar (self) -> None:
+        """Aceitar as conexões e atender as chamadas até o `encerrar()`"""
+        with connection.Listener(self.endereco, authkey=self.chave) as listener:
+            self.endereco = listener.address
+            self.pronto.set()
+            bot.logger.informar(f"Servidor OCR aguardando conexões em {self.endereco!r}")
+
+            while not self.__encerrado:
+                try: conexao = listener.accept()
+                except (OSError, EOFError, connection.AuthenticationError) as erro:
+                    bot.logger.alertar(f"Conexão recusada pelo servidor OCR: {erro}")
+                    continue
+                threading.Thread(target=self.__atender, args=(conexao,), name="bot-servidor-ocr", daemon=True).start()
+
+        self.pronto.clear()
+        bot.logger.informar(f"Servidor OCR {self.endereco!r} encerrado")
+
+    def __atender (self, conexao: connection.Connection) -> None:
+        """Atender as chamadas da `conexao` até ser fechada pelo cliente"""
+        with conexao:
+            while True:
+                try: metodo, args, kwargs = conexao.recv()
+                except (EOFError, OSError): break
+                if self.__encerrado: break
+
+                try:
+                    # validação de segurança, não utilizar `assert` pois é removido pelo `python -O`
+                    if metodo not in METODOS_READER:
+                        raise PermissionError(f"Método '{metodo}' não permitido pelo servidor OCR")
+                    with self.leitor.lock:
+                        resposta = ("ok", getattr(self.leitor.reader, metodo)(*args, **kwargs))
+                except Exception as erro:
+                    resposta = ("erro", f"{type(erro).__name__}: {erro}")
+
+                try: conexao.send(resposta)
+                except OSError: break
+
+    def encerrar (self) -> None:
+        """Encerrar o servidor em execução pelo `executar()`"""
+        if self.__encerrado or not self.pronto.is_set(): return
+        self.__encerrado = True
+        # conexão para liberar o `accept()` aguardando
+        try: connection.Client(self.endereco, authkey=self.chave).close()
+        except OSError: pass
+
+    @staticmethod
+    def em_execucao (endereco: tuple[str, int] | str = ENDERECO_SERVIDOR_OCR,
+                     chave: bytes | None = None) -> bool:
+        """Checar se existe um `ServidorOCR` autenticado pela `chave` aceitando conexões no `endereco`"""
+        try: connection.Client(endereco, authkey=chave or chave_servidor_ocr()).close()
+        except Exception: return False
+        return True
+
+    @staticmethod
+    def iniciar_processo (*linguagem: str,
+                          gpu: bool = False,
+                          porta: int = ENDERECO_SERVIDOR_OCR[1],
+                          timeout: float = 120.0) -> bool:
+        """Iniciar o servidor em um novo processo independente, caso ainda não esteja em execução na `porta`
+        - Aguardado por `timeout` segundos o carregamento dos modelos
+        - Servidor e checagem autenticados pela `chave_servidor_ocr()` do usuário
+        - Retorna um `bool` indicando se o servidor está aceitando conexões"""
+        endereco, chave = (ENDERECO_SERVIDOR_OCR[0], porta), chave_servidor_ocr()
+        if ServidorOCR.em_execucao(endereco, chave): return True
+
+        bot.logger.informar(f"Iniciando o servidor OCR em {endereco!r}")
+        argumentos = [sys.executable, "-m", "bot.imagem", *linguagem, "--porta", str(porta)]
+        if gpu: argumentos.append("--gpu")
+        subprocess.Popen(
+            argumentos,
+            stdin = subprocess.DEVNULL,
+            stdout = subprocess.DEVNULL,
+            stderr = subprocess.DEVNULL,
+            creationflags = getattr(subprocess, "DETACHED_PROCESS", 0) | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0),
+        )
+        return bot.tempo.aguardar(lambda: ServidorOCR.em_execucao(endereco, chave), timeout, 0.5)
+
+__all__ = [
+    "ReaderRemoto",
+    "ServidorOCR",
+    "ENDERECO_SERVIDOR_OCR",
+    "chave_servidor_ocr",
+]
@@ -1,10 +1,12 @@
 # std
 from __future__ import annotations
-import time, base64, collections
+import os, time, base64, threading, collections
+import concurrent.futures as futures
 import tkinter, tempfile, typing
 # interno
 import bot
 from bot.estruturas import Coordenada
+from bot.imagem.coordenadas import Coordenadas
 # externo
 import win32gui, win32ui, win32con
 # externo opcionais [imagem]
@@ -20,6 +22,171 @@ def cor_similar (cor1: bot.tipagem.rgb, cor2: bot.tipagem.rgb, tolerancia=20) ->
     - `tolerancia máxima` 441 (Branco x Preto)"""
     return bool(np.linalg.norm(np.array(cor1) - np.array(cor2)) < tolerancia)
 
+IOU_MAXIMO_NMS = 0.3
+"""Interseção sobre a união máxima entre duas coordenadas encontradas pelo `Imagem.procurar_imagens`"""
+TAMANHO_MINIMO_PIRAMIDE = 8
+"""Menor dimensão, em pixels, do template no nível mais reduzido da pirâmide"""
+MARGEM_CONFIANCA_PIRAMIDE = 0.2
+"""Redução da confiança para os candidatos no nível reduzido da pirâmide"""
+
+def distancia_hamming (hash1: int, hash2: int) -> int:
+    """Quantidade de bits diferentes entre os hashes do `Imagem.hash_perceptual()`
+    - `0` imagens perceptualmente iguais"""
+    return (hash1 ^ hash2).bit_count()
+
+def memorizar[T] (cache: dict | None, chave: typing.Hashable, criar: typing.Callable[[], T]) -> T:
+    """Obter o valor da `chave` no `cache` ou `criar` e armazenar
+    - `cache=None` apenas cria o valor
+    - `VariantesCache` revalida os limites do `CacheImagens` ao armazenar"""
+    if cache is None: return criar()
+    try: return cache[chave]
+    except KeyError: pass
+    valor = cache.setdefault(chave, criar())
+    if isinstance(cache, VariantesCache): cache.cache_imagens.verificar_limites()
+    return valor
+
+def cache_aninhado (cache: dict | None, chave: typing.Hashable) -> dict | None:
+    """Obter o cache da `chave` dentro do `cache`, do mesmo tipo para manter a revalidação do `VariantesCache`
+    - `cache=None` retorna `None`"""
+    if cache is None: return None
+    return memorizar(cache, chave, lambda: VariantesCache(cache.cache_imagens) if isinstance(cache, VariantesCache) else {})
+
+def maximos_locais (resultado: np.ndarray,
+                    confianca: float,
+                    largura: int,
+                    altura: int) -> tuple[Coordenadas, np.ndarray]:
+    """Obter os máximos locais `3x3` com confiança `>= confianca` do mapa `resultado` do `cv2.matchTemplate`
+    - Retornado as coordenadas `largura x altura` e as confianças na ordem da posição `(y, x)`"""
+    mascara = resultado >= confianca
+    if not mascara.any():
+        return Coordenadas(), np.empty(0, dtype=np.float32)
+
+    mascara &= resultado >= cv2.dilate(resultado, np.ones((3, 3), np.uint8))
+    ys, xs = np.nonzero(mascara)
+    confiancas = resultado[ys, xs]
+
+    # platôs de mesma confiança, comuns em regiões de cor sólida, mantém apenas o primeiro máximo na ordem `(y, x)`
+    ultimo_x = resultado.shape[1] - 1
+    manter = np.ones(len(ys), dtype=bool)
+    for dy, dx in ((-1, -1), (-1, 0), (-1, 1), (0, -1)):
+        vizinho_y, vizinho_x = ys + dy, xs + dx
+        valido = (vizinho_y >= 0) & (vizinho_x >= 0) & (vizinho_x <= ultimo_x)
+        vizinho = resultado[np.maximum(vizinho_y, 0), np.clip(vizinho_x, 0, ultimo_x)]
+        manter &= ~(valido & (vizinho == confiancas))
+    ys, xs, confiancas = ys[manter], xs[manter], confiancas[manter]
+
+    array = np.stack((xs, ys, np.full_like(xs, largura), np.full_like(ys, altura)), axis=1)
+    return Coordenadas.from_array(array), confiancas
+
+def suprimir_sobrepostas (candidatos: Coordenadas,
+                          confiancas: np.ndarray,
+                          max_resultados: int | None = None) -> tuple[Coordenadas, np.ndarray]:
+    """Supressão de não máximos vetorizada dos `candidatos`
+    - Aceito o candidato de maior confiança e suprimido os restantes que contenham o seu centro ou possuam IoU acima de `IOU_MAXIMO_NMS`
+    - `max_resultados` limitar a quantidade de coordenadas aceitas, mantendo as de maior confiança
+    - Retornado as coordenadas e as confianças em ordem crescente de confiança e posição `(y, x)`"""
+    # ordem decrescente de confiança e, em empate, a ordem dos candidatos
+    ordem = np.argsort(-confiancas, kind="stable")
+    candidatos, confiancas = candidatos[ordem], confiancas[ordem]
+
+    aceitos, restantes = list[int](), np.arange(len(candidatos))
+    while restantes.size and (max_resultados is None or len(aceitos) < max_resultados):
+        indice, restantes = int(restantes[0]), restantes[1:]
+        aceitos.append(indice)
+        melhor, outros = candidatos[indice], candidatos[restantes]
+        suprimidos = outros.contem(melhor) | (outros.iou(melhor)[:, 0] > IOU_MAXIMO_NMS)
+        restantes = restantes[~suprimidos]
+
+    candidatos, confiancas = candidatos[aceitos], confiancas[aceitos]
+    ordem = np.lexsort((candidatos.x, candidatos.y, confiancas))
+    return candidatos[ordem], confiancas[ordem]
+
+def suprimir_nao_maximos (resultado: np.ndarray,
+                          confianca: float,
+                          largura: int,
+                          altura: int,
+                          max_resultados: int | None = None) -> tuple[Coordenadas, np.ndarray]:
+    """Supressão de não máximos vetorizada no mapa de confiança `resultado` do `cv2.matchTemplate`
+    - Candidatos obtidos pelo `maximos_locais()` e suprimidos pelo `suprimir_sobrepostas()`
+    - Retornado as coordenadas `largura x altura` e as confianças em ordem crescente de confiança e posição `(y, x)`"""
+    return suprimir_sobrepostas(*maximos_locais(resultado, confianca, largura, altura), max_resultados)
+
+def mapa_confianca_piramide (template: np.ndarray,
+                             referencia: np.ndarray,
+                             confianca: float,
+                             niveis: int,
+                             cache: dict | None = None) -> np.ndarray:
+    """Mapa de confiança do `cv2.matchTemplate` calculado de forma grossa-para-fina
+    - Procurado no nível `niveis` da pirâmide, com as imagens reduzidas em `2 ** niveis`
+    - Refinado na resolução completa apenas na vizinhança dos candidatos com confiança `>= confianca - MARGEM_CONFIANCA_PIRAMIDE`
+    - Posições não refinadas possuem confiança `-1.0`
+    - `niveis` limitado para o template manter o `TAMANHO_MINIMO_PIRAMIDE`. `0` procura na resolução completa
+    - `cache` para reaproveitar o template reduzido entre chamadas"""
+    altura, largura = template.shape[:2]
+    niveis = min(niveis, int(np.log2(max(1, min(altura, largura) // TAMANHO_MINIMO_PIRAMIDE))))
+    if niveis <= 0:
+        return cv2.matchTemplate(template, referencia, cv2.TM_CCOEFF_NORMED)
+
+    fator = 2 ** niveis
+    reduzir = lambda pixels: cv2.resize(
+        pixels,
+        (pixels.shape[1] // fator, pixels.shape[0] // fator),
+        interpolation = cv2.INTER_AREA
+    )
+    template_reduzido = memorizar(cache, ("piramide", fator), lambda: reduzir(template))
+    grosso = cv2.matchTemplate(template_reduzido, reduzir(referencia), cv2.TM_CCOEFF_NORMED)
+    candidatos, _ = maximos_locais(grosso, confianca - MARGEM_CONFIANCA_PIRAMIDE, 1, 1)
+
+    # refinar na vizinhança de cada candidato
+    raio = 2 * fator
+    resultado = np.full((referencia.shape[0] - altura + 1, referencia.shape[1] - largura + 1), -1.0, np.float32)
+    for x, y in (candidatos.array[:, :2] * fator).tolist():
+        y0, x0 = max(0, y - raio), max(0, x - raio)
+        y1, x1 = min(resultado.shape[0], y + raio + 1), min(resultado.shape[1], x + raio + 1)
+        if y0 >= y1 or x0 >= x1: continue
+        regiao = referencia[y0 : y1 + altura - 1, x0 : x1 + largura - 1]
+        resultado[y0:y1, x0:x1] = cv2.matchTemplate(template, regiao, cv2.TM_CCOEFF_NORMED)
+
+    return resultado
+
+def procurar_template (template: np.ndarray,
+                       referencia: np.ndarray,
+                       confianca: float,
+                       niveis_piramide: int = 0,
+                       escalas: typing.Iterable[float] = (1.0,),
+                       max_resultados: int | None = None,
+                       cache: dict | None = None) -> tuple[Coordenadas, np.ndarray]:
+    """Procurar o `template` na `referencia` em cada uma das `escalas` do template
+    - `niveis_piramide` procura grossa-para-fina pelo `mapa_confianca_piramide()`. `0` resolução completa
+    - Coordenadas com a largura e altura do template escalado
+    - `cache` para reaproveitar o template escalado e reduzido entre chamadas. Ex: `Imagem.cache`
+    - Retornado as coordenadas e as confianças em ordem crescente de confiança e posição `(y, x)`"""
+    todos_candidatos, todas_confiancas = list[np.ndarray](), list[np.ndarray]()
+    for escala in escalas:
+        assert escala > 0, f"Escala '{escala}' do template inválida"
+        cache_escala = cache_aninhado(cache, ("escala", escala))
+        escalado = template if escala == 1 else memorizar(cache_escala, "template", lambda: cv2.resize(
+            template,
+            (max(1, round(template.shape[1] * escala)), max(1, round(template.shape[0] * escala))),
+            interpolation = cv2.INTER_AREA if escala < 1 else cv2.INTER_LINEAR
+        ))
+        altura, largura = escalado.shape[:2]
+        if altura > referencia.shape[0] or largura > referencia.shape[1]:
+            continue
+
+        resultado = mapa_confianca_piramide(escalado, referencia, confianca, niveis_piramide, cache_escala)
+        candidatos, confiancas = maximos_locais(resultado, confianca, largura, altura)
+        todos_candidatos.append(candidatos.array)
+        todas_confiancas.append(confiancas)
+
+    if not todos_candidatos:
+        return Coordenadas(), np.empty(0, dtype=np.float32)
+    return suprimir_sobrepostas(
+        Coordenadas.from_array(np.concatenate(todos_candidatos)),
+        np.concatenate(todas_confiancas),
+        max_resultados
+    )
+
 def capturar_tela (regiao: Coordenada | None = None, cinza=False) -> Imagem:
     """Capturar imagem da tela na `regiao` informada e transformar para `cinza` se requisitado"""
     imagem = object.__new__(Imagem)
@@ -61,6 +228,7 @@ class Imagem:
     Imagem(bot.sistema.Caminho("caminho.png"))
     Imagem.from_bytes(b"")
     Imagem.from_base64("")
+    Imagem.carregar_cache("caminho.png") # Imagem compartilhada pelo `CACHE_IMAGENS`
     ```
 
     ### Transformações
@@ -73,6 +241,8 @@ class Imagem:
     imagem.binarizar()          # Criar uma nova imagem binaria
     imagem.inverter()           # Criar uma nova imagem com as cores invertidas
     imagem.redimensionar(float) # Criar uma nova imagem redimensionada para a % `escala`
+    imagem.inverter(inplace=True)   # Variantes `inplace` alteram a própria imagem sem alocar uma nova
+    imagem.pipeline().recortar(regiao).cinza().binarizar().executar() # Transformações combinadas e com buffers reaproveitados
     ```
 
     ### Sistema
@@ -88,15 +258,27 @@ class Imagem:
     imagem.encontrar_cor(rgb)   # Encontrar a posição `(x, y)` de um pixel que tenha a `cor` rgb
     ```
 
+    ### Comparação
+    ```
+    imagem.hash_perceptual("dhash")     # Hash perceptual `ahash`, `dhash` ou `phash` da imagem
+    imagem.distancia(outra)             # Distância de Hamming entre os hashes perceptuais
+    imagem.diferenca(outra)             # Coordenadas das regiões alteradas entre as imagens
+    esperar_tela_estavel(regiao)        # Aguardar a tela parar de ser alterada
+    ```
+
     ### Procura de Imagem
     ```
     imagem.procurar_imagem(...)  # Procurar a coordenada em que a imagem aparece na `referencia` ou tela caso `None`
     imagem.procurar_imagens(...) # Procurar as coordenadas em que a imagem aparece na `referencia` ou tela caso `None`
+    Imagem.procurar_varias([imagem1, imagem2], referencia) # Procurar várias imagens na mesma `referencia` em paralelo
     ```
     """
 
     pixels: np.ndarray
     """Pixels da imagem BGR ou Cinza"""
+    cache: dict | None = None
+    """Variantes calculadas uma única vez para a imagem, como `cinza` e os níveis da pirâmide
+    - Presente apenas nas imagens obtidas pelo `Imagem.carregar_cache()`"""
 
     def __init__ (self, caminho: bot.sistema.Caminho | str) -> None:
         caminho = bot.sistema.Caminho(str(caminho))
@@ -145,6 +327,13 @@ class Imagem:
             base64.b64decode(texto)
         )
 
+    @classmethod
+    def carregar_cache (cls, caminho: bot.sistema.Caminho | str) -> Imagem:
+        """Obter a imagem do `caminho` pelo `CACHE_IMAGENS`
+        - Arquivo lido apenas na primeira vez ou caso tenha sido alterado
+        - Imagem compartilhada com `pixels` somente leitura. Utilizar o `copiar()` caso necessário alterar"""
+        return CACHE_IMAGENS.carregar(caminho)
+
     @property
     def png (self) -> bytes:
         """Codificar a imagem para `png`"""
@@ -185,48 +374,117 @@ class Imagem:
         root.mainloop()
 
     def recortar (self, regiao: Coordenada) -> Imagem:
-        """Criar uma nova imagem recortada"""
+        """Criar uma nova imagem recortada
+        - Sem cópia, os pixels são uma visão da imagem original"""
         imagem = super().__new__(type(self))
         x, y, x_direita, y_baixo = regiao.to_box()
         imagem.pixels = self.pixels[y : y_baixo, x : x_direita]
         return imagem
 
-    def cinza (self) -> Imagem:
+    def __alteravel (self) -> typing.Self:
+        """Validar se a própria imagem pode ser alterada pelas variantes `inplace`"""
+        assert self.cache is None, f"{self!r} compartilhada pelo cache não pode ser alterada. Utilizar o `copiar()`"
+        return self
+
+    def cinza (self, inplace: bool = False) -> Imagem:
         """Criar uma nova imagem como cinza
-        - Altera os canais RGB por apenas um de escala do cinza"""
-        imagem = super().__new__(type(self))
-        cinza = len(self.pixels.shape) == 2
-        imagem.pixels = np.array(self.pixels) if cinza else cv2.cvtColor(self.pixels, cv2.COLOR_BGR2GRAY)
+        - Altera os canais RGB por apenas um de escala do cinza
+        - `inplace` alterar a própria imagem, sem cópia caso já seja cinza"""
+        if not inplace and self.cache is not None and "cinza" in self.cache:
+            return self.cache["cinza"]
+
+        imagem = self.__alteravel() if inplace else super().__new__(type(self))
+        if len(self.pixels.shape) == 2:
+            imagem.pixels = self.pixels if inplace else np.array(self.pixels)
+        else: imagem.pixels = cv2.cvtColor(self.pixels, cv2.COLOR_BGR2GRAY)
         return imagem
 
-    def binarizar (self) -> Imagem:
+    def binarizar (self, inplace: bool = False) -> Imagem:
         """Criar uma nova imagem binaria
-        - Altera os canais RGB para apenas um de cinza sendo 0 ou 255"""
-        imagem = self.cinza()
-        _, imagem.pixels = cv2.threshold(imagem.pixels, 0, 255, cv2.THRESH_OTSU)
-        return imagem
-
-    def inverter (self) -> Imagem:
-        """Criar uma nova imagem com as cores invertidas"""
-        imagem = self.copiar()
-        imagem.pixels = cv2.bitwise_not(imagem.pixels)
-        return imagem
-
-    def redimensionar (self, escala=2.0) -> Imagem:
-        """Criar uma nova imagem redimensionada para a % `escala`"""
-        imagem = self.copiar()
+        - Altera os canais RGB para apenas um de cinza sendo 0 ou 255
+        - `inplace` alterar a própria imagem, reaproveitando os pixels caso já seja cinza"""
+        if not inplace:
+            imagem = super().__new__(type(self))
+            _, imagem.pixels = cv2.threshold(self.cinza().pixels, 0, 255, cv2.THRESH_OTSU)
+            return imagem
+
+        self.cinza(inplace=True)
+        destino = self.pixels if self.pixels.flags.writeable and self.pixels.flags.c_contiguous else None
+        _, self.pixels = cv2.threshold(self.pixels, 0, 255, cv2.THRESH_OTSU, dst=destino)
+        return self
+
+    def inverter (self, inplace: bool = False) -> Imagem:
+        """Criar uma nova imagem com as cores invertidas
+        - `inplace` alterar a própria imagem, reaproveitando os pixels"""
+        if not inplace:
+            imagem = super().__new__(type(self))
+            imagem.pixels = cv2.bitwise_not(self.pixels)
+            return imagem
+
+        self.__alteravel()
+        destino = self.pixels if self.pixels.flags.writeable and self.pixels.flags.c_contiguous else None
+        self.pixels = cv2.bitwise_not(self.pixels, dst=destino)
+        return self
+
+    def redimensionar (self, escala=2.0, inplace: bool = False) -> Imagem:
+        """Criar uma nova imagem redimensionada para a % `escala`
+        - `inplace` alterar a própria imagem"""
+        imagem = self.__alteravel() if inplace else super().__new__(type(self))
         altura, largura, *_ = map(lambda x: int(x * escala), self.pixels.shape)
-        imagem.pixels = cv2.resize(imagem.pixels, dsize=(largura, altura), interpolation=cv2.INTER_LINEAR)
+        imagem.pixels = cv2.resize(self.pixels, dsize=(largura, altura), interpolation=cv2.INTER_LINEAR)
         return imagem
 
-    def cores (self, limite: int | None = 10) -> list[tuple[bot.tipagem.rgb, int]]:
+    def pipeline (self) -> bot.imagem.PipelineImagem:
+        """Criar um `PipelineImagem` de transformações preguiçosas para a imagem
+        - `imagem.pipeline().recortar(regiao).cinza().binarizar().executar()`"""
+        from bot.imagem.pipeline import PipelineImagem
+        return PipelineImagem(self)
+
+    def cores (self, limite: int | None = 10,
+                     quantizacao: int = 1,
+                     mascara: np.ndarray | Coordenada | None = None,
+                     amostragem: int | None = None) -> list[tuple[bot.tipagem.rgb, int]]:
         """Obter a cor RGB e frequência de cada pixel da imagem
         - `limite` quantidade que será retornada das mais frequentes
+        - `quantizacao` agrupar cada canal em faixas desse tamanho, representadas pelo valor central da faixa
+        - `mascara` considerar apenas os pixels da máscara `altura x largura` diferentes de `0` ou da `Coordenada`
+        - `amostragem` quantidade aproximada de pixels analisados, em intervalos regulares, para imagens grandes
+            - Frequência estimada para a quantidade total de pixels
+        - Frequências iguais na ordem de aparição do pixel
         - `for cor, frequencia in imagem.cores()`"""
-        cinza = len(self.pixels.shape) == 2
-        pixels = self.pixels.flat if cinza else self.pixels.reshape(-1, 3)
-        to_rgb = lambda bgr: (int(bgr), int(bgr), int(bgr)) if cinza else (int(bgr[2]), int(bgr[1]), int(bgr[0]))
-        return collections.Counter(map(to_rgb, pixels)).most_common(limite)
+        assert 1 <= quantizacao <= 256, "A quantização das cores deve ser entre 1 e 256"
+        pixels = self.pixels
+        if isinstance(mascara, Coordenada):
+            x, y, x_direita, y_baixo = mascara.to_box()
+            pixels, mascara = pixels[y : y_baixo, x : x_direita], None
+
+        cinza = len(pixels.shape) == 2
+        pixels = pixels.reshape(-1) if cinza else pixels.reshape(-1, 3)
+        if mascara is not None:
+            pixels = pixels[np.asarray(mascara).reshape(-1) != 0]
+
+        passo = 1
+        if amostragem and len(pixels) > amostragem:
+            passo = -(-len(pixels) // amostragem)
+            pixels = pixels[::passo]
+
+        if quantizacao > 1:
+            # `uint16` para o valor central da faixa não ultrapassar o limite do `uint8` antes do `minimum`
+            pixels = pixels.astype(np.uint16)
+            pixels = np.minimum(pixels // quantizacao * quantizacao + quantizacao // 2, 255).astype(np.uint8)
+
+        # empacotar o pixel `0xRRGGBB` para contar com o `np.unique`
+        empacotados = (
+            pixels.astype(np.uint32) * 0x010101 if cinza else
+            pixels[:, 2].astype(np.uint32) << 16 | pixels[:, 1].astype(np.uint32) << 8 | pixels[:, 0]
+        )
+        valores, indices, frequencias = np.unique(empacotados, return_index=True, return_counts=True)
+        ordem = np.lexsort((indices, -frequencias))[:limite]
+
+        return [
+            ((valor >> 16 & 0xFF, valor >> 8 & 0xFF, valor & 0xFF), frequencia * passo)
+            for valor, frequencia in zip(valores[ordem].tolist(), frequencias[ordem].tolist())
+        ]
 
     def cor_pixel (self, posicao: tuple[int, int]) -> bot.tipagem.rgb:
         """Obter a cor RGB do pixel na `posicao`"""
@@ -264,62 +522,343 @@ class Imagem:
             case _:
                 raise ValueError(f"Modo '{modo}' inesperado")
 
+    def hash_perceptual (self, algoritmo: typing.Literal["ahash", "dhash", "phash"] = "dhash",
+                               tamanho: int = 8) -> int:
+        """Hash perceptual de `tamanho ** 2` bits da imagem reduzida em cinza
+        - `ahash` pixels comparados com a média. Mais rápido
+        - `dhash` pixels comparados com o vizinho da direita. Sensível a gradientes
+        - `phash` frequências baixas da `DCT` comparadas com a mediana. Mais robusto a ruído e compressão
+        - Comparar hashes com o `distancia_hamming()`"""
+        assert tamanho >= 2, "O tamanho do hash deve ser no mínimo 2"
+        cinza = self.cinza().pixels
+        reduzir = lambda largura, altura: cv2.resize(cinza, (largura, altura), interpolation=cv2.INTER_AREA)
+
+        match algoritmo:
+            case "ahash":
+                pixels = reduzir(tamanho, tamanho)
+                bits = pixels > pixels.mean()
+            case "dhash":
+                pixels = reduzir(tamanho + 1, tamanho)
+                bits = pixels[:, 1:] > pixels[:, :-1]
+            case "phash":
+                frequencias = cv2.dct(reduzir(tamanho * 4, tamanho * 4).astype(np.float32))[:tamanho, :tamanho]
+                bits = frequencias > np.median(frequencias.reshape(-1)[1:])
+            case _:
+                raise ValueError(f"Algoritmo de hash '{algoritmo}' inesperado")
+
+        return int.from_bytes(np.packbits(bits.reshape(-1)).tobytes(), "big")
+
+    def distancia (self, outra: Imagem,
+                         algoritmo: typing.Literal["ahash", "dhash", "phash"] = "dhash",
+                         tamanho: int = 8) -> int:
+        """Distância de Hamming entre os hashes perceptuais da imagem e da `outra`
+        - `0` imagens perceptualmente iguais e máximo `tamanho ** 2`"""
+        return distancia_hamming(
+            self.hash_perceptual(algoritmo, tamanho),
+            outra.hash_perceptual(algoritmo, tamanho)
+        )
+
+    def diferenca (self, outra: Imagem,
+                         tolerancia: int = 10,
+                         margem: int = 5,
+                         area_minima: int = 1) -> list[Coordenada]:
+        """Obter as coordenadas das regiões alteradas entre a imagem e a `outra` de mesmas dimensões
+        - `tolerancia` diferença máxima de um canal do pixel para ser considerado igual
+        - `margem` distância em pixels para agrupar alterações próximas na mesma região
+        - `area_minima` quantidade mínima de pixels alterados na região
+        - Retornado em ordem da posição `(y, x)`"""
+        assert self.pixels.shape[:2] == outra.pixels.shape[:2], \
+            f"Dimensões diferentes para comparar as imagens {self!r} e {outra!r}"
+        atual, anterior = self.pixels, outra.pixels
+        if atual.ndim != anterior.ndim:
+            atual, anterior = self.cinza().pixels, outra.cinza().pixels
+
+        diferenca = cv2.absdiff(atual, anterior)
+        if diferenca.ndim == 3: diferenca = diferenca.max(axis=2)
+        alterados = diferenca > tolerancia
+        ys, xs = np.nonzero(alterados)
+        if not len(ys): return []
+
+        # agrupar as alterações próximas e obter a caixa apenas dos pixels alterados de cada grupo
+        mascara = alterados.view(np.uint8)
+        if margem > 0: mascara = cv2.dilate(mascara, np.ones((2 * margem + 1, 2 * margem + 1), np.uint8))
+        quantidade, rotulos = cv2.connectedComponents(mascara, connectivity=8)
+        grupos = rotulos[ys, xs]
+        x1, y1 = np.full(quantidade, xs.max()), np.full(quantidade, ys.max())
+        x2, y2 = np.zeros(quantidade, xs.dtype), np.zeros(quantidade, ys.dtype)
+        np.minimum.at(x1, grupos, xs)
+        np.minimum.at(y1, grupos, ys)
+        np.maximum.at(x2, grupos, xs)
+        np.maximum.at(y2, grupos, ys)
+
+        validos = np.flatnonzero(np.bincount(grupos, minlength=quantidade) >= max(1, area_minima))
+        boxes = np.stack((x1, y1, x2 + 1, y2 + 1), axis=1)[validos]
+        return list(Coordenadas.from_boxes(boxes).ordenar("y", "x"))
+
     def procurar_imagens (self, confianca: bot.tipagem.PORCENTAGENS = 0.9,
                                 regiao: Coordenada | None = None,
                                 referencia: Imagem | None = None,
                                 cinza = False,
                                 segundos = 0,
-                                delay = 0.5) -> list[Coordenada]:
+                                delay = 0.5,
+                                max_resultados: int | None = None,
+                                niveis_piramide: int = 0,
+                                escalas: typing.Iterable[float] = (1.0,)) -> list[Coordenada]:
         """Procurar as coordenadas em que a imagem aparece na `referencia` ou tela caso `None`
         - `confianca` porcentagem de certeza
         - `regiao` especifica uma parte da tela ou imagem de referência
         - `cinza` compara ambas imagem como cinza (mais rápido)
-        - `segundos` tempo de procura, a cada `delay` segundos, caso não encontre na primeira vez"""
+        - `segundos` tempo de procura, a cada `delay` segundos, caso não encontre na primeira vez
+        - `max_resultados` limitar a quantidade de coordenadas de maior confiança
+        - `niveis_piramide` procurar primeiro com as imagens reduzidas em `2 ** niveis_piramide` e refinar apenas os candidatos (mais rápido)
+        - `escalas` procurar também a imagem redimensionada nas escalas, útil para DPI ou zoom diferentes. Ex: `(0.8, 1.0, 1.25)`
+        - Coordenadas sobrepostas são suprimidas pelo `suprimir_nao_maximos()`
+        - Retornado em ordem crescente de confiança"""
         confianca = float(confianca)
         segundos, delay = (max(0, n) for n in (segundos, delay))
+        escalas = tuple(escalas)
 
-        np_imagem = (self.cinza() if cinza else self).pixels
-        altura, largura, *_ = np_imagem.shape
+        template = self.cinza() if cinza else self
         x_offset, y_offset, *_ = regiao or (0, 0)
 
         if referencia and cinza: referencia = referencia.cinza()
         if referencia and regiao: referencia = referencia.recortar(regiao)
 
         cronometro = bot.tempo.Cronometro()
-        confianca_coordenadas = bot.estruturas.PriorityQueue[tuple[float, Coordenada]](comparador=lambda item: item[0])
-        while not confianca_coordenadas:
+        coordenadas = Coordenadas()
+        while not coordenadas:
             np_referencia = (referencia or capturar_tela(regiao, cinza)).pixels
-            resultado = cv2.matchTemplate(np_imagem, np_referencia, cv2.TM_CCOEFF_NORMED)
-            posicoes_confianca = np.where(resultado >= confianca) # type: ignore
+            coordenadas, _ = procurar_template(
+                template.pixels, np_referencia, confianca, niveis_piramide, escalas, max_resultados, template.cache
+            )
 
-            # criar as coordenadas e filtrar possíveis coordenadas com o centro dentro de outra
-            for y, x, *_ in zip(*posicoes_confianca):
-                coordenada = Coordenada(x + x_offset, y + y_offset, largura, altura)
-                if any(c in coordenada for _, c in confianca_coordenadas): continue
-                confianca = float(resultado[y, x])
-                confianca_coordenadas.add((confianca, coordenada))
-
-            if segundos and not confianca_coordenadas: time.sleep(delay)
+            if segundos and not coordenadas: time.sleep(delay)
             if cronometro() > segundos: break
 
-        return [c for _, c in confianca_coordenadas]
+        return list(coordenadas.deslocar((x_offset, y_offset)))
 
     def procurar_imagem (self, confianca: bot.tipagem.PORCENTAGENS = 0.9,
                                regiao: Coordenada | None = None,
                                referencia: Imagem | None = None,
                                cinza = False,
                                segundos = 0,
-                               delay = 0.5) -> Coordenada | None:
+                               delay = 0.5,
+                               niveis_piramide: int = 0,
+                               escalas: typing.Iterable[float] = (1.0,)) -> Coordenada | None:
         """Procurar a coordenada em que a imagem aparece na `referencia` ou tela caso `None`
         - `confianca` porcentagem de certeza
         - `regiao` especifica uma parte da tela ou imagem de referência
         - `cinza` compara ambas imagem como cinza (mais rápido)
-        - `segundos` tempo de procura, a cada `delay` segundos, caso não encontre na primeira vez"""
-        return (self.procurar_imagens(confianca, regiao, referencia, cinza, segundos, delay) or [None])[0]
+        - `segundos` tempo de procura, a cada `delay` segundos, caso não encontre na primeira vez
+        - `niveis_piramide` e `escalas` conforme o `procurar_imagens()`"""
+        return (self.procurar_imagens(
+            confianca, regiao, referencia, cinza, segundos, delay,
+            niveis_piramide = niveis_piramide,
+            escalas = escalas
+        ) or [None])[0]
+
+    @staticmethod
+    def procurar_varias (templates: typing.Iterable[Imagem],
+                         referencia: Imagem | None = None,
+                         confianca: bot.tipagem.PORCENTAGENS = 0.9,
+                         regiao: Coordenada | None = None,
+                         cinza = False,
+                         segundos = 0,
+                         delay = 0.5,
+                         primeira = False,
+                         workers: int | None = None,
+                         max_resultados: int | None = None,
+                         niveis_piramide: int = 0,
+                         escalas: typing.Iterable[float] = (1.0,)) -> list[list[Coordenada]]:
+        """Procurar as coordenadas em que cada um dos `templates` aparece na `referencia` ou tela caso `None`
+        - A `referencia` é convertida para cinza e recortada na `regiao` apenas uma vez e compartilhada entre os templates
+        - Procura realizada em paralelo com `workers` threads. Default quantidade de CPUs
+        - `primeira` finalizar assim que algum template for encontrado. Os demais ficam sem coordenadas
+        - `segundos` tempo de procura, a cada `delay` segundos, caso nenhum template seja encontrado na primeira vez
+        - Demais parâmetros conforme o `procurar_imagens()`
+        - Retornado as coordenadas de cada template na mesma ordem dos `templates`"""
+        confianca = float(confianca)
+        segundos, delay = (max(0, n) for n in (segundos, delay))
+        escalas = tuple(escalas)
+        templates = [template.cinza() if cinza else template for template in templates]
+        x_offset, y_offset, *_ = regiao or (0, 0)
+        resultados = [list[Coordenada]() for _ in templates]
+        if not templates: return resultados
+
+        if referencia and cinza: referencia = referencia.cinza()
+        if referencia and regiao: referencia = referencia.recortar(regiao)
+
+        procurar = lambda template, np_referencia: procurar_template(
+            template.pixels, np_referencia, confianca, niveis_piramide, escalas, max_resultados, template.cache
+        )[0]
+        workers = max(1, min(len(templates), workers or os.cpu_count() or 1))
+        pool = futures.ThreadPoolExecutor(workers, "bot-imagem-procurar")
+        cronometro = bot.tempo.Cronometro()
+        try:
+            while True:
+                np_referencia = (referencia or capturar_tela(regiao, cinza)).pixels
+                indices = {
+                    pool.submit(procurar, template, np_referencia): indice
+                    for indice, template in enumerate(templates)
+                }
+                for future in futures.as_completed(indices):
+                    coordenadas = future.result()
+                    resultados[indices[future]] = list(coordenadas.deslocar((x_offset, y_offset)))
+                    if primeira and coordenadas:
+                        for pendente in indices: pendente.cancel()
+                        break
+
+                encontrado = any(resultados)
+                if segundos and not encontrado: time.sleep(delay)
+                if encontrado or cronometro() > segundos: break
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        return resultados
+
+def esperar_tela_estavel (regiao: Coordenada | None = None,
+                          segundos_estavel: float = 0.5,
+                          timeout: float = 10.0,
+                          delay: float = 0.1,
+                          distancia_maxima: int = 0,
+                          tamanho_hash: int = 16) -> Imagem | None:
+    """Aguardar a tela na `regiao` ficar sem alterações por `segundos_estavel`
+    - Comparado o `dhash` de `tamanho_hash ** 2` bits das capturas em cinza, a cada `delay` segundos
+    - `distancia_maxima` distância de Hamming tolerada entre as capturas
+    - Retornado a última captura em cinza ou `None` caso não tenha estabilizado em `timeout` segundos"""
+    cronometro = bot.tempo.Cronometro()
+    anterior: int | None = None
+
+    def capturar () -> tuple[Imagem, bool]:
+        nonlocal anterior
+        imagem = capturar_tela(regiao, cinza=True)
+        atual = imagem.hash_perceptual("dhash", tamanho_hash)
+        if anterior is None or distancia_hamming(atual, anterior) > distancia_maxima:
+            anterior = atual
+            cronometro.resetar()
+        return imagem, cronometro() >= segundos_estavel
+
+    resultado = bot.tempo.esperar(capturar, timeout, delay, comparador=lambda item: item[1])
+    return resultado.valor()[0] if resultado else None
+
+class VariantesCache (dict):
+    """`Imagem.cache` das imagens do `CacheImagens`
+    - Variantes memorizadas após a leitura, como as da procura, revalidam os limites do `cache_imagens`"""
+
+    def __init__ (self, cache_imagens: CacheImagens, valores: dict | None = None) -> None:
+        super().__init__(valores or {})
+        self.cache_imagens = cache_imagens
+
+class CacheImagens:
+    """Cache `LRU` das imagens carregadas do disco pelo `Imagem.carregar_cache()`
+    - Chave pelo caminho absoluto e validado pela data de modificação e tamanho do arquivo
+    - Armazenado a imagem BGR, a variante `cinza` e as variantes da procura em `Imagem.cache`
+    - `bytes_maximo` e `quantidade_maxima` limitam o cache, descartando as imagens menos utilizadas
+    - Thread-safe"""
+
+    def __init__ (self, bytes_maximo: int = 256 * 2 ** 20, quantidade_maxima: int = 256) -> None:
+        self.lock = threading.Lock()
+        self.imagens = collections.OrderedDict[str, tuple[tuple[int, int], Imagem]]()
+        self.acertos = self.falhas = self.invalidacoes = self.descartes = 0
+        self.configurar(bytes_maximo, quantidade_maxima)
+
+    def __repr__ (self) -> str:
+        return f"<CacheImagens com {len(self.imagens)} imagem(ns)>"
+
+    def configurar (self, bytes_maximo: int = 256 * 2 ** 20, quantidade_maxima: int = 256) -> typing.Self:
+        """Configurar os limites do cache e descartar o excedente"""
+        assert bytes_maximo > 0 and quantidade_maxima > 0, "Limites do cache de imagens devem ser maiores que 0"
+        self.bytes_maximo, self.quantidade_maxima = bytes_maximo, quantidade_maxima
+        with self.lock: self.__descartar()
+        return self
+
+    def carregar (self, caminho: bot.sistema.Caminho | str) -> Imagem:
+        """Obter a imagem do `caminho` pelo cache ou ler do arquivo"""
+        caminho = bot.sistema.Caminho(str(caminho))
+        assert caminho.existe(), f"Imagem não encontrada {caminho!r}"
+        estado = os.stat(caminho.string)
+        versao = (estado.st_mtime_ns, estado.st_size)
+
+        with self.lock:
+            versao_cache, imagem = self.imagens.get(caminho.string, (None, None))
+            if imagem is not None and versao_cache == versao:
+                self.acertos += 1
+                self.imagens.move_to_end(caminho.string)
+                return imagem
+            self.falhas += 1
+            if imagem is not None: self.invalidacoes += 1
+
+        imagem = Imagem(caminho)
+        cinza = imagem.cinza()
+        imagem.pixels.flags.writeable = cinza.pixels.flags.writeable = False
+        imagem.cache, cinza.cache = VariantesCache(self, { "cinza": cinza }), VariantesCache(self, { "cinza": cinza })
+
+        with self.lock:
+            self.imagens[caminho.string] = (versao, imagem)
+            self.imagens.move_to_end(caminho.string)
+            self.__descartar()
+        return imagem
+
+    def verificar_limites (self) -> None:
+        """Descartar as imagens menos utilizadas caso os limites tenham sido ultrapassados
+        - Chamado ao memorizar uma nova variante de uma imagem do cache"""
+        with self.lock: self.__descartar()
+
+    def limpar (self) -> None:
+        """Remover todas as imagens do cache"""
+        with self.lock: self.imagens.clear()
+
+    def tamanho_bytes (self) -> int:
+        """Quantidade de bytes utilizados pelas imagens e variantes do cache"""
+        with self.lock: return sum(map(self.__bytes_imagem, (imagem for _, imagem in self.imagens.values())))
+
+    def estatisticas (self) -> dict[str, int]:
+        """Estatísticas `acertos, falhas, invalidacoes, descartes, quantidade, bytes` do cache"""
+        tamanho = self.tamanho_bytes()
+        with self.lock: return {
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "invalidacoes": self.invalidacoes,
+            "descartes": self.descartes,
+            "quantidade": len(self.imagens),
+            "bytes": tamanho,
+        }
+
+    @staticmethod
+    def __bytes_variantes (cache: dict) -> int:
+        # cópia dos valores pois as variantes são memorizadas sem o `lock` pelas threads da procura
+        return sum(
+            valor.nbytes if isinstance(valor, np.ndarray) else CacheImagens.__bytes_variantes(valor)
+            for valor in list(cache.values())
+            if isinstance(valor, (np.ndarray, dict))
+        )
+
+    def __bytes_imagem (self, imagem: Imagem) -> int:
+        cinza: Imagem = imagem.cache["cinza"] # type: ignore
+        return (
+            imagem.pixels.nbytes + self.__bytes_variantes(imagem.cache) # type: ignore
+            + cinza.pixels.nbytes + self.__bytes_variantes(cinza.cache) # type: ignore
+        )
+
+    def __descartar (self) -> None:
+        """Descartar as imagens menos utilizadas até respeitar os limites
+        - Necessário possuir o `lock`"""
+        total = sum(map(self.__bytes_imagem, (imagem for _, imagem in self.imagens.values())))
+        while self.imagens and (len(self.imagens) > self.quantidade_maxima or total > self.bytes_maximo):
+            _, (_, imagem) = self.imagens.popitem(last=False)
+            total -= self.__bytes_imagem(imagem)
+            self.descartes += 1
+
+CACHE_IMAGENS = CacheImagens()
+"""Cache das imagens do processo utilizado pelo `Imagem.carregar_cache()`"""
 
 __all__ = [
     "Imagem",
+    "CacheImagens",
+    "CACHE_IMAGENS",
     "Coordenada",
     "cor_similar",
+    "distancia_hamming",
+    "esperar_tela_estavel",
     "capturar_tela"
 ]
\ No newline at end of file
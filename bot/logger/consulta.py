@@ -0,0 +1,253 @@
+"""Módulo para consultar os logs persistidos em `MainLogger.CAMINHO_DIRETORIO_PERSISTENCIA`
+- Índice incremental `sqlite` mantido no próprio diretório
+- Executar `python -m bot.logger.consulta [diretorio] --trace_status ERROR --extra.item 123 --inicio 2024-01-01`"""
+
+# std
+from __future__ import annotations
+import io, os, gzip, json, typing
+from datetime import datetime as Datetime
+# interno
+import bot
+from bot.sistema import Caminho
+from bot.logger.setup import MainLogger
+
+SQL_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS arquivos (
+        nome        TEXT PRIMARY KEY,
+        tamanho     INTEGER NOT NULL,
+        modificacao REAL NOT NULL,
+        posicao     INTEGER NOT NULL
+    )""",
+    """CREATE TABLE IF NOT EXISTS registros (
+        arquivo      TEXT NOT NULL,
+        posicao      INTEGER NOT NULL,
+        id           TEXT,
+        timestamp    TEXT,
+        level        TEXT,
+        name         TEXT,
+        trace_id     TEXT,
+        trace_status TEXT
+    )""",
+    "CREATE TABLE IF NOT EXISTS chaves_extra (chave TEXT PRIMARY KEY)",
+    """CREATE TABLE IF NOT EXISTS extras (
+        registro INTEGER NOT NULL,
+        chave    TEXT NOT NULL,
+        valor    TEXT
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_registros_arquivo ON registros (arquivo, posicao)",
+    "CREATE INDEX IF NOT EXISTS idx_registros_timestamp ON registros (timestamp)",
+    "CREATE INDEX IF NOT EXISTS idx_registros_trace ON registros (trace_id)",
+    "CREATE INDEX IF NOT EXISTS idx_registros_status ON registros (trace_status, level)",
+    "CREATE INDEX IF NOT EXISTS idx_extras ON extras (chave, valor, registro)",
+)
+
+def abrir_log (caminho: Caminho) -> typing.BinaryIO:
+    """Abrir o arquivo de log em modo binário, descomprimindo caso `.gz` ou `.zst`"""
+    if caminho.nome.endswith(".gz"):
+        return typing.cast(typing.BinaryIO, gzip.open(caminho.path, "rb"))
+    if caminho.nome.endswith(".zst"):
+        import zstandard # type: ignore
+        leitor = zstandard.ZstdDecompressor().stream_reader(open(caminho.path, "rb"), closefd=True)
+        return typing.cast(typing.BinaryIO, io.BufferedReader(leitor))
+    return open(caminho.path, "rb")
+
+class ConsultaLogs:
+    """Classe para indexar e consultar os logs `.jsonl` persistidos
+    - `diretorio` dos logs. Default `MainLogger.CAMINHO_DIRETORIO_PERSISTENCIA`
+    - `chaves_extra` chaves do `extra` que serão indexadas para filtro
+        - Chaves ainda não indexadas causam a reindexação completa e são mantidas nas próximas consultas
+    - Índice `sqlite` salvo em `diretorio/.indice.sqlite` e atualizado apenas com o conteúdo novo dos arquivos
+    - Registros lidos diretamente na posição do arquivo, sem ler os arquivos inteiros
+
+    ```
+    consulta = ConsultaLogs(chaves_extra=["item"])
+    consulta.indexar()
+    for registro in consulta.consultar(trace_status="ERROR", inicio=Datetime(2024, 1, 1), item="123"):
+        print(registro["message"])
+    ```"""
+
+    NOME_INDICE = ".indice.sqlite"
+
+    def __init__ (self, diretorio: Caminho | str | None = None,
+                        chaves_extra: typing.Iterable[str] = ()) -> None:
+        self.diretorio = Caminho(str(diretorio)) if diretorio else MainLogger.CAMINHO_DIRETORIO_PERSISTENCIA
+        self.chaves_extra = set(chaves_extra)
+        self.database = bot.database.Sqlite(self.diretorio.criar_diretorios() / self.NOME_INDICE)
+        for sql in SQL_SCHEMA:
+            self.database.execute(sql)
+
+        indexadas = {str(chave) for chave, *_ in self.database.execute("SELECT chave FROM chaves_extra")}
+        if self.chaves_extra - indexadas:
+            for tabela in ("arquivos", "registros", "extras"):
+                self.database.execute(f"DELETE FROM {tabela}")
+            self.database.execute_many("INSERT OR IGNORE INTO chaves_extra VALUES (?)", [(c,) for c in self.chaves_extra])
+        self.chaves_extra |= indexadas
+        self.database.commit()
+
+    def __repr__ (self) -> str:
+        return f"<ConsultaLogs '{self.diretorio.string}'>"
+
+    def indexar (self) -> int:
+        """Atualizar o índice com os registros novos dos arquivos do diretório
+        - Arquivos removidos ou recriados, ex: comprimidos após rotação, têm os registros reindexados
+        - Retornado a quantidade de registros indexados"""
+        indexados = {
+            str(nome): (int(tamanho), float(modificacao), int(posicao)) # type: ignore
+            for nome, tamanho, modificacao, posicao in self.database.execute("SELECT * FROM arquivos")
+        }
+
+        existentes = dict[str, os.stat_result]()
+        with os.scandir(self.diretorio.path) as entradas:
+            for entrada in entradas:
+                if entrada.is_file() and ".jsonl" in entrada.name and not entrada.name.endswith(".tmp"):
+                    existentes[entrada.name] = entrada.stat()
+
+        for nome in indexados.keys() - existentes.keys():
+            self.__remover_arquivo(nome)
+
+        quantidade = 0
+        for nome in sorted(existentes):
+            stat, anterior = existentes[nome], indexados.get(nome)
+            if anterior and anterior[:2] == (stat.st_size, stat.st_mtime): continue
+
+            # Apenas arquivos `.jsonl` crescem de forma incremental
+            posicao = anterior[2] if anterior and nome.endswith(".jsonl") and stat.st_size >= anterior[0] else 0
+            if anterior and not posicao: self.__remover_arquivo(nome)
+            quantidade += self.__indexar_arquivo(nome, posicao, stat)
+            self.database.commit()
+
+        return quantidade
+
+    def __remover_arquivo (self, nome: str) -> None:
+        self.database.execute("DELETE FROM extras WHERE registro IN (SELECT rowid FROM registros WHERE arquivo = ?)", nome)
+        self.database.execute("DELETE FROM registros WHERE arquivo = ?", nome)
+        self.database.execute("DELETE FROM arquivos WHERE nome = ?", nome)
+
+    def __indexar_arquivo (self, nome: str, posicao: int, stat: os.stat_result) -> int:
+        """Indexar as linhas completas do arquivo a partir da `posicao`"""
+        quantidade, cursor = 0, self.database.conexao.cursor()
+        with abrir_log(self.diretorio / nome) as arquivo:
+            if posicao: arquivo.seek(posicao)
+            for linha in arquivo:
+                if not linha.endswith(b"\n"): break # linha ainda sendo escrita
+                inicio, posicao = posicao, posicao + len(linha)
+                try: registro = json.loads(linha)
+                except ValueError: continue
+                if not isinstance(registro, dict): continue
+
+                trace = registro.get("trace") if isinstance(registro.get("trace"), dict) else {}
+                cursor.execute(
+                    "INSERT INTO registros VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (nome, inicio, registro.get("id"), registro.get("timestamp"), registro.get("level"),
+                     registro.get("name"), trace.get("id"), trace.get("status"))
+                )
+
+                extra = registro.get("extra") if isinstance(registro.get("extra"), dict) else {}
+                if chaves := self.chaves_extra & extra.keys():
+                    cursor.executemany(
+                        "INSERT INTO extras VALUES (?, ?, ?)",
+                        [(cursor.lastrowid, chave, str(extra[chave])) for chave in chaves]
+                    )
+                quantidade += 1
+
+        cursor.execute(
+            "INSERT OR REPLACE INTO arquivos VALUES (?, ?, ?, ?)",
+            (nome, stat.st_size, stat.st_mtime, posicao)
+        )
+        cursor.close()
+        return quantidade
+
+    def linhas (self, id: str | None = None,
+                      level: str | None = None,
+                      name: str | None = None,
+                      trace_id: str | None = None,
+                      trace_status: str | None = None,
+                      inicio: Datetime | str | None = None,
+                      fim: Datetime | str | None = None,
+                      limite: int | None = None,
+                      atualizar: bool = True,
+                      **extra: bot.tipagem.SupportsStr) -> typing.Generator[str, None, None]:
+        """Obter as linhas `json` dos registros que atendem aos filtros informados
+        - `inicio` e `fim` inclusivos, comparados com o `timestamp` do log
+        - `extra` filtros pelas `chaves_extra` indexadas
+        - `atualizar` para indexar os registros novos antes da consulta
+        - Ordenado pelo arquivo e posição no arquivo"""
+        if atualizar: self.indexar()
+        assert extra.keys() <= self.chaves_extra, f"Chaves extra {set(extra) - self.chaves_extra} não indexadas"
+
+        filtros, parametros = list[str](), list[bot.tipagem.tipoSQL]()
+        for coluna, valor in (("id", id), ("level", level), ("name", name),
+                              ("trace_id", trace_id), ("trace_status", trace_status)):
+            if valor is None: continue
+            filtros.append(f"r.{coluna} = ?")
+            parametros.append(valor)
+        for operador, data in ((">=", inicio), ("<=", fim)):
+            if data is None: continue
+            filtros.append(f"r.timestamp {operador} ?")
+            parametros.append(data.strftime(MainLogger.FORMATO_DATA_LOG) if isinstance(data, Datetime) else data)
+        for chave, valor in extra.items():
+            filtros.append("r.rowid IN (SELECT registro FROM extras WHERE chave = ? AND valor = ?)")
+            parametros.extend((chave, str(valor)))
+
+        sql = " ".join((
+            "SELECT r.arquivo, r.posicao FROM registros r",
+            f"WHERE {" AND ".join(filtros)}" if filtros else "",
+            "ORDER BY r.arquivo, r.posicao",
+            f"LIMIT {int(limite)}" if limite else "",
+        ))
+
+        arquivo_atual, arquivo, atual = "", typing.cast(typing.BinaryIO | None, None), 0
+        try:
+            for nome, posicao in self.database.execute(sql, *parametros):
+                nome, posicao = str(nome), int(posicao) # type: ignore
+                if nome != arquivo_atual:
+                    if arquivo: arquivo.close()
+                    arquivo_atual, arquivo, atual = nome, abrir_log(self.diretorio / nome), 0
+                assert arquivo is not None
+
+                # Comprimidos sem `seek` avançam lendo até a posição, sempre crescente no arquivo
+                if arquivo.seekable(): arquivo.seek(posicao)
+                else: arquivo.read(posicao - atual)
+                linha = arquivo.readline()
+                atual = posicao + len(linha)
+                yield linha.decode("utf-8").rstrip("\n")
+        finally:
+            if arquivo: arquivo.close()
+
+    def consultar (self, id: str | None = None,
+                         level: str | None = None,
+                         name: str | None = None,
+                         trace_id: str | None = None,
+                         trace_status: str | None = None,
+                         inicio: Datetime | str | None = None,
+                         fim: Datetime | str | None = None,
+                         limite: int | None = None,
+                         atualizar: bool = True,
+                         **extra: bot.tipagem.SupportsStr) -> typing.Generator[dict[str, typing.Any], None, None]:
+        """Obter os registros que atendem aos filtros informados
+        - Mesmos filtros do `linhas()`
+        - Registros obtidos sob demanda pelo `Generator`"""
+        for linha in self.linhas(id, level, name, trace_id, trace_status,
+                                 inicio, fim, limite, atualizar, **extra):
+            yield json.loads(linha)
+
+if __name__ == "__main__":
+    diretorio, *_ = bot.argumentos.posicionais() or [None]
+    extra = {
+        nome.removeprefix("extra."): valor
+        for nome, valor in bot.argumentos.setup.NOMEADOS.items()
+        if nome.startswith("extra.")
+    }
+    filtros = {
+        nome: bot.argumentos.nomeado_ou(nome) or None
+        for nome in ("id", "level", "name", "trace_id", "trace_status", "inicio", "fim")
+    }
+
+    consulta = ConsultaLogs(diretorio, chaves_extra=extra)
+    for linha in consulta.linhas(
+        **filtros, # type: ignore
+        limite = bot.argumentos.nomeado_ou("limite", 0) or None,
+        **extra
+    ): print(linha)
+
+__all__ = ["ConsultaLogs"]
@@ -1,3 +1,3 @@
 """Módulo com as interfaces de log que podem ser importadas"""
 
-from bot.logger.setup import MainLogger, TracerLogger
\ No newline at end of file
+from bot.logger.setup import MainLogger, TracerLogger, SpanTracer
\ No newline at end of file
@@ -0,0 +1,164 @@
+# std
+import sys, math, time, typing, logging, threading, collections
+
+class EstadoLocal:
+    """Estado da amostragem e limite do limitador para um local de chamada `arquivo:linha`"""
+
+    __slots__ = ("contador", "tokens", "atualizacao")
+
+    def __init__ (self, tokens: float) -> None:
+        self.contador = 0
+        self.tokens = tokens
+        self.atualizacao = time.monotonic()
+
+class EstadoRepetidos:
+    """Estado do agrupamento de mensagens repetidas de um dono para um local de chamada `arquivo:linha`
+    - Identidade da mensagem composta pelo texto e `extra` do log"""
+
+    __slots__ = ("logger", "nivel", "mensagem", "extra", "repetidos")
+
+    def __init__ (self, logger: logging.Logger,
+                        nivel: int,
+                        mensagem: str,
+                        extra: dict[str, typing.Any]) -> None:
+        self.logger = logger
+        self.nivel = nivel
+        self.mensagem = mensagem
+        self.extra = extra
+        self.repetidos = 0
+
+    def repetida (self, mensagem: str, extra: dict[str, typing.Any]) -> bool:
+        """Checar se a `mensagem` e o `extra` do log são os mesmos do último"""
+        return mensagem == self.mensagem and extra.get("extra") == self.extra.get("extra")
+
+class LimitadorLogs:
+    """Limitar os logs `DEBUG` e `INFO` por local de chamada `arquivo:linha`
+    - Logs `WARNING` ou superior nunca são suprimidos
+    - `logs_por_segundo` limite por local de chamada. `0` sem limite
+    - `amostragem` fração dos logs mantidos por local de chamada. `1.0` todos
+    - `agrupar_repetidos` suprimir mensagens idênticas e consecutivas do mesmo local e dono
+        - Dono sendo o id do `TracerLogger`, logs de tracers diferentes nunca são agrupados
+        - Mensagem idêntica quando o texto e o `extra` forem iguais
+        - Registrado um log `Mensagem repetida N vez(es)`, com o `extra` e `trace` do último, quando a mensagem mudar ou ao `descarregar()`
+    - `suprimidos` contagem dos logs suprimidos por local de chamada"""
+
+    def __init__ (self) -> None:
+        self.lock = threading.Lock()
+        self.locais = dict[tuple[str, int], EstadoLocal]()
+        self.repetidos = dict[str | None, dict[tuple[str, int], EstadoRepetidos]]()
+        self.suprimidos = collections.Counter[str]()
+        self.configurar()
+
+    def __repr__ (self) -> str:
+        return f"<LimitadorLogs ativo={self.ativo} suprimidos={self.suprimidos.total()}>"
+
+    def configurar (self, logs_por_segundo: float = 0.0,
+                          amostragem: float = 1.0,
+                          agrupar_repetidos: bool = False) -> typing.Self:
+        """Configurar os critérios do limitador"""
+        assert 0.0 < amostragem <= 1.0, "A amostragem dos logs deve ser entre 0.0 e 1.0"
+        self.logs_por_segundo = max(0.0, logs_por_segundo)
+        self.amostragem = amostragem
+        self.agrupar_repetidos = agrupar_repetidos
+        self.ativo = bool(self.logs_por_segundo) or amostragem < 1.0 or agrupar_repetidos
+        return self
+
+    def permitir (self, logger: logging.Logger,
+                        nivel: int,
+                        mensagem: str,
+                        extra: dict[str, typing.Any],
+                        suprimidos: collections.Counter[str] | None = None,
+                        dono: str | None = None,
+                        profundidade: int = 2) -> bool:
+        """Checar se o log do local de chamada, a `profundidade` frames acima, deve ser realizado
+        - `extra` argumento do log, com as propriedades `extra` e `trace`
+        - `suprimidos` contador adicional, por motivo, para os logs suprimidos
+        - `dono` id do `TracerLogger` para separar o agrupamento de repetidos"""
+        if not self.ativo or nivel >= logging.WARNING:
+            return True
+
+        frame = sys._getframe(profundidade)
+        chave = (frame.f_code.co_filename, frame.f_lineno)
+        anterior: EstadoRepetidos | None = None
+        motivo: str | None = None
+
+        with self.lock:
+            estado = self.locais.get(chave) or self.locais.setdefault(chave, EstadoLocal(max(1.0, self.logs_por_segundo)))
+
+            if self.agrupar_repetidos:
+                repetidos = self.repetidos.setdefault(dono, {})
+                atual = repetidos.get(chave)
+                if atual and atual.repetida(mensagem, extra):
+                    atual.repetidos += 1
+                    motivo = "repetido"
+                else:
+                    if atual and atual.repetidos: anterior = atual
+                    repetidos[chave] = EstadoRepetidos(logger, nivel, mensagem, extra)
+
+            # Manter `amostragem` dos logs de forma determinística, incluindo o primeiro
+            if motivo is None and self.amostragem < 1.0:
+                estado.contador += 1
+                if math.ceil(estado.contador * self.amostragem) == math.ceil((estado.contador - 1) * self.amostragem):
+                    motivo = "amostragem"
+
+            # Token bucket com capacidade de 1 segundo
+            if motivo is None and self.logs_por_segundo:
+                agora = time.monotonic()
+                estado.tokens = min(max(1.0, self.logs_por_segundo),
+                                    estado.tokens + (agora - estado.atualizacao) * self.logs_por_segundo)
+                estado.atualizacao = agora
+                if estado.tokens >= 1.0: estado.tokens -= 1.0
+                else: motivo = "limite"
+
+            if motivo:
+                self.suprimidos[f"{chave[0]}:{chave[1]}"] += 1
+                if suprimidos is not None: suprimidos[motivo] += 1
+
+        if anterior:
+            # `__log_repetidos` e `permitir` acima do local de chamada
+            self.__log_repetidos(anterior, profundidade + 2)
+        return motivo is None
+
+    def __log_repetidos (self, estado: EstadoRepetidos, stacklevel: int) -> None:
+        extra = estado.extra | { "extra": dict(estado.extra.get("extra") or {}) | { "repeticoes": estado.repetidos } }
+        estado.logger.log(
+            estado.nivel,
+            f"Mensagem repetida {estado.repetidos} vez(es): {estado.mensagem}",
+            stacklevel = stacklevel,
+            extra = extra
+        )
+
+    def descarregar (self, dono: str | None = None,
+                           todos: bool = False,
+                           stacklevel: int = 1) -> None:
+        """Registrar os logs `Mensagem repetida N vez(es)` pendentes do `dono` e descartar o seu estado
+        - `todos` para descarregar os pendentes de todos os donos
+        - `stacklevel` do local de chamada a partir de quem chamou o `descarregar`"""
+        with self.lock:
+            if todos: donos, self.repetidos = list(self.repetidos.values()), {}
+            else: donos = [self.repetidos.pop(dono, {})]
+
+        for estado in (estado for repetidos in donos for estado in repetidos.values()):
+            # `__log_repetidos` e `descarregar` acima do local de chamada
+            if estado.repetidos: self.__log_repetidos(estado, stacklevel + 2)
+
+    def encerrar (self, logger: logging.Logger) -> None:
+        """Descarregar os repetidos e registrar o resumo dos logs suprimidos no `logger`
+        - Registrado para executar ao fim do Python automaticamente"""
+        self.descarregar(todos=True, stacklevel=2)
+        with self.lock:
+            suprimidos, self.suprimidos = dict(self.suprimidos), collections.Counter[str]()
+        if suprimidos: logger.info(
+            f"Foram suprimidos {sum(suprimidos.values())} log(s) pelo limitador",
+            stacklevel = 2,
+            extra = { "extra": { "suprimidos": suprimidos } }
+        )
+
+LIMITADOR = LimitadorLogs()
+"""Limitador dos logs do processo
+- Configurado pelo `MainLogger.inicializar_logger()`"""
+
+__all__ = [
+    "LIMITADOR",
+    "LimitadorLogs",
+]
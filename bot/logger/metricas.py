@@ -0,0 +1,171 @@
+# std
+import json, time, bisect, typing, threading
+# interno
+from bot.sistema import Caminho
+
+LIMITES_HISTOGRAMA: tuple[float, ...] = tuple(0.001 * 2 ** i for i in range(25))
+"""Limites superiores, em segundos, dos buckets do histograma
+- Crescimento exponencial de `1 milissegundo` até `~4.6 horas`"""
+
+class Histograma:
+    """Histograma de latências com buckets fixos em `LIMITES_HISTOGRAMA`
+    - Memória constante independente da quantidade de registros
+    - Percentis estimados pelo limite superior do bucket, restrito ao `minimo` e `maximo`"""
+
+    def __init__ (self) -> None:
+        self.quantidade = 0
+        self.soma = 0.0
+        self.minimo = float("inf")
+        self.maximo = 0.0
+        self.buckets = [0] * (len(LIMITES_HISTOGRAMA) + 1)
+
+    def __repr__ (self) -> str:
+        return f"<Histograma quantidade={self.quantidade}>"
+
+    def registrar (self, segundos: float) -> None:
+        """Registrar uma medição em `segundos`"""
+        self.quantidade += 1
+        self.soma += segundos
+        self.minimo = min(self.minimo, segundos)
+        self.maximo = max(self.maximo, segundos)
+        self.buckets[bisect.bisect_left(LIMITES_HISTOGRAMA, segundos)] += 1
+
+    def percentil (self, p: float) -> float:
+        """Estimar o percentil `p` entre 0.0 e 1.0"""
+        if not self.quantidade: return 0.0
+        alvo, acumulado = p * self.quantidade, 0
+        for indice, quantidade in enumerate(self.buckets):
+            acumulado += quantidade
+            if acumulado >= alvo and quantidade:
+                limite = LIMITES_HISTOGRAMA[indice] if indice < len(LIMITES_HISTOGRAMA) else self.maximo
+                return max(self.minimo, min(limite, self.maximo))
+        return self.maximo
+
+    def resumo (self) -> dict[str, float]:
+        """Resumo do histograma com `quantidade, soma, minimo, maximo, p50, p95, p99`"""
+        return {
+            "quantidade": self.quantidade,
+            "soma": round(self.soma, 6),
+            "minimo": round(self.minimo if self.quantidade else 0.0, 6),
+            "maximo": round(self.maximo, 6),
+            "p50": round(self.percentil(0.50), 6),
+            "p95": round(self.percentil(0.95), 6),
+            "p99": round(self.percentil(0.99), 6),
+        }
+
+class MetricasSpan:
+    """Agregador em memória das latências por nome do span
+    - Thread-safe
+    - Utilizado pelo `TracerLogger.span()` automaticamente"""
+
+    def __init__ (self) -> None:
+        self.inicio = time.time_ns()
+        self.lock = threading.Lock()
+        self.histogramas = dict[str, Histograma]()
+
+    def __repr__ (self) -> str:
+        return f"<MetricasSpan com {len(self.histogramas)} span(s)>"
+
+    def registrar (self, nome: str, segundos: float) -> None:
+        """Registrar a duração em `segundos` do span `nome`"""
+        with self.lock:
+            histograma = self.histogramas.get(nome) or self.histogramas.setdefault(nome, Histograma())
+            histograma.registrar(segundos)
+
+    def resumo (self) -> dict[str, dict[str, float]]:
+        """Resumo de cada span `{ nome: { quantidade, soma, minimo, maximo, p50, p95, p99 } }`"""
+        with self.lock:
+            return { nome: histograma.resumo() for nome, histograma in self.histogramas.items() }
+
+    def to_jsonl (self, servico: str) -> str:
+        """Representação com uma linha `json` por span"""
+        timestamp = time.strftime(r"%Y-%m-%dT%H:%M:%S")
+        return "".join(
+            json.dumps({ "timestamp": timestamp, "service": servico, "span": nome, **resumo }, ensure_ascii=False) + "\n"
+            for nome, resumo in self.resumo().items()
+        )
+
+    def to_otlp (self, servico: str) -> str:
+        """Representação em uma linha no formato `OTLP/JSON` com um histograma cumulativo por span
+        - Consumível pelo receiver `otlpjsonfile` do OpenTelemetry Collector"""
+        agora = str(time.time_ns())
+        with self.lock:
+            pontos = [
+                {
+                    "attributes": [{ "key": "span.name", "value": { "stringValue": nome } }],
+                    "startTimeUnixNano": str(self.inicio),
+                    "timeUnixNano": agora,
+                    "count": str(histograma.quantidade),
+                    "sum": histograma.soma,
+                    "min": histograma.minimo,
+                    "max": histograma.maximo,
+                    "bucketCounts": [str(quantidade) for quantidade in histograma.buckets],
+                    "explicitBounds": list(LIMITES_HISTOGRAMA),
+                }
+                for nome, histograma in self.histogramas.items()
+            ]
+        if not pontos: return ""
+
+        return json.dumps({ "resourceMetrics": [{
+            "resource": { "attributes": [{ "key": "service.name", "value": { "stringValue": servico } }] },
+            "scopeMetrics": [{
+                "scope": { "name": "bot.logger" },
+                "metrics": [{
+                    "name": "span.duration",
+                    "unit": "s",
+                    "histogram": { "aggregationTemporality": 2, "dataPoints": pontos },
+                }],
+            }],
+        }]}, ensure_ascii=False) + "\n"
+
+class ExportadorMetricas:
+    """Exportar periodicamente as `metricas` para o arquivo no `caminho` em uma thread separada
+    - `formato` `jsonl` resumo com percentis por span ou `otlp` histogramas no formato `OTLP/JSON`
+    - Realizado uma última exportação ao `encerrar()`"""
+
+    def __init__ (self, metricas: MetricasSpan,
+                        caminho: Caminho,
+                        servico: str,
+                        formato: typing.Literal["jsonl", "otlp"] = "jsonl",
+                        segundos: float = 60.0) -> None:
+        assert formato in ("jsonl", "otlp"), f"Formato de exportação das métricas '{formato}' inválido"
+        self.metricas, self.caminho, self.servico = metricas, caminho, servico
+        self.formato, self.segundos = formato, max(1.0, segundos)
+        self.__encerrado = threading.Event()
+        self.__thread = threading.Thread(target=self.__exportar_periodico, name="bot-logger-metricas", daemon=True)
+
+    def __repr__ (self) -> str:
+        return f"<ExportadorMetricas '{self.caminho.string}' formato='{self.formato}'>"
+
+    def __exportar_periodico (self) -> None:
+        while not self.__encerrado.wait(self.segundos):
+            try: self.exportar()
+            except Exception: pass
+
+    def iniciar (self) -> typing.Self:
+        """Iniciar a thread de exportação periódica"""
+        self.__thread.start()
+        return self
+
+    def exportar (self) -> None:
+        """Adicionar o estado atual das métricas no arquivo"""
+        conteudo = self.metricas.to_otlp(self.servico) if self.formato == "otlp" else self.metricas.to_jsonl(self.servico)
+        if not conteudo: return
+        with open(self.caminho.path, "a", encoding="utf-8") as arquivo:
+            arquivo.write(conteudo)
+
+    def encerrar (self) -> None:
+        """Encerrar a thread e realizar a última exportação"""
+        if self.__encerrado.is_set(): return
+        self.__encerrado.set()
+        self.exportar()
+
+METRICAS = MetricasSpan()
+"""Agregador das latências dos spans do processo"""
+
+__all__ = [
+    "METRICAS",
+    "Histograma",
+    "MetricasSpan",
+    "ExportadorMetricas",
+]
@@ -0,0 +1,164 @@
+# std
+import os, gzip, time, shutil, typing, logging, threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime as Datetime
+# interno
+from bot.sistema import Caminho
+from bot.tempo import TIMEZONE_BRT
+
+SUFIXOS_COMPRESSAO = {
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
+
+def comprimir_arquivo (caminho: Caminho, compressao: typing.Literal["gzip", "zstd"]) -> Caminho:
+    """Comprimir o arquivo do `caminho` e apagar o original
+    - Escrito em um arquivo `.tmp` e renomeado ao final para não existir segmento parcial
+    - Retornado o caminho do arquivo comprimido"""
+    destino = Caminho(f"{caminho.string}{SUFIXOS_COMPRESSAO[compressao]}")
+    temporario = Caminho(f"{destino.string}.tmp")
+
+    with open(caminho.path, "rb") as origem, open(temporario.path, "wb") as saida:
+        if compressao == "zstd":
+            import zstandard # type: ignore
+            zstandard.ZstdCompressor().copy_stream(origem, saida)
+        else:
+            with gzip.GzipFile(caminho.nome, "wb", fileobj=saida) as gz:
+                shutil.copyfileobj(origem, gz, 1024 * 1024)
+
+    os.replace(temporario.path, destino.path)
+    caminho.apagar_arquivo()
+    return destino
+
+class PersistenciaHandler (logging.Handler):
+    """Handler para os arquivos de log do diretório de persistência
+    - `bytes_buffer` tamanho acumulado em memória antes de escrever no arquivo
+    - `segundos_flush` intervalo máximo para os logs no buffer serem escritos
+    - Logs `ERROR` ou superior são escritos imediatamente
+    - `bytes_rotacao` e `segundos_rotacao` iniciam um novo segmento ao ultrapassar o limite. `0` para desativar
+    - `compressao` dos segmentos rotacionados, realizada em uma thread separada. `""` para desativar
+        - `zstd` necessário o pacote `zstandard`"""
+
+    caminho: Caminho
+    """Caminho do segmento atual"""
+
+    def __init__ (self, diretorio: Caminho,
+                        formato_nome: str,
+                        nome_inicial: str | None = None,
+                        bytes_buffer: int = 64 * 1024,
+                        segundos_flush: float = 1.0,
+                        bytes_rotacao: int = 0,
+                        segundos_rotacao: float = 0,
+                        compressao: typing.Literal["", "gzip", "zstd"] = "gzip") -> None:
+        super().__init__()
+        assert compressao in ("", *SUFIXOS_COMPRESSAO), f"Compressão dos logs '{compressao}' inválida"
+        if compressao == "zstd":
+            try: import zstandard # type: ignore
+            except ImportError: raise ImportError(
+                "Pacote 'zstandard' necessário para a compressão 'zstd' dos logs. "
+                "Instale o 'zstandard' ou utilize a compressão 'gzip'"
+            )
+
+        self.diretorio = diretorio.criar_diretorios()
+        self.formato_nome = formato_nome
+        self.bytes_buffer = max(0, bytes_buffer)
+        self.bytes_rotacao = max(0, bytes_rotacao)
+        self.segundos_rotacao = max(0, segundos_rotacao)
+        self.compressao = compressao
+
+        self.__buffer = list[bytes]()
+        self.__bytes_pendentes = 0
+        self.__compressor = ThreadPoolExecutor(1, "bot-logger-compressao") if compressao else None
+        self.__abrir_segmento(nome_inicial)
+
+        self.__encerrado = threading.Event()
+        self.__flusher = threading.Thread(
+            target = self.__flush_periodico,
+            args = (max(0.05, segundos_flush),),
+            name = "bot-logger-flush",
+            daemon = True
+        )
+        self.__flusher.start()
+
+    def __repr__ (self) -> str:
+        return f"<PersistenciaHandler '{self.caminho.string}'>"
+
+    def __abrir_segmento (self, nome: str | None = None) -> None:
+        """Abrir um novo segmento no diretório com um nome ainda não utilizado"""
+        nome = nome or Datetime.now(TIMEZONE_BRT).strftime(self.formato_nome)
+        caminho, (prefixo, _, sufixo) = self.diretorio / nome, nome.partition(".")
+
+        contador = 0
+        while any(Caminho(f"{caminho.string}{s}").existe() for s in ("", *SUFIXOS_COMPRESSAO.values())):
+            contador += 1
+            caminho = self.diretorio / f"{prefixo}.{contador}.{sufixo}"
+
+        self.caminho = caminho
+        self.__arquivo = open(caminho.path, "ab", buffering=0)
+        self.__bytes_segmento = 0
+        self.__inicio_segmento = time.monotonic()
+
+    def __escrever (self) -> None:
+        """Escrever o buffer no segmento atual com apenas uma chamada de escrita"""
+        if not self.__buffer: return
+        dados = b"".join(self.__buffer)
+        self.__buffer.clear()
+        self.__bytes_pendentes = 0
+        self.__arquivo.write(dados)
+        self.__bytes_segmento += len(dados)
+
+    def __rotacionar_necessario (self, tamanho: int) -> bool:
+        tamanho_segmento = self.__bytes_segmento + self.__bytes_pendentes
+        if not tamanho_segmento: return False
+        return (
+            bool(self.bytes_rotacao) and tamanho_segmento + tamanho > self.bytes_rotacao
+            or bool(self.segundos_rotacao) and time.monotonic() - self.__inicio_segmento >= self.segundos_rotacao
+        )
+
+    def __rotacionar (self) -> None:
+        """Fechar o segmento atual, abrir um novo e comprimir o anterior em segundo plano"""
+        self.__escrever()
+        self.__arquivo.close()
+        anterior = self.caminho
+        self.__abrir_segmento()
+        if self.__compressor and self.compressao:
+            self.__compressor.submit(comprimir_arquivo, anterior, self.compressao)
+
+    def __flush_periodico (self, segundos: float) -> None:
+        while not self.__encerrado.wait(segundos):
+            try: self.flush()
+            except Exception: pass
+
+    @typing.override
+    def emit (self, record: logging.LogRecord) -> None:
+        try:
+            dados = f"{self.format(record)}\n".encode("utf-8")
+            with self.lock:
+                if self.__rotacionar_necessario(len(dados)):
+                    self.__rotacionar()
+                self.__buffer.append(dados)
+                self.__bytes_pendentes += len(dados)
+                if self.__bytes_pendentes >= self.bytes_buffer or record.levelno >= logging.ERROR:
+                    self.__escrever()
+        except Exception:
+            self.handleError(record)
+
+    @typing.override
+    def flush (self) -> None:
+        with self.lock:
+            if not self.__arquivo.closed:
+                self.__escrever()
+
+    @typing.override
+    def close (self) -> None:
+        """Escrever o buffer, fechar o segmento e aguardar as compressões pendentes"""
+        self.__encerrado.set()
+        with self.lock:
+            if not self.__arquivo.closed:
+                self.__escrever()
+                self.__arquivo.close()
+        if self.__compressor:
+            self.__compressor.shutdown(wait=True)
+        super().close()
+
+__all__ = ["PersistenciaHandler"]
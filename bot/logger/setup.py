@@ -1,29 +1,59 @@
 # std
-import sys, uuid, atexit, typing, logging, functools
+import os, sys, copy, json, uuid, queue, atexit, typing, logging, threading, functools, collections
+import logging.handlers
 from datetime import datetime as Datetime, timedelta as Timedelta
 # interno
 import bot
 from bot.sistema import Caminho
 from bot.tempo import TIMEZONE_BRT
 from bot.tipagem import SupportsStr
+from bot.logger.metricas import METRICAS, ExportadorMetricas
+from bot.logger.limitador import LIMITADOR
+from bot.logger.persistencia import PersistenciaHandler
 
 P = typing.ParamSpec("P")
 
 class JsonFormatter (logging.Formatter):
-    """Formato JSON Lines"""
+    """Formato JSON Lines
+    - Encoder pré-construído com o mesmo resultado do `bot.formatos.Json.stringify()`
+    - Cache do `timestamp` por segundo e do `file` por localização no código"""
+
+    ENCODER = json.JSONEncoder(ensure_ascii=False, default=bot.formatos.Json.serializar_objeto)
 
     def __init__ (self, identificador: str, diretorio_execucao: str, *, adicionar_file=True) -> None:
         super().__init__()
         self.identificador = identificador
         self.diretorio_execucao = diretorio_execucao
         self.adicionar_file = adicionar_file
+        self.__timestamp: tuple[int, str] = (-1, "")
+        self.__files = dict[tuple[str, str, int], str]()
+
+    def __timestamp_formatado (self, created: float) -> str:
+        """Obter o `timestamp` formatado, reaproveitando caso seja o mesmo segundo"""
+        segundo, texto = self.__timestamp
+        if segundo != (atual := int(created)):
+            texto = Datetime.fromtimestamp(atual, TIMEZONE_BRT).strftime(MainLogger.FORMATO_DATA_LOG)
+            self.__timestamp = (atual, texto)
+        return texto
+
+    def __file_serializado (self, record: logging.LogRecord) -> str:
+        """Obter a propriedade `file` já serializada para a localização do `record`"""
+        chave = (record.pathname, record.funcName, record.lineno)
+        if (file := self.__files.get(chave)) is None:
+            file = self.__files[chave] = self.ENCODER.encode({
+                "path": (record.pathname.removeprefix(self.diretorio_execucao)
+                                        .lstrip("\\")
+                                        .replace("\\", "/")),
+                "function": record.funcName,
+                "line": record.lineno,
+            })
+        return file
 
     @typing.override
     def format (self, record: logging.LogRecord) -> str:
         payload: dict[str, SupportsStr] = {
             "id": self.identificador,
-            "timestamp": Datetime.fromtimestamp(record.created, TIMEZONE_BRT)\
-                                 .strftime(MainLogger.FORMATO_DATA_LOG),
+            "timestamp": self.__timestamp_formatado(record.created),
             "name": record.name,
             "level": record.levelname,
             "message": record.getMessage(),
@@ -44,20 +74,13 @@ class JsonFormatter (logging.Formatter):
                 }
         except Exception: pass
 
+        texto = self.ENCODER.encode(payload)
         # Informações sobre Arquivo
+        # Última propriedade do objeto, adicionada já serializada
         if self.adicionar_file:
-            payload["file"] = {
-                "path": (record.pathname.removeprefix(self.diretorio_execucao)
-                                        .lstrip("\\")
-                                        .replace("\\", "/")),
-                "function": record.funcName,
-                "line": record.lineno,
-            }
+            texto = f"{texto[:-1]}, \"file\": {self.__file_serializado(record)}}}"
 
-        return (
-            bot.formatos.Json(payload)
-            .stringify(indentar=False)
-        )
+        return texto
 
 class StdoutFilter (logging.Filter):
     """Permitir apenas logs `INFO` para os `MainLogger` e `WARNING` para loggers terceiros"""
@@ -77,9 +100,96 @@ class FileFilter (logging.Filter):
             return True
         return record.levelno >= logging.INFO
 
+class FilaHandler (logging.handlers.QueueHandler):
+    """Handler que apenas enfileira os registros para o `QueueListener`
+    - Formatação e escrita realizadas pela thread do listener
+    - `politica` define o comportamento caso a fila esteja cheia
+        - `bloquear` aguarda espaço na fila
+        - `descartar_debug` descarta os logs `DEBUG` e aguarda espaço para os demais
+        - `contar_descartados` descarta qualquer log e contabiliza em `descartados`"""
+
+    def __init__ (self, fila: queue.Queue[logging.LogRecord],
+                        politica: typing.Literal["bloquear", "descartar_debug", "contar_descartados"]) -> None:
+        super().__init__(fila)
+        assert politica in ("bloquear", "descartar_debug", "contar_descartados"), f"Política da fila de log '{politica}' inválida"
+        self.politica = politica
+        self.descartados = 0
+
+    @typing.override
+    def prepare (self, record: logging.LogRecord) -> logging.LogRecord:
+        # Não formatar na thread chamadora, apenas resolver a mensagem
+        record = copy.copy(record)
+        record.msg, record.args = record.getMessage(), None
+        return record
+
+    @typing.override
+    def enqueue (self, record: logging.LogRecord) -> None:
+        fila = typing.cast(queue.Queue[logging.LogRecord], self.queue)
+        if self.politica == "bloquear":
+            return fila.put(record)
+
+        try: fila.put_nowait(record)
+        except queue.Full:
+            if self.politica == "descartar_debug" and record.levelno > logging.DEBUG:
+                return fila.put(record)
+            self.descartados += 1
+
+class SpanTracer:
+    """Span, obtido pelo `tracer.span(nome)`, para medir uma etapa do `TracerLogger`
+    - Utilizar com o `with` para o encerramento automático
+    - Spans abertos dentro de outro possuem o `parent_id` do span externo ou do tracer
+    - Logs do tracer enquanto o span estiver aberto possuem o `trace.span`
+    - Log de encerramento com o `trace.status` do tracer e o resultado no `trace.span.status`
+    - Duração registrada no agregador `bot.logger.metricas.METRICAS` pelo `nome`"""
+
+    def __init__ (self, tracer: "TracerLogger",
+                        nome: str,
+                        parent_id: str,
+                        extra: dict[str, object]) -> None:
+        self.nome = nome
+        self.extra = extra
+        self.tracer = tracer
+        self.parent_id = parent_id
+        self.id = uuid.uuid4().hex[:8]
+        self.cronometro = bot.tempo.Cronometro()
+
+    def __repr__ (self) -> str:
+        return f"<bot.SpanTracer id='{self.id}' nome='{self.nome}' parent_id='{self.parent_id}'>"
+
+    def __enter__ (self) -> typing.Self:
+        self.tracer.spans.append(self)
+        self.cronometro.resetar()
+        return self
+
+    def __exit__ (self, exc_type, exc: Exception | None, tb) -> None:
+        segundos = self.cronometro()
+        if self in self.tracer.spans:
+            self.tracer.spans.remove(self)
+        METRICAS.registrar(self.nome, segundos)
+
+        self.tracer.logger.log(
+            logging.DEBUG if exc is None else logging.WARNING,
+            f"Span '{self.nome}' encerrado {"com sucesso" if exc is None else "com erro"}",
+            stacklevel = 2,
+            exc_info = exc,
+            extra = {
+                "extra": self.extra | self.tracer.extra,
+                # Tracer ainda em execução, resultado do span apenas no `trace.span`
+                "trace": self.tracer.trace("PROCESSING") | {
+                    "span": self.to_dict() | { "seconds": segundos, "status": "SUCCESS" if exc is None else "ERROR" }
+                }
+            }
+        )
+
+    def to_dict (self) -> dict[str, str]:
+        """Identificação do span utilizada no `trace.span`"""
+        return { "id": self.id, "parent_id": self.parent_id, "name": self.nome }
+
 class TracerLogger:
     """Classe logger, obtida pelo `MainLogger`, para realizar o rastreamento de itens relacionados
-    - Utilizar o `tracer.encerrar()` para sinalizar a finalização do rastreamento"""
+    - Utilizar o `tracer.encerrar()` para sinalizar a finalização do rastreamento
+    - Utilizar o `with tracer.span(nome)` para medir etapas, podendo ser aninhados
+    - `suprimidos` contagem, por motivo, dos logs suprimidos pelo `LIMITADOR`"""
 
     def __init__ (self, logger: logging.Logger,
                         extra: dict[str, object]) -> None:
@@ -88,6 +198,8 @@ class TracerLogger:
         self.encerrado = False
         self.id = uuid.uuid4().hex[:8]
         self.cronometro = bot.tempo.Cronometro()
+        self.spans = list[SpanTracer]()
+        self.suprimidos = collections.Counter[str]()
 
     def __repr__ (self) -> str:
         return f"<bot.TracerLogger id='{self.id}' nome='{self.logger.name}'>"
@@ -99,17 +211,14 @@ class TracerLogger:
         if self.encerrado:
             return
         self.encerrado = True
+        self.__resumo_suprimidos()
 
         if exc is None: self.logger.info(
             "Tracer encerrado automaticamente com sucesso",
             stacklevel = 2,
             extra = {
                 "extra": self.extra | self.extra,
-                "trace": {
-                    "id": self.id,
-                    "status": "SUCCESS",
-                    "seconds": self.cronometro()
-                }
+                "trace": self.trace("SUCCESS")
             }
         )
 
@@ -119,11 +228,7 @@ class TracerLogger:
             exc_info = exc,
             extra = {
                 "extra": self.extra | self.extra,
-                "trace": {
-                    "id": self.id,
-                    "status": "ERROR",
-                    "seconds": self.cronometro()
-                }
+                "trace": self.trace("ERROR")
             }
         )
 
@@ -134,45 +239,74 @@ class TracerLogger:
             "Tracer não encerrado corretamente",
             exc_info = sys.exc_info(),
             extra = self.extra | {
-                "trace": {
-                    "id": self.id,
-                    "status": "WARNING",
-                    "seconds": self.cronometro()
-                }
+                "trace": self.trace("WARNING")
+            }
+        )
+
+    def __resumo_suprimidos (self) -> None:
+        """Descarregar os repetidos do tracer no `LIMITADOR` e loggar os suprimidos do tracer"""
+        if not LIMITADOR.ativo: return
+        LIMITADOR.descarregar(self.id, stacklevel=3)
+        if self.suprimidos: self.logger.info(
+            f"Foram suprimidos {self.suprimidos.total()} log(s) do tracer pelo limitador",
+            stacklevel = 3,
+            extra = {
+                "extra": { "suprimidos": dict(self.suprimidos) } | self.extra,
+                "trace": self.trace("PROCESSING")
             }
         )
 
+    def trace (self, status: str) -> dict[str, object]:
+        """Propriedade `trace` dos logs do tracer
+        - `span` adicionado caso algum span esteja aberto"""
+        trace: dict[str, object] = {
+            "id": self.id,
+            "status": status,
+            "seconds": self.cronometro()
+        }
+        if self.spans: trace["span"] = self.spans[-1].to_dict()
+        return trace
+
+    def span (self, nome: str, **extra: object) -> SpanTracer:
+        """Criar um span para medir a etapa `nome` do tracer
+        - Utilizar com o `with tracer.span("login"): ...`
+        - `parent_id` é o id do span aberto mais interno ou do próprio tracer"""
+        parent_id = self.spans[-1].id if self.spans else self.id
+        return SpanTracer(self, nome, parent_id, extra)
+
     def debug (self, mensagem: SupportsStr,
                      **extra: object) -> typing.Self:
-        """Log nível `DEBUG`"""
+        """Log nível `DEBUG`
+        - Sujeito ao `LIMITADOR` caso configurado"""
+        mensagem = str(mensagem)
+        argumentos = {
+            "extra": extra | self.extra,
+            "trace": self.trace("PROCESSING")
+        }
+        if not LIMITADOR.permitir(self.logger, logging.DEBUG, mensagem, argumentos, self.suprimidos, self.id):
+            return self
         self.logger.debug(
-            str(mensagem),
+            mensagem,
             stacklevel = 2,
-            extra = {
-                "extra": extra | self.extra,
-                "trace": {
-                    "id": self.id,
-                    "status": "PROCESSING",
-                    "seconds": self.cronometro()
-                }
-            }
+            extra = argumentos
         )
         return self
 
     def informar (self, mensagem: SupportsStr,
                         **extra: object) -> typing.Self:
-        """Log nível `INFO`"""
+        """Log nível `INFO`
+        - Sujeito ao `LIMITADOR` caso configurado"""
+        mensagem = str(mensagem)
+        argumentos = {
+            "extra": extra | self.extra,
+            "trace": self.trace("PROCESSING")
+        }
+        if not LIMITADOR.permitir(self.logger, logging.INFO, mensagem, argumentos, self.suprimidos, self.id):
+            return self
         self.logger.info(
-            str(mensagem),
+            mensagem,
             stacklevel = 2,
-            extra = {
-                "extra": extra | self.extra,
-                "trace": {
-                    "id": self.id,
-                    "status": "PROCESSING",
-                    "seconds": self.cronometro()
-                }
-            }
+            extra = argumentos
         )
         return self
 
@@ -186,11 +320,7 @@ class TracerLogger:
             exc_info = erro if any(erro := sys.exc_info()) else None,
             extra = {
                 "extra": extra | self.extra,
-                "trace": {
-                    "id": self.id,
-                    "status": "PROCESSING",
-                    "seconds": self.cronometro()
-                }
+                "trace": self.trace("PROCESSING")
             }
         )
         return self
@@ -206,11 +336,7 @@ class TracerLogger:
             exc_info = excecao or sys.exc_info(),
             extra = {
                 "extra": extra | self.extra,
-                "trace": {
-                    "id": self.id,
-                    "status": "PROCESSING",
-                    "seconds": self.cronometro()
-                }
+                "trace": self.trace("PROCESSING")
             }
         )
         return self
@@ -223,6 +349,7 @@ class TracerLogger:
         - `excecao=None` capturada automaticamente, caso esteja dentro do `except`"""
         if self.encerrado: return
         self.encerrado = True
+        self.__resumo_suprimidos()
 
         log_func = {
             "SUCCESS": self.logger.info,
@@ -237,11 +364,7 @@ class TracerLogger:
             exc_info = excecao or (erro if any(erro := sys.exc_info()) else None),
             extra = {
                 "extra": extra | self.extra,
-                "trace": {
-                    "id": self.id,
-                    "status": status,
-                    "seconds": self.cronometro()
-                }
+                "trace": self.trace(status)
             }
         )
 
@@ -252,10 +375,19 @@ class MainLogger:
     #### Inicializar manualmente `logger.inicializar_logger()`
         - Stream para o `stdout`
         - Cria um LOG no diretório de execução para fácil acesso `CAMINHO_LOG_RAIZ`
-        - Salva um LOG no diretório de persistência `CAMINHO_LOG_PERSISTENCIA`
-        - Variáveis .ini `[logger] -> [dias_persistencia: 14, flag_debug: False]`"""
+        - Salva um LOG no diretório de persistência `CAMINHO_LOG_PERSISTENCIA`, com buffer, rotação e compressão dos segmentos
+        - Variáveis .ini `[logger] -> [dias_persistencia: 14, flag_debug: False]`
+        - Variáveis .ini da retenção `[logger] -> [quantidade_maxima_persistencia: 0, megabytes_maximo_persistencia: 0]`
+        - Variáveis .ini da persistência `[logger] -> [bytes_buffer_persistencia: 65536, segundos_flush_persistencia: 1.0, megabytes_rotacao_persistencia: 50, horas_rotacao_persistencia: 0, compressao_persistencia: gzip]`
+        - Variáveis .ini do modo assíncrono `[logger] -> [flag_assincrono: False, tamanho_fila: 10000, politica_fila: bloquear]`
+        - Variáveis .ini das métricas dos spans `[logger] -> [formato_metricas: jsonl | otlp, segundos_metricas: 60]` exportadas em `CAMINHO_METRICAS`
+        - Variáveis .ini do limitador dos logs `DEBUG` e `INFO` por local de chamada `[logger] -> [logs_por_segundo: 0, amostragem_logs: 1.0, flag_agrupar_repetidos: False]`"""
 
     NOMES_MAIN_LOGGERS = set[str]()
+    LISTENER: logging.handlers.QueueListener | None = None
+    """Listener da fila de logs caso inicializado no modo assíncrono"""
+    EXPORTADOR_METRICAS: ExportadorMetricas | None = None
+    """Exportador das métricas dos spans caso configurado o `formato_metricas`"""
     IDENTIFICADOR_LOGGER = uuid.uuid4().hex[:8]
     INICIALIZACAO_PACOTE = Datetime.now(TIMEZONE_BRT)
 
@@ -263,6 +395,7 @@ class MainLogger:
     FORMATO_NOME_LOG_PERSISTENCIA: str = r"%Y-%m-%dT%H-%M-%S.jsonl"
 
     CAMINHO_LOG_RAIZ = Caminho.diretorio_execucao() / "log.jsonl"
+    CAMINHO_METRICAS = Caminho.diretorio_execucao() / "metricas.jsonl"
     CAMINHO_DIRETORIO_PERSISTENCIA = Caminho.diretorio_execucao() / "logs"
     CAMINHO_LOG_PERSISTENCIA = Caminho(
         CAMINHO_DIRETORIO_PERSISTENCIA.string,
@@ -286,13 +419,17 @@ class MainLogger:
         """Instância nomeada do `Logger`"""
         return logging.getLogger(self.__nome)
 
-    def inicializar_logger (self) -> typing.Self:
+    def inicializar_logger (self, assincrono: bool | None = None) -> typing.Self:
         """Inicializar o logger pelo `ROOT` para capturar todas as mensagens
         - Formatação JSONL
         - Handlers no `stdout` e `arquivos`
-        - Registra a limpeza do diretório de persistência"""
-        atexit.register(self.__limpeza_diretorio_persistencia)
+        - Realiza a limpeza do diretório de persistência em uma thread separada
+        - `assincrono` para formatar e escrever os logs em uma thread separada via `QueueListener`
+            - `None` para utilizar a variável .ini `[logger] -> flag_assincrono`
+            - Fila limitada em `tamanho_fila` com a `politica_fila` caso esteja cheia `bloquear | descartar_debug | contar_descartados`
+            - Logs pendentes na fila são escritos ao fim do Python automaticamente"""
         self.CAMINHO_LOG_PERSISTENCIA.parente.criar_diretorios()
+        MainLogger.__encerrar_listener()
 
         # Root Handler
         root = self.logger.root
@@ -302,17 +439,34 @@ class MainLogger:
         for handler in root.handlers:
             root.removeHandler(handler.close() or handler)
 
-        # Adicionar File Handlers
+        threading.Thread(
+            target = self.__limpeza_diretorio_persistencia,
+            name = "bot-logger-limpeza",
+            daemon = True
+        ).start()
+
+        # File Handlers
+        handlers = list[logging.Handler]()
+        persistencia = PersistenciaHandler(
+            self.CAMINHO_DIRETORIO_PERSISTENCIA,
+            self.FORMATO_NOME_LOG_PERSISTENCIA,
+            self.CAMINHO_LOG_PERSISTENCIA.nome,
+            bytes_buffer = bot.configfile.obter_opcao_ou("logger", "bytes_buffer_persistencia", 64 * 1024),
+            segundos_flush = bot.configfile.obter_opcao_ou("logger", "segundos_flush_persistencia", 1.0),
+            bytes_rotacao = bot.configfile.obter_opcao_ou("logger", "megabytes_rotacao_persistencia", 50) * 1024 ** 2,
+            segundos_rotacao = bot.configfile.obter_opcao_ou("logger", "horas_rotacao_persistencia", 0.0) * 3600,
+            compressao = bot.configfile.obter_opcao_ou("logger", "compressao_persistencia", "gzip"), # type: ignore
+        )
         for handler in (logging.FileHandler(self.CAMINHO_LOG_RAIZ.path, "w", "utf-8"),
-                        logging.FileHandler(self.CAMINHO_LOG_PERSISTENCIA.path, "w", "utf-8")):
+                        persistencia):
             handler.addFilter(FileFilter(self.__nome))
             handler.setFormatter(
                 JsonFormatter(self.IDENTIFICADOR_LOGGER,
                               self.CAMINHO_LOG_RAIZ.parente.string)
             )
-            root.addHandler(handler)
+            handlers.append(handler)
 
-        # Adicionar STDOUT Handler
+        # STDOUT Handler
         handler = logging.StreamHandler(sys.stdout)
         handler.addFilter(StdoutFilter(self.__nome))
         handler.setFormatter(
@@ -320,41 +474,136 @@ class MainLogger:
                           self.CAMINHO_LOG_RAIZ.parente.string,
                           adicionar_file=False)
         )
-        root.addHandler(handler)
+        handlers.append(handler)
+
+        # Exportação das métricas dos spans
+        if MainLogger.EXPORTADOR_METRICAS: MainLogger.EXPORTADOR_METRICAS.encerrar()
+        if formato := bot.configfile.obter_opcao_ou("logger", "formato_metricas", ""):
+            MainLogger.EXPORTADOR_METRICAS = ExportadorMetricas(
+                METRICAS,
+                self.CAMINHO_METRICAS,
+                self.__nome,
+                formato, # type: ignore
+                bot.configfile.obter_opcao_ou("logger", "segundos_metricas", 60.0)
+            ).iniciar()
+            atexit.register(MainLogger.EXPORTADOR_METRICAS.encerrar)
+
+        # Limitador dos logs em loops
+        # Resumo ao fim do Python registrado antes do listener para ser escrito de forma síncrona
+        LIMITADOR.configurar(
+            bot.configfile.obter_opcao_ou("logger", "logs_por_segundo", 0.0),
+            bot.configfile.obter_opcao_ou("logger", "amostragem_logs", 1.0),
+            bot.configfile.obter_opcao_ou("logger", "flag_agrupar_repetidos", False),
+        )
+        atexit.unregister(LIMITADOR.encerrar)
+        if LIMITADOR.ativo: atexit.register(LIMITADOR.encerrar, self.logger)
+
+        if assincrono is None:
+            assincrono = bot.configfile.obter_opcao_ou("logger", "flag_assincrono", False)
+        if not assincrono:
+            for handler in handlers: root.addHandler(handler)
+            return self
+
+        # Modo assíncrono
+        # Root possui apenas o `FilaHandler` e o `QueueListener` repassa para os handlers
+        tamanho = bot.configfile.obter_opcao_ou("logger", "tamanho_fila", 10_000)
+        politica = bot.configfile.obter_opcao_ou("logger", "politica_fila", "bloquear")
+        fila = queue.Queue[logging.LogRecord](max(0, tamanho))
+        root.addHandler(FilaHandler(fila, politica)) # type: ignore
+        MainLogger.LISTENER = logging.handlers.QueueListener(fila, *handlers, respect_handler_level=True)
+        MainLogger.LISTENER.start()
+        atexit.register(MainLogger.__encerrar_listener)
 
         return self
 
+    @staticmethod
+    def __encerrar_listener () -> None:
+        """Encerrar o `LISTENER`, caso exista, escrevendo os logs pendentes na fila
+        - Handlers do listener retornam ao `ROOT` para os logs seguintes serem síncronos
+        - Registrado para executar ao fim do Python automaticamente"""
+        listener, MainLogger.LISTENER = MainLogger.LISTENER, None
+        if listener is None: return
+        listener.stop()
+
+        root, descartados = logging.root, 0
+        for handler in [h for h in root.handlers if isinstance(h, FilaHandler)]:
+            descartados += handler.descartados
+            root.removeHandler(handler)
+        for handler in listener.handlers:
+            root.addHandler(handler)
+
+        if descartados: bot.logger.alertar(
+            f"Foram descartados {descartados} log(s) devido a fila de logs cheia",
+            descartados = descartados
+        )
+
     def __limpeza_diretorio_persistencia (self) -> None:
-        """Limpar os logs no `CAMINHO_DIRETORIO_PERSISTENCIA` que ultrapassaram a data limite
-        - Registrado para executar ao fim do Python automaticamente
-        - `Default:` 14 dias"""
-        dias = bot.configfile.obter_opcao_ou("logger", "dias_persistencia", 14)
-        limite = Timedelta(days=dias)
-
-        for caminho in self.CAMINHO_DIRETORIO_PERSISTENCIA:
-            if not caminho.arquivo(): continue
-            data = Datetime.strptime(caminho.nome, self.FORMATO_NOME_LOG_PERSISTENCIA)\
-                           .astimezone(TIMEZONE_BRT)
-            if self.INICIALIZACAO_PACOTE - data < limite: break
-            caminho.apagar_arquivo()
+        """Limpar os logs no `CAMINHO_DIRETORIO_PERSISTENCIA` conforme as políticas de retenção
+        - Executado em uma thread separada ao inicializar o logger
+        - Considera os segmentos rotacionados `.1.jsonl` e comprimidos `.jsonl.gz` `.jsonl.zst`
+        - Arquivos apagados do mais antigo para o mais recente, sem afetar os da execução atual
+        - `dias_persistencia` idade máxima dos logs. `Default:` 14 dias
+        - `quantidade_maxima_persistencia` quantidade máxima de arquivos. `Default:` 0 sem limite
+        - `megabytes_maximo_persistencia` tamanho total máximo dos arquivos. `Default:` 0 sem limite"""
+        limite = Timedelta(days=bot.configfile.obter_opcao_ou("logger", "dias_persistencia", 14))
+        quantidade_maxima = bot.configfile.obter_opcao_ou("logger", "quantidade_maxima_persistencia", 0)
+        bytes_maximo = bot.configfile.obter_opcao_ou("logger", "megabytes_maximo_persistencia", 0) * 1024 ** 2
+        formato_data, *_ = self.FORMATO_NOME_LOG_PERSISTENCIA.partition(".")
+        inicializacao = self.INICIALIZACAO_PACOTE.replace(microsecond=0)
+
+        # (data, nome, tamanho, caminho) ordenado do mais antigo
+        arquivos = list[tuple[Datetime, str, int, str]]()
+        try:
+            with os.scandir(self.CAMINHO_DIRETORIO_PERSISTENCIA.path) as entradas:
+                for entrada in entradas:
+                    try:
+                        if not entrada.is_file(): continue
+                        data = Datetime.strptime(entrada.name.partition(".")[0], formato_data)\
+                                       .astimezone(TIMEZONE_BRT)
+                        arquivos.append((data, entrada.name, entrada.stat().st_size, entrada.path))
+                    except (ValueError, OSError): continue
+        except OSError: return
+        arquivos.sort()
+
+        quantidade, total_bytes = len(arquivos), sum(tamanho for _, _, tamanho, _ in arquivos)
+        for data, _, tamanho, caminho in arquivos:
+            if data >= inicializacao: break
+            expirado = inicializacao - data >= limite
+            excedente = (bool(quantidade_maxima) and quantidade > quantidade_maxima
+                         or bool(bytes_maximo) and total_bytes > bytes_maximo)
+            if not expirado and not excedente: break
+
+            try: os.remove(caminho)
+            except OSError: continue
+            quantidade, total_bytes = quantidade - 1, total_bytes - tamanho
 
     def debug (self, mensagem: SupportsStr,
                      **extra: object) -> typing.Self:
-        """Log nível `DEBUG`"""
+        """Log nível `DEBUG`
+        - Sujeito ao `LIMITADOR` caso configurado"""
+        mensagem = str(mensagem)
+        argumentos = { "extra": extra }
+        if not LIMITADOR.permitir(self.logger, logging.DEBUG, mensagem, argumentos):
+            return self
         self.logger.debug(
-            str(mensagem),
+            mensagem,
             stacklevel = 2,
-            extra = { "extra": extra }
+            extra = argumentos
         )
         return self
 
     def informar (self, mensagem: SupportsStr,
                         **extra: object) -> typing.Self:
-        """Log nível `INFO`"""
+        """Log nível `INFO`
+        - Sujeito ao `LIMITADOR` caso configurado"""
+        mensagem = str(mensagem)
+        argumentos = { "extra": extra }
+        if not LIMITADOR.permitir(self.logger, logging.INFO, mensagem, argumentos):
+            return self
         self.logger.info(
-            str(mensagem),
+            mensagem,
             stacklevel = 2,
-            extra = { "extra": extra }
+            extra = argumentos
         )
         return self
 
@@ -386,8 +635,9 @@ class MainLogger:
     def limpar_log_raiz (self) -> typing.Self:
         """Limpar o `CAMINHO_LOG_RAIZ`
         - Não afeta o `CAMINHO_DIRETORIO_PERSISTENCIA`"""
-        root = self.logger.root
-        if not root.handlers or not isinstance(root.handlers[0].formatter, JsonFormatter):
+        listener = MainLogger.LISTENER
+        handlers = list(listener.handlers if listener else self.logger.root.handlers)
+        if not handlers or not isinstance(handlers[0].formatter, JsonFormatter):
             return self
 
         handler = logging.FileHandler(self.CAMINHO_LOG_RAIZ.path, "w", "utf-8")
@@ -397,8 +647,10 @@ class MainLogger:
                           self.CAMINHO_LOG_RAIZ.parente.string)
         )
 
-        root.handlers[0].close()
-        root.handlers[0] = handler
+        antigo, handlers[0] = handlers[0], handler
+        if listener: listener.handlers = tuple(handlers)
+        else: self.logger.root.handlers[0] = handler
+        antigo.close()
 
         return self
 
@@ -431,7 +683,12 @@ Utilizar `logger.obter_logger(nome)` ou importar o `MainLogger(nome)` para criar
 #### Inicializar manualmente `logger.inicializar_logger()`
     - Stream para o `stdout`
     - Cria um LOG no diretório de execução para fácil acesso `CAMINHO_LOG_RAIZ`
-    - Salva um LOG no diretório de persistência `CAMINHO_LOG_PERSISTENCIA`
-    - Variáveis .ini `[logger] -> [dias_persistencia: 14, flag_debug: False]`"""
-
-__all__ = ["logger", "MainLogger", "TracerLogger"]
\ No newline at end of file
+    - Salva um LOG no diretório de persistência `CAMINHO_LOG_PERSISTENCIA`, com buffer, rotação e compressão dos segmentos
+    - Variáveis .ini `[logger] -> [dias_persistencia: 14, flag_debug: False]`
+    - Variáveis .ini da retenção `[logger] -> [quantidade_maxima_persistencia: 0, megabytes_maximo_persistencia: 0]`
+    - Variáveis .ini da persistência `[logger] -> [bytes_buffer_persistencia: 65536, segundos_flush_persistencia: 1.0, megabytes_rotacao_persistencia: 50, horas_rotacao_persistencia: 0, compressao_persistencia: gzip]`
+    - Variáveis .ini do modo assíncrono `[logger] -> [flag_assincrono: False, tamanho_fila: 10000, politica_fila: bloquear]`
+    - Variáveis .ini das métricas dos spans `[logger] -> [formato_metricas: jsonl | otlp, segundos_metricas: 60]` exportadas em `CAMINHO_METRICAS`
+    - Variáveis .ini do limitador dos logs `DEBUG` e `INFO` por local de chamada `[logger] -> [logs_por_segundo: 0, amostragem_logs: 1.0, flag_agrupar_repetidos: False]`"""
+
+__all__ = ["logger", "MainLogger", "TracerLogger", "SpanTracer"]
\ No newline at end of file
@@ -59,11 +59,10 @@ def esperar[T] (func: typing.Callable[[], T],
     while cronometro < timeout:
         try:
             valor = func()
-            if not comparador(valor): continue
-
-            resultado.ok = True
-            setattr(resultado, "_valor", valor)
-            break
+            if comparador(valor):
+                resultado.ok = True
+                setattr(resultado, "_valor", valor)
+                break
 
         except Exception: pass
         time.sleep(delay)